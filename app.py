@@ -17,7 +17,7 @@ from yes24.pipeline import run_search_reviews as yes24_search_reviews
 from yes24.pipeline import run_search_bookinfo as yes24_search_bookinfo
 from yes24.pipeline import run_category_bookinfo as yes24_category_bookinfo
 from yes24.get_reviews import get_reviews as yes24_get_reviews
-from yes24.get_books_info import get_book_info as yes24_get_book_info
+from yes24.get_books_info import get_book_infos as yes24_get_book_infos
 from yes24.search_products import search_products as yes24_search_products
 from yes24.utils import build_newly_published_url
 from yes24.get_goods_no import get_goods_no as yes24_get_goods_no
@@ -27,6 +27,9 @@ from kyobo.pipeline import run_search_reviews as kyobo_search_reviews
 from kyobo.product_search import get_goods_no as kyobo_get_goods_no
 from kyobo.review_scraper import get_kyobo_reviews
 
+# 서점 통합 크롤러 import
+from cross_store import run_cross_store_reviews
+
 # 공통 UI 유틸리티 import
 from common.ui_utils import (
     YES24_ORDER_OPTIONS,
@@ -58,7 +61,7 @@ st.markdown("---")
 # 사이드바 - 크롤러 선택
 crawler = st.pills(
     "메뉴 선택",
-    ["🏠 홈", "Yes24", "교보문고"],
+    ["🏠 홈", "Yes24", "교보문고", "통합 검색"],
     selection_mode="single",
     default="🏠 홈",
     label_visibility="collapsed"
@@ -250,23 +253,17 @@ if crawler == "Yes24":
                     if st.button("🚀 선택한 책 크롤링 시작", type="primary", key="yes24_bookinfo_manual_start"):
                         st.markdown("---")
 
-                        # 세부정보 크롤링
-                        all_books = []
-                        total = len(selected_goods)
-                        progress_bar = st.progress(0)
-                        status_text = st.empty()
-
-                        for idx, (title, goods_no) in enumerate(selected_goods.items(), 1):
-                            status_text.text(f"[{idx}/{total}] {title[:50]}... 세부정보 수집 중")
-                            try:
-                                book_info = yes24_get_book_info(goods_no)
-                                all_books.append(book_info)
-                            except Exception as e:
-                                st.warning(f"⚠️ '{title[:30]}...' 정보 수집 실패: {str(e)}")
-                            progress_bar.progress(idx / total)
+                        # 세부정보 크롤링 (동시 요청, 결과는 선택 순서대로)
+                        progress_bar, status_text, progress_callback = create_progress_callback()
+                        results = yes24_get_book_infos(selected_goods, progress_callback=progress_callback)
+                        cleanup_progress_ui(progress_bar, status_text)
 
-                        status_text.empty()
-                        progress_bar.empty()
+                        all_books = []
+                        for result in results:
+                            if result['info'] is not None:
+                                all_books.append(result['info'])
+                            else:
+                                st.warning(f"⚠️ '{result['title'][:30]}...' 정보 수집 실패: {str(result['error'])}")
 
                         render_crawl_results(all_books, "yes24_books_selected")
 
@@ -370,23 +367,17 @@ if crawler == "Yes24":
                             if st.button("🚀 선택한 책 크롤링 시작", type="primary", key="yes24_category_manual_start"):
                                 st.markdown("---")
 
-                                # 세부정보 크롤링
+                                # 세부정보 크롤링 (동시 요청, 결과는 선택 순서대로)
+                                progress_bar, status_text, progress_callback = create_progress_callback()
+                                results = yes24_get_book_infos(selected_goods, progress_callback=progress_callback)
+                                cleanup_progress_ui(progress_bar, status_text)
+
                                 all_books = []
-                                total = len(selected_goods)
-                                progress_bar = st.progress(0)
-                                status_text = st.empty()
-
-                                for idx, (title, goods_no) in enumerate(selected_goods.items(), 1):
-                                    status_text.text(f"[{idx}/{total}] {title[:50]}... 세부정보 수집 중")
-                                    try:
-                                        book_info = yes24_get_book_info(goods_no)
-                                        all_books.append(book_info)
-                                    except Exception as e:
-                                        st.warning(f"⚠️ '{title[:30]}...' 정보 수집 실패: {str(e)}")
-                                    progress_bar.progress(idx / total)
-
-                                status_text.empty()
-                                progress_bar.empty()
+                                for result in results:
+                                    if result['info'] is not None:
+                                        all_books.append(result['info'])
+                                    else:
+                                        st.warning(f"⚠️ '{result['title'][:30]}...' 정보 수집 실패: {str(result['error'])}")
 
                                 render_crawl_results(all_books, f"yes24_category_{selected_cat_id}_selected")
 
@@ -483,11 +474,68 @@ elif crawler == "교보문고":
                     all_reviews = crawl_selected_reviews(selected_goods, max_reviews, get_kyobo_reviews)
                     render_crawl_results(all_reviews, "kyobo_reviews_selected")
 
+# ==============================================================================
+# 서점 통합 크롤러
+# ==============================================================================
+elif crawler == "통합 검색":
+    st.header("🔀 Yes24 + 교보문고 키워드 검색 → 리뷰 크롤링")
+    st.caption("두 서점을 동시에 크롤링하고, store 열로 구분한 하나의 표로 합칩니다.")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        keyword = st.text_input("검색 키워드", placeholder="예: 수학의 정석", key="cross_keyword")
+
+    with col2:
+        col_yes24, col_kyobo = st.columns(2)
+        with col_yes24:
+            yes24_order = st.selectbox(
+                "Yes24 정렬",
+                YES24_ORDER_OPTIONS,
+                format_func=lambda x: x[1],
+                key="cross_yes24_order"
+            )
+        with col_kyobo:
+            kyobo_order = st.selectbox(
+                "교보문고 정렬",
+                KYOBO_ORDER_OPTIONS,
+                format_func=lambda x: x[1],
+                key="cross_kyobo_order"
+            )
+
+    col3, col4 = st.columns(2)
+
+    with col3:
+        max_products = st.number_input("서점별 최대 상품 수", min_value=1, max_value=100, value=10, key="cross_products")
+
+    with col4:
+        max_reviews = st.number_input("상품당 최대 리뷰 수", min_value=1, max_value=100, value=10, key="cross_reviews")
+
+    if st.button("🚀 크롤링 시작", type="primary", key="cross_start"):
+        if not keyword:
+            st.error("❌ 검색 키워드를 입력해주세요!")
+        else:
+            progress_bar, status_text, progress_callback = create_progress_callback()
+            result = run_cross_store_reviews(
+                keyword=keyword,
+                max_products=max_products,
+                max_reviews=max_reviews,
+                yes24_order=yes24_order[0],
+                kyobo_order=kyobo_order[0],
+                progress_callback=progress_callback
+            )
+            cleanup_progress_ui(progress_bar, status_text)
+            for store, row in result.get('stores', {}).items():
+                if row['status'] == 'error':
+                    st.warning(f"⚠️ {store}: {row['message']}")
+            render_pipeline_result(result, "cross_store_reviews", keyword)
+
 else:
     st.container(border=True).markdown("""
     ### 시작하려면 서점을 선택하세요
     
     **Yes24** 또는 **교보문고**를 선택하면 크롤링 옵션이 나타납니다.
+    **통합 검색**은 두 서점을 동시에 크롤링합니다.
     """)
 # Footer
 st.markdown("---")
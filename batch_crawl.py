@@ -0,0 +1,113 @@
+"""
+여러 키워드 일괄 리뷰 크롤링 CLI
+
+키워드 여러 개를 한 번에 검색하고, 여러 키워드에 나온 책도 리뷰는 한 번만
+수집한다. 결과는 ./results에 세 파일로 저장된다.
+- {store}_batch_reviews_*.csv : 리뷰 (keywords 열: 그 책이 나온 키워드 전체)
+- {store}_batch_summary_*.csv : 상품별 요약
+- {store}_batch_keywords_*.csv: 키워드별 검색 순위 → 상품번호
+
+사용법:
+    python batch_crawl.py yes24 국어 수학 영어 --max-products 10 --max-reviews 20
+    python batch_crawl.py kyobo --keywords-file keywords.txt   # 한 줄에 키워드 하나
+    python batch_crawl.py yes24 국어 수학 --job jobs/suneung.jsonl  # 중단돼도 같은 명령으로 이어서 실행
+    python batch_crawl.py yes24 국어 수학 --watermarks marks/yes24.json  # 지난 실행 이후 새 리뷰만
+"""
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+
+from common.file_utils import save_to_csv
+from common.batch import SEARCH_WORKERS
+from yes24.pipeline import REVIEW_WORKERS, run_batch_search_reviews as yes24_batch_search_reviews
+from kyobo.pipeline import run_batch_search_reviews as kyobo_batch_search_reviews
+
+
+def read_keywords(args):
+    """인자와 키워드 파일의 키워드 (빈 줄, '#' 주석 제외)"""
+    keywords = list(args.keywords)
+    if args.keywords_file:
+        for line in Path(args.keywords_file).read_text(encoding='utf-8').splitlines():
+            line = line.strip()
+            if line and not line.startswith('#'):
+                keywords.append(line)
+    return keywords
+
+
+def main():
+    parser = argparse.ArgumentParser(description="여러 키워드 일괄 리뷰 크롤링")
+    parser.add_argument('store', choices=['yes24', 'kyobo'], help="서점")
+    parser.add_argument('keywords', nargs='*', help="검색 키워드")
+    parser.add_argument('--keywords-file', help="키워드 파일 (한 줄에 하나)")
+    parser.add_argument('--max-products', type=int, default=10, help="키워드당 최대 상품 수 (기본 10)")
+    parser.add_argument('--max-reviews', type=int, default=10, help="상품당 최대 리뷰 수 (기본 10)")
+    parser.add_argument('--order', default=None, help="정렬 방식 (yes24 기본 RELATION, kyobo 기본 인기도)")
+    parser.add_argument('--search-workers', type=int, default=SEARCH_WORKERS, help="동시 검색 수")
+    parser.add_argument('--workers', type=int, default=REVIEW_WORKERS, help="리뷰를 동시에 수집할 상품 수")
+    parser.add_argument('--job', help="작업 저널 경로 (같은 경로로 다시 실행하면 끝난 상품은 건너뜀)")
+    parser.add_argument('--watermarks', help="상품별 수위 파일 경로 (주면 지난 실행 이후의 새 리뷰만 수집)")
+    args = parser.parse_args()
+
+    keywords = read_keywords(args)
+    if not keywords:
+        parser.error("키워드를 하나 이상 입력해야 합니다.")
+
+    print("=" * 60)
+    print(f"🔍 {args.store} 키워드 {len(keywords)}개 일괄 크롤링")
+    print("=" * 60)
+
+    def progress_callback(current, total, message):
+        print(f"[{current}/{total}] {message}")
+
+    if args.store == 'yes24':
+        result = yes24_batch_search_reviews(
+            keywords,
+            max_products=args.max_products,
+            max_reviews=args.max_reviews,
+            order=args.order or 'RELATION',
+            progress_callback=progress_callback,
+            search_workers=args.search_workers,
+            workers=args.workers,
+            job_path=args.job,
+            watermark_path=args.watermarks
+        )
+    else:
+        result = kyobo_batch_search_reviews(
+            keywords,
+            max_products=args.max_products,
+            max_reviews_per_book=args.max_reviews,
+            order=args.order or '',
+            progress_callback=progress_callback,
+            search_workers=args.search_workers,
+            workers=args.workers,
+            job_path=args.job,
+            watermark_path=args.watermarks
+        )
+
+    for search in result.get('searches', []):
+        if search['error']:
+            print(f"⚠️ '{search['keyword']}' 검색 실패: {search['error']}")
+
+    if result['status'] == 'error':
+        print(f"❌ {result['message']}")
+        sys.exit(1)
+
+    print(f"\n📊 {result['message']}")
+    print(f"   요청 {result['http']['requests']}회, 받은 본문 {result['http']['bytes'] / 1024:.0f}KB")
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    save_to_csv(result['data'], f"{args.store}_batch_reviews_{timestamp}.csv")
+    save_to_csv(result['summary'], f"{args.store}_batch_summary_{timestamp}.csv")
+    save_to_csv(result['keyword_map'], f"{args.store}_batch_keywords_{timestamp}.csv")
+
+    # 새 리뷰를 파일에 저장한 뒤에야 수위를 기록 (먼저 기록하고 멈추면 새 리뷰를 잃음)
+    if result.get('watermarks'):
+        result['watermarks'].commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+교보문고 리뷰 API JSON 디코딩 벤치마크
+
+리뷰 1천 개당 CPU 시간과 최대 메모리(tracemalloc)를 디코딩 방식별로 비교한다.
+- json    : 기존 방식 (표준 json으로 전체 디코딩 후 레코드 생성)
+- buffered: parse_review_page (orjson이 있으면 orjson)
+- stream  : stream_review_page (ijson, 64KB 조각 단위)
+
+buffered/json은 본문 전체(bytes)를 이미 메모리에 들고 있다는 점도 감안해야 한다
+(표의 본문 KB). stream은 조각만 들고 있으면 된다.
+
+사용법:
+    python benchmarks/kyobo_json.py                  # 합성 응답 (pageLimit 50/1000/10000)
+    python benchmarks/kyobo_json.py <JSON 디렉토리>   # 저장해 둔 API 응답 (*.json)
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common.json_utils import JSON_BACKEND, streaming_available
+from kyobo.review_scraper import STREAM_CHUNK_SIZE, parse_review_page, stream_review_page
+
+
+def legacy_parse(content):
+    """기존 get_kyobo_reviews의 디코딩 방식"""
+    data = json.loads(content)
+    review_list = data.get('data', {}).get('reviewList', [])
+    reviews = []
+    for item in review_list:
+        review_data = {
+            'rating': item.get('revwRvgr'),
+            'content': item.get('revwCntt'),
+            'author': item.get('mmbrId'),
+            'date': item.get('cretDttm', '')[:10],
+        }
+        if review_data.get('content'):
+            reviews.append(review_data)
+    return reviews, len(review_list), data.get('data', {}).get('totalCount', 0)
+
+
+def stream_parse(content):
+    chunks = (content[i:i + STREAM_CHUNK_SIZE] for i in range(0, len(content), STREAM_CHUNK_SIZE))
+    return stream_review_page(chunks)
+
+
+def synthetic_payload(count, seed=0):
+    """실제 API와 비슷한 필드 수(약 20개)를 가진 합성 응답"""
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        items.append({
+            'revwId': 10_000_000 + i,
+            'saleCmdtid': 'S000201100675',
+            'revwRvgr': rng.randint(1, 5),
+            'revwCntt': '리뷰 내용 ' * rng.randint(5, 60),
+            'mmbrId': f'user{i:05d}***',
+            'mmbrNcnm': f'닉네임{i}',
+            'cretDttm': f'2024-0{rng.randint(1, 9)}-{rng.randint(10, 28)} 10:00:00',
+            'amnrDttm': '2024-10-01 10:00:00',
+            'revwEmtnKywrName': '도움돼요',
+            'revwRcmnCont': rng.randint(0, 100),
+            'revwDclrCont': 0,
+            'revwPatrCode': '002',
+            'rvwrGrdCode': 'GOLD',
+            'imgList': [],
+            'cmdtName': '도서 제목',
+            'athrName': '저자',
+            'pbcmName': '출판사',
+            'rdngCdtnCode': None,
+            'spoilerYn': 'N',
+            'bestYn': 'N',
+        })
+    return json.dumps({
+        'statusCode': 200,
+        'resultMessage': '성공',
+        'data': {'totalCount': count, 'reviewList': items},
+    }, ensure_ascii=False).encode('utf-8')
+
+
+def measure(parse, content, repeat):
+    """(리뷰 1천 개당 CPU ms, 최대 메모리 KB, 결과)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.process_time()
+        result = parse(content)
+        best = min(best, time.process_time() - start)
+
+    tracemalloc.start()
+    parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    item_count = max(result[1], 1)
+    return best * 1000 * 1000 / item_count, peak / 1024, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="교보문고 리뷰 JSON 디코딩 벤치마크")
+    parser.add_argument('source', nargs='?', help="저장해 둔 API 응답(*.json) 디렉토리 (없으면 합성 응답)")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    if args.source:
+        payloads = [(path.name, path.read_bytes()) for path in sorted(Path(args.source).glob('*.json'))]
+    else:
+        payloads = [(f"pageLimit={n}", synthetic_payload(n)) for n in (50, 1000, 10000)]
+
+    methods = [('json', legacy_parse), (f'buffered({JSON_BACKEND})', parse_review_page)]
+    if streaming_available():
+        methods.append(('stream(ijson)', stream_parse))
+
+    print(f"{'payload':<20} {'본문 KB':>8} {'method':<18} {'CPU ms/1k':>10} {'peak KB':>9} {'same':>5}")
+    for name, content in payloads:
+        expected = None
+        for method, parse in methods:
+            cpu, peak, result = measure(parse, content, args.repeat)
+            expected = expected or result
+            print(f"{name:<20} {len(content) / 1024:>8.0f} {method:<18} {cpu:>10.2f} {peak:>9.0f} {str(result == expected):>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+목록 원문 훑기(scan) 적합성 검사 + 벤치마크
+
+저장해 둔 Yes24/교보문고 목록 페이지마다 원문 훑기 결과를 트리 파싱
+(html.parser, 전체 트리) 결과와 비교한다. 불일치가 하나라도 있거나
+검사한 페이지가 없으면 종료 코드 1로 끝난다. 페이지당 추출 시간도 함께 보여준다.
+경로를 주지 않으면 저장소에 포함된 표본 페이지(tests/fixtures/listings)로 검사한다
+(tests/test_listing_conformance.py가 같은 검사를 pytest로 실행).
+
+사용법:
+    python benchmarks/listing_conformance.py [HTML 디렉토리 또는 아카이브 루트] [--repeat 5]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common.html_parser import make_soup
+from common.html_scan import ScanFallback
+from yes24.get_goods_no import scan_listing
+from kyobo.product_search import scan_goods_no
+from parse_backends import PAGE_KINDS, classify, load_pages
+
+
+# 저장소에 포함된 표본 목록 페이지
+SAMPLE_PAGES = Path(__file__).parent.parent / "tests" / "fixtures" / "listings"
+
+# 페이지 종류별 원문 훑기 함수 (트리 파싱 기준 결과는 PAGE_KINDS)
+SCANNERS = {
+    'yes24_listing': scan_listing,
+    'kyobo_listing': scan_goods_no,
+}
+
+
+def best_time(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def check(pages, repeat):
+    """
+    Returns:
+        {페이지 종류: {'pages', 'fallbacks', 'mismatches', 'scan_ms', 'soup_ms'}}
+    """
+    results = {}
+    for name, body in pages:
+        kind = classify(body)
+        if kind not in SCANNERS:
+            continue
+        row = results.setdefault(kind, {'pages': 0, 'fallbacks': [], 'mismatches': [], 'scan_ms': [], 'soup_ms': []})
+        row['pages'] += 1
+
+        extract, scan = PAGE_KINDS[kind][1], SCANNERS[kind]
+        expected = extract(make_soup(body, 'html.parser'))
+        try:
+            record = scan(body)
+        except ScanFallback as e:
+            row['fallbacks'].append(f"{name} ({e})")
+            continue
+        if record != expected:
+            row['mismatches'].append(name)
+
+        row['scan_ms'].append(best_time(lambda: scan(body), repeat) * 1000)
+        row['soup_ms'].append(best_time(lambda: extract(make_soup(body, 'html.parser')), repeat) * 1000)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 원문 훑기 적합성 검사")
+    parser.add_argument('source', nargs='?', default=str(SAMPLE_PAGES),
+                        help="HTML 파일 디렉토리 또는 아카이브 루트 (기본: 표본 페이지)")
+    parser.add_argument('--repeat', type=int, default=5, help="페이지당 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    results = check(load_pages(args.source), args.repeat)
+    if not results:
+        print(f"검사할 목록 페이지가 없습니다: {args.source}")
+        sys.exit(1)
+
+    failed = False
+    print(f"{'page kind':<15} {'pages':>6} {'fallback':>9} {'mismatch':>9} {'scan ms':>9} {'soup ms':>9}")
+    for kind, row in results.items():
+        scan_ms = statistics.mean(row['scan_ms']) if row['scan_ms'] else 0.0
+        soup_ms = statistics.mean(row['soup_ms']) if row['soup_ms'] else 0.0
+        print(f"{kind:<15} {row['pages']:>6} {len(row['fallbacks']):>9} {len(row['mismatches']):>9}"
+              f" {scan_ms:>9.2f} {soup_ms:>9.2f}")
+        for name in row['fallbacks']:
+            print(f"    트리 파싱으로 대체: {name}")
+        for name in row['mismatches']:
+            print(f"    결과 불일치: {name}")
+        failed = failed or bool(row['mismatches'])
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+파서 백엔드 벤치마크
+
+저장해 둔 페이지로 백엔드별 페이지당 파싱 시간(문서 생성 + 추출)을 재고,
+추출 결과가 기본 백엔드(html.parser)와 같은지 확인한다.
+
+사용법:
+    python benchmarks/parse_backends.py <HTML 디렉토리 또는 아카이브 루트> [--repeat 5]
+
+- 디렉토리: *.html / *.htm 파일을 모두 사용
+- 아카이브 루트 (index.sqlite 있음): common.archive로 기록한 본문을 모두 사용
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common.archive import PageArchive
+from common.html_parser import DEFAULT_BACKEND, available_backends, make_soup
+from yes24.get_reviews import get_max_page, parse_reviews_from_html
+from yes24.get_books_info import parse_book_info
+from yes24.get_goods_no import NEXT_PAGE_SELECTOR, _parse_products_from_soup
+from kyobo.product_search import parse_goods_no
+
+
+def _yes24_listing(soup):
+    return _parse_products_from_soup(soup), soup.select_one(NEXT_PAGE_SELECTOR) is not None
+
+
+# 페이지 종류: (본문에 포함된 표식, 추출 함수), 앞에서부터 먼저 일치하는 종류로 판별
+PAGE_KINDS = {
+    'yes24_book': (b'gd_pubArea', lambda soup: parse_book_info(soup, '')),
+    'yes24_review': (b'reviewInfoGrp', lambda soup: (parse_reviews_from_html(soup), get_max_page(soup))),
+    'yes24_listing': (b'data-goods-no', _yes24_listing),
+    'kyobo_listing': (b'prod_info', parse_goods_no),
+}
+
+
+def classify(body):
+    """본문 표식으로 페이지 종류 판별 (해당 없으면 None)"""
+    for kind, (marker, _) in PAGE_KINDS.items():
+        if marker in body:
+            return kind
+    return None
+
+
+def load_pages(source):
+    """[(이름, 본문 bytes), ...]"""
+    source = Path(source)
+    if (source / "index.sqlite").exists():
+        archive = PageArchive(source)
+        pages, seen = [], set()
+        for url, digest, _ in archive.iter_captures():
+            if digest not in seen:
+                seen.add(digest)
+                pages.append((url, archive.read_blob(digest)[1]))
+        return pages
+    return [(path.name, path.read_bytes()) for path in sorted(source.iterdir())
+            if path.suffix in ('.html', '.htm')]
+
+
+def run(pages, backends, repeat):
+    """
+    Returns:
+        {백엔드: {페이지 종류: {'pages', 'ms_per_page', 'mismatches'}}}
+    """
+    by_kind = {}
+    for name, body in pages:
+        kind = classify(body)
+        if kind:
+            by_kind.setdefault(kind, []).append((name, body))
+
+    results = {}
+    for backend in backends:
+        results[backend] = {}
+        for kind, kind_pages in by_kind.items():
+            extract = PAGE_KINDS[kind][1]
+            timings = []
+            mismatches = []
+            for name, body in kind_pages:
+                expected = extract(make_soup(body, DEFAULT_BACKEND))
+                best = float('inf')
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    record = extract(make_soup(body, backend))
+                    best = min(best, time.perf_counter() - start)
+                timings.append(best)
+                if record != expected:
+                    mismatches.append(name)
+            results[backend][kind] = {
+                'pages': len(kind_pages),
+                'ms_per_page': statistics.mean(timings) * 1000,
+                'mismatches': mismatches,
+            }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드 벤치마크")
+    parser.add_argument('source', help="HTML 파일 디렉토리 또는 아카이브 루트")
+    parser.add_argument('--repeat', type=int, default=5, help="페이지당 반복 횟수 (최솟값 사용)")
+    parser.add_argument('--backends', nargs='+', default=available_backends())
+    args = parser.parse_args()
+
+    pages = load_pages(args.source)
+    results = run(pages, args.backends, args.repeat)
+
+    print(f"{'backend':<12} {'page kind':<15} {'pages':>6} {'ms/page':>9} {'mismatch':>9}")
+    for backend, kinds in results.items():
+        for kind, row in kinds.items():
+            print(f"{backend:<12} {kind:<15} {row['pages']:>6} {row['ms_per_page']:>9.2f} {len(row['mismatches']):>9}")
+            for name in row['mismatches']:
+                print(f"    결과 불일치: {name}")
+
+
+if __name__ == "__main__":
+    main()
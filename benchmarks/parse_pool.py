@@ -0,0 +1,97 @@
+"""
+파싱 프로세스 풀 확장성 벤치마크
+
+저장해 둔 Yes24 리뷰/상세 페이지를 요청 스레드 여러 개가 동시에 파싱할 때
+초당 처리 페이지 수를 잰다. 요청 스레드는 실제 크롤링처럼 run_parse()를
+호출한다 (common.parse_pool).
+
+- inline   : 작업자 0 (각 스레드가 직접 파싱, GIL 때문에 코어 하나)
+- process N: 작업자 프로세스 N개
+
+결과가 inline 파싱과 같은지도 확인한다.
+
+사용법:
+    python benchmarks/parse_pool.py <HTML 디렉토리 또는 아카이브 루트> [--rounds 5] [--workers 1 2 4]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common.html_parser import get_parser_backend, set_parser_backend
+from common.parse_pool import run_parse, set_parse_workers
+from yes24.get_reviews import parse_review_body
+from yes24.get_books_info import parse_book_body
+from parse_backends import classify, load_pages
+
+
+# 페이지 종류별 파싱 함수 (크롤러가 run_parse로 넘기는 함수)
+PARSERS = {
+    'yes24_review': parse_review_body,
+    'yes24_book': parse_book_body,
+}
+
+
+def default_workers():
+    """1, 2, 4, ... CPU 수까지"""
+    cpus = os.cpu_count() or 1
+    workers = []
+    n = 1
+    while n < cpus:
+        workers.append(n)
+        n *= 2
+    workers.append(cpus)
+    return workers
+
+
+def measure(jobs, threads):
+    """jobs [(파싱 함수, 본문)]를 요청 스레드 threads개로 파싱, (초당 페이지, 결과)"""
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        results = list(executor.map(lambda job: run_parse(*job), jobs))
+        elapsed = time.perf_counter() - start
+    return len(jobs) / elapsed, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파싱 프로세스 풀 확장성 벤치마크")
+    parser.add_argument('source', help="HTML 파일 디렉토리 또는 아카이브 루트")
+    parser.add_argument('--rounds', type=int, default=5, help="페이지 목록을 반복하는 횟수")
+    parser.add_argument('--workers', type=int, nargs='+', default=default_workers(), help="작업자 프로세스 수")
+    parser.add_argument('--backend', default=get_parser_backend(), help="파서 백엔드")
+    args = parser.parse_args()
+
+    set_parser_backend(args.backend)
+    jobs = []
+    for name, body in load_pages(args.source):
+        func = PARSERS.get(classify(body))
+        if func:
+            jobs.append((func, body))
+    if not jobs:
+        sys.exit("Yes24 리뷰/상세 페이지가 없습니다.")
+    jobs *= args.rounds
+
+    threads = max(args.workers) * 2
+    print(f"페이지 {len(jobs)}개 (CPU {os.cpu_count()}개, 요청 스레드 {threads}개, 백엔드 {args.backend})")
+    print(f"{'mode':<12} {'pages/s':>9} {'speedup':>8} {'same':>5}")
+
+    set_parse_workers(0)
+    baseline, expected = measure(jobs, threads)
+    print(f"{'inline':<12} {baseline:>9.1f} {1.0:>8.2f} {'True':>5}")
+
+    for workers in args.workers:
+        set_parse_workers(workers)
+        # 작업자 프로세스 시작 시간은 빼고 잰다
+        measure(jobs[:workers * 2], threads)
+        rate, results = measure(jobs, threads)
+        print(f"{f'process {workers}':<12} {rate:>9.1f} {rate / baseline:>8.2f} {str(results == expected):>5}")
+    set_parse_workers(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+부분 파싱(ParseScope) 벤치마크
+
+저장해 둔 리뷰/목록 페이지로 전체 트리 파싱과 부분 파싱의 페이지당
+시간과 최대 메모리(tracemalloc)를 비교하고, 추출 결과가 같은지 확인한다.
+
+사용법:
+    python benchmarks/scoped_parse.py <HTML 디렉토리 또는 아카이브 루트> [--repeat 5]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common.html_parser import available_backends, make_soup
+from yes24.get_reviews import REVIEW_PAGE_SCOPE
+from yes24.utils import LISTING_SCOPE
+from kyobo.product_search import SEARCH_RESULT_SCOPE
+from parse_backends import PAGE_KINDS, classify, load_pages
+
+
+# 페이지 종류별 파싱 범위 (상세 페이지는 전체 트리 사용)
+SCOPES = {
+    'yes24_review': REVIEW_PAGE_SCOPE,
+    'yes24_listing': LISTING_SCOPE,
+    'kyobo_listing': SEARCH_RESULT_SCOPE,
+}
+
+
+def measure(body, extract, backend, scope, repeat):
+    """(최소 시간 초, 최대 메모리 bytes, 추출 결과)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        record = extract(make_soup(body, backend, scope=scope))
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    extract(make_soup(body, backend, scope=scope))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, record
+
+
+def run(pages, backends, repeat):
+    """
+    Returns:
+        {백엔드: {페이지 종류: {'pages', 'full_ms', 'scoped_ms', 'full_kb', 'scoped_kb', 'mismatches'}}}
+    """
+    by_kind = {}
+    for name, body in pages:
+        kind = classify(body)
+        if kind in SCOPES:
+            by_kind.setdefault(kind, []).append((name, body))
+
+    results = {}
+    for backend in backends:
+        results[backend] = {}
+        for kind, kind_pages in by_kind.items():
+            extract = PAGE_KINDS[kind][1]
+            rows = {'full_ms': [], 'scoped_ms': [], 'full_kb': [], 'scoped_kb': []}
+            mismatches = []
+            for name, body in kind_pages:
+                full_time, full_peak, expected = measure(body, extract, backend, None, repeat)
+                scoped_time, scoped_peak, record = measure(body, extract, backend, SCOPES[kind], repeat)
+                rows['full_ms'].append(full_time * 1000)
+                rows['scoped_ms'].append(scoped_time * 1000)
+                rows['full_kb'].append(full_peak / 1024)
+                rows['scoped_kb'].append(scoped_peak / 1024)
+                if record != expected:
+                    mismatches.append(name)
+            results[backend][kind] = {
+                'pages': len(kind_pages),
+                **{key: statistics.mean(values) for key, values in rows.items()},
+                'mismatches': mismatches,
+            }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부분 파싱 시간/메모리 벤치마크")
+    parser.add_argument('source', help="HTML 파일 디렉토리 또는 아카이브 루트")
+    parser.add_argument('--repeat', type=int, default=5, help="페이지당 반복 횟수 (최솟값 사용)")
+    parser.add_argument('--backends', nargs='+',
+                        default=[b for b in available_backends() if b != 'selectolax'])
+    args = parser.parse_args()
+
+    results = run(load_pages(args.source), args.backends, args.repeat)
+
+    print(f"{'backend':<12} {'page kind':<15} {'pages':>6} {'full ms':>9} {'scoped ms':>10}"
+          f" {'full KB':>9} {'scoped KB':>10} {'mismatch':>9}")
+    for backend, kinds in results.items():
+        for kind, row in kinds.items():
+            print(f"{backend:<12} {kind:<15} {row['pages']:>6} {row['full_ms']:>9.2f} {row['scoped_ms']:>10.2f}"
+                  f" {row['full_kb']:>9.0f} {row['scoped_kb']:>10.0f} {len(row['mismatches']):>9}")
+            for name in row['mismatches']:
+                print(f"    결과 불일치: {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,17 @@
 Yes24, 교보문고 크롤러가 공유하는 기능들
 """
 
-from .http_utils import HEADERS
-from .file_utils import save_to_csv, sanitize_filename
+from .http_utils import HEADERS, http_get, get_session, new_session, get_http_stats
+from .rate_limit import rate_limiter, configure_store_rate_limit
+from .concurrency import concurrency_controllers, get_concurrency_stats
+from .retry import RetryPolicy, CircuitOpenError, track_fetches
+from .http_cache import configure_cache, cache_stats
+from .archive import configure_archive, archive_mode, ArchiveMissError
+from .html_parser import make_soup, set_parser_backend, available_backends, ParseScope
+from .parse_pool import set_parse_workers
+from .stage_pipeline import Stage, SourceProgress, run_stages
+from .checkpoint import JobJournal
+from .file_utils import save_to_csv, CsvSink, sanitize_filename
 from .cli_utils import select_option
 from .ui_utils import (
     YES24_ORDER_OPTIONS,
@@ -14,12 +23,39 @@ from .ui_utils import (
     render_pipeline_result,
     render_search_results_selection,
     crawl_selected_reviews,
+    iter_selected_reviews,
     render_crawl_results,
 )
 
 __all__ = [
     'HEADERS',
+    'http_get',
+    'get_session',
+    'new_session',
+    'get_http_stats',
+    'rate_limiter',
+    'configure_store_rate_limit',
+    'concurrency_controllers',
+    'get_concurrency_stats',
+    'RetryPolicy',
+    'CircuitOpenError',
+    'track_fetches',
+    'configure_cache',
+    'cache_stats',
+    'configure_archive',
+    'archive_mode',
+    'ArchiveMissError',
+    'make_soup',
+    'set_parser_backend',
+    'available_backends',
+    'ParseScope',
+    'set_parse_workers',
+    'Stage',
+    'SourceProgress',
+    'run_stages',
+    'JobJournal',
     'save_to_csv',
+    'CsvSink',
     'sanitize_filename',
     'select_option',
     'YES24_ORDER_OPTIONS',
@@ -29,5 +65,6 @@ __all__ = [
     'render_pipeline_result',
     'render_search_results_selection',
     'crawl_selected_reviews',
+    'iter_selected_reviews',
     'render_crawl_results',
 ]
@@ -0,0 +1,227 @@
+"""
+원본 페이지 아카이브 (WARC 유사 형식)
+
+가져온 응답 본문(Yes24 HTML, 교보문고 리뷰 JSON)을 압축해 보관하고,
+네트워크 없이 아카이브에서 다시 파싱하는 replay 모드를 제공한다.
+
+저장 구조 (root 디렉토리):
+- segment-00001.warc.gz ... : 레코드마다 독립 gzip 멤버 (WARC 헤더 + 본문)
+- index.sqlite : 본문 다이제스트 → (세그먼트, 오프셋, 길이), URL → 수집 이력
+
+같은 본문(sha256)은 한 번만 저장하고 URL 수집 이력만 추가한다 (content-addressed).
+"""
+
+import gzip
+import hashlib
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .http_cache import normalize_url
+
+
+DEFAULT_ARCHIVE_ROOT = "./archive"
+MAX_SEGMENT_BYTES = 100 * 1024 * 1024  # 세그먼트 파일 하나의 최대 크기
+
+
+class ArchiveMissError(Exception):
+    """replay 모드에서 아카이브에 없는 URL을 요청"""
+
+
+def _record_bytes(url, fetched_at, digest, content_type, body):
+    """WARC 유사 레코드 직렬화"""
+    date = datetime.fromtimestamp(fetched_at, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    header = (
+        "WARC/1.1\r\n"
+        "WARC-Type: response\r\n"
+        f"WARC-Target-URI: {url}\r\n"
+        f"WARC-Date: {date}\r\n"
+        f"WARC-Payload-Digest: sha256:{digest}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "\r\n"
+    ).encode('utf-8')
+    return header + body + b"\r\n\r\n"
+
+
+def _parse_record(raw):
+    """레코드에서 (헤더 dict, 본문) 추출"""
+    head, _, rest = raw.partition(b"\r\n\r\n")
+    headers = {}
+    for line in head.decode('utf-8').split("\r\n")[1:]:
+        name, _, value = line.partition(": ")
+        headers[name] = value
+    length = int(headers['Content-Length'])
+    return headers, rest[:length]
+
+
+class PageArchive:
+    """
+    페이지 아카이브 (스레드 안전)
+
+    root: 아카이브 디렉토리
+    max_segment_bytes: 세그먼트 파일 크기 상한
+    """
+
+    def __init__(self, root=DEFAULT_ARCHIVE_ROOT, max_segment_bytes=MAX_SEGMENT_BYTES):
+        self.root = Path(root)
+        self.max_segment_bytes = max_segment_bytes
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _db(self):
+        if self._conn is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.root / "index.sqlite"), check_same_thread=False)
+            self._conn.executescript(
+                "CREATE TABLE IF NOT EXISTS blobs ("
+                " digest TEXT PRIMARY KEY, segment TEXT, offset INTEGER, length INTEGER);"
+                "CREATE TABLE IF NOT EXISTS captures ("
+                " url_key TEXT, url TEXT, digest TEXT, fetched_at REAL, status INTEGER, content_type TEXT);"
+                "CREATE INDEX IF NOT EXISTS idx_captures_url ON captures(url_key, fetched_at);"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _current_segment(self):
+        segments = sorted(self.root.glob("segment-*.warc.gz"))
+        if segments and segments[-1].stat().st_size < self.max_segment_bytes:
+            return segments[-1]
+        return self.root / f"segment-{len(segments) + 1:05d}.warc.gz"
+
+    def record(self, url, body, content_type='', status=200, fetched_at=None):
+        """
+        본문 하나를 아카이브에 기록
+
+        Returns:
+            str: 본문 sha256 다이제스트
+        """
+        fetched_at = fetched_at or time.time()
+        digest = hashlib.sha256(body).hexdigest()
+
+        with self._lock:
+            db = self._db()
+            exists = db.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if not exists:
+                member = gzip.compress(_record_bytes(url, fetched_at, digest, content_type, body))
+                segment = self._current_segment()
+                with open(segment, 'ab') as f:
+                    offset = f.tell()
+                    f.write(member)
+                db.execute("INSERT INTO blobs VALUES (?, ?, ?, ?)", (digest, segment.name, offset, len(member)))
+            db.execute(
+                "INSERT INTO captures VALUES (?, ?, ?, ?, ?, ?)",
+                (normalize_url(url), url, digest, fetched_at, status, content_type)
+            )
+            db.commit()
+        return digest
+
+    def read_blob(self, digest):
+        """다이제스트로 (헤더 dict, 본문) 읽기"""
+        with self._lock:
+            row = self._db().execute(
+                "SELECT segment, offset, length FROM blobs WHERE digest = ?", (digest,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(digest)
+        segment, offset, length = row
+        with open(self.root / segment, 'rb') as f:
+            f.seek(offset)
+            raw = gzip.decompress(f.read(length))
+        return _parse_record(raw)
+
+    def lookup(self, url):
+        """URL의 가장 최근 수집 이력 (없으면 None)"""
+        with self._lock:
+            row = self._db().execute(
+                "SELECT url, digest, fetched_at, status, content_type FROM captures"
+                " WHERE url_key = ? ORDER BY fetched_at DESC LIMIT 1",
+                (normalize_url(url),)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('url', 'digest', 'fetched_at', 'status', 'content_type'), row))
+
+    def replay(self, url):
+        """
+        아카이브에서 URL 응답 재구성
+
+        Raises:
+            ArchiveMissError: 아카이브에 없는 URL
+        """
+        capture = self.lookup(url)
+        if capture is None:
+            raise ArchiveMissError(f"아카이브에 없는 URL: {url}")
+        _, body = self.read_blob(capture['digest'])
+
+        response = requests.Response()
+        response.status_code = capture['status']
+        response.headers = CaseInsensitiveDict({'Content-Type': capture['content_type']})
+        response._content = body
+        response._content_consumed = True  # iter_content()는 저장된 본문을 나눠서 돌려줌
+        response.url = url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_archive = True
+        return response
+
+    def iter_captures(self):
+        """모든 수집 이력을 시간순으로 순회 (url, digest, fetched_at)"""
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT url, digest, fetched_at FROM captures ORDER BY fetched_at"
+            ).fetchall()
+        yield from rows
+
+
+# ==============================================================================
+# 전역 설정
+# ==============================================================================
+
+_archive = None
+_mode = None  # None | 'record' | 'replay'
+
+
+def configure_archive(root=DEFAULT_ARCHIVE_ROOT, mode='record'):
+    """
+    전역 아카이브 설정
+
+    Args:
+        root: 아카이브 디렉토리
+        mode: 'record' (가져온 본문 저장), 'replay' (네트워크 없이 아카이브에서 응답),
+              None (사용 안 함)
+    """
+    global _archive, _mode
+    _archive = PageArchive(root) if mode else None
+    _mode = mode
+
+
+def get_archive():
+    """(아카이브, 모드) 반환 (설정 안 됐으면 (None, None))"""
+    return _archive, _mode
+
+
+@contextmanager
+def archive_mode(root=DEFAULT_ARCHIVE_ROOT, mode='replay'):
+    """
+    범위 안에서만 아카이브 모드 적용
+
+        with archive_mode('./archive', 'replay'):
+            result = run_search_reviews('파이썬')
+    """
+    previous = (_archive, _mode)
+    configure_archive(root, mode)
+    try:
+        yield _archive
+    finally:
+        _set(*previous)
+
+
+def _set(archive, mode):
+    global _archive, _mode
+    _archive, _mode = archive, mode
@@ -0,0 +1,161 @@
+"""
+여러 키워드 일괄 크롤링 공통 유틸리티
+
+관련 키워드 여러 개(예: 수능 과목명)를 한 번에 크롤링한다.
+- 키워드 검색은 search_workers개씩 동시에 실행
+- 검색 결과를 상품번호(goods_no)로 합쳐서, 여러 키워드에 나온 상품도
+  리뷰는 한 번만 수집 (검색이 끝나기 전에 먼저 찾은 상품부터 시작)
+- 수집이 끝나면 각 리뷰/상품에 일치한 키워드를 모두 붙임
+- job_path를 주면 키워드별 검색 결과와 끝난 상품을 작업 저널에 기록하고,
+  다시 실행하면 이어서 진행 (키워드를 추가해서 다시 실행해도 됨)
+
+상점별 검색/리뷰 수집 함수는 yes24.pipeline / kyobo.pipeline의
+run_batch_search_reviews가 넘긴다.
+"""
+
+from .checkpoint import JobJournal
+from .http_utils import http_stats
+from .stage_pipeline import Stage, SourceProgress, run_stages
+
+# 기본 동시 실행 수
+SEARCH_WORKERS = 4
+CRAWL_WORKERS = 4
+
+# 리뷰/요약 행의 키워드 목록 구분자
+KEYWORD_SEPARATOR = ', '
+
+
+def run_batch(keywords, search, crawl, search_workers=SEARCH_WORKERS, crawl_workers=CRAWL_WORKERS,
+              progress_callback=None, job_path=None, job_params=None):
+    """
+    여러 키워드 검색 → 상품번호 기준 중복 제거 → 리뷰 수집 → 키워드별 귀속
+
+    Args:
+        keywords: 검색 키워드 리스트 (중복은 한 번만 검색)
+        search: search(keyword) → {제목: 상품번호}
+        crawl: crawl(title, goods_no) → (리뷰 리스트, 상품 요약 dict, 진행 메시지)
+        search_workers: 동시에 실행할 최대 검색 수
+        crawl_workers: 리뷰를 동시에 수집할 최대 상품 수
+        progress_callback: callback(current, total, message) (optional)
+                           total은 지금까지 찾은 상품 수 (검색이 진행되면 늘어남)
+        job_path: 작업 저널 경로 (optional, common.checkpoint)
+        job_params: 저널에 기록할 작업 설정 (키워드 제외, 같아야 재개)
+
+    Returns:
+        dict: {
+            'status': 'success' | 'error',
+            'message': str,
+            'data': list,  # 리뷰 리스트 (상품마다 한 번, 'keywords' 열 추가)
+            'count': int,
+            'summary': list,  # 상품별 요약 (keywords, review_count, outcome, ...)
+            'keyword_map': list,  # 키워드별 검색 결과 (keyword, rank, title, goods_no, review_count)
+            'searches': list,  # 키워드별 검색 결과 수/오류 (keyword, product_count, error)
+            'http': dict  # 이번 실행의 요청 수/받은 본문 크기
+        }
+    """
+    http_before = http_stats.snapshot()
+    keywords = list(dict.fromkeys(keywords))
+    matches = {}    # {상품번호: [일치한 키워드, ...]} (처음 찾은 순서)
+    rankings = {}   # {키워드: [(제목, 상품번호), ...]} (검색 순위 순서)
+    searches = []
+    journal = None
+
+    def search_one(keyword):
+        try:
+            goods_dict = dict(journal.iter_search(lambda: search(keyword).items(), key=keyword))
+            return keyword, goods_dict, None
+        except Exception as e:
+            # 키워드 하나의 검색 실패는 기록만 하고 계속 진행
+            return keyword, {}, e
+
+    def discover():
+        # source 스레드에서 실행: 검색 결과가 나오는 대로 처음 본 상품만 내보냄
+        stages = [Stage('search', search_one, workers=search_workers)]
+        for keyword, goods_dict, error in run_stages(keywords, stages):
+            searches.append({
+                'keyword': keyword,
+                'product_count': len(goods_dict),
+                'error': str(error) if error else '',
+            })
+            rankings[keyword] = list(goods_dict.items())
+            for title, goods_no in goods_dict.items():
+                if goods_no in matches:
+                    if keyword not in matches[goods_no]:
+                        matches[goods_no].append(keyword)
+                    continue
+                matches[goods_no] = [keyword]
+                yield title, goods_no
+
+    def crawl_one(product):
+        title, goods_no = product
+        # 실패한 상품은 기록하지 않아 다음 실행에서 다시 시도
+        return journal.run(goods_no, crawl, title, goods_no,
+                           succeeded=lambda result: result[1]['review_count'] != -1)
+
+    try:
+        journal = JobJournal(job_path, params=job_params)
+        products = []  # [(리뷰 리스트, 상품 요약)] (처음 찾은 순서)
+        stages = [Stage('reviews', crawl_one, workers=crawl_workers)]
+        # 진행 표시의 전체 수: 지금까지 찾은 상품 수 (검색이 모두 끝나면 확정)
+        progress = SourceProgress(discover())
+        for idx, (reviews, summary, message) in enumerate(run_stages(progress, stages), 1):
+            products.append((reviews, summary))
+            progress.report(progress_callback, idx, message)
+        progress.finish(progress_callback)
+    except Exception as e:
+        return {
+            'status': 'error',
+            'message': f'오류 발생: {str(e)}',
+            'data': [],
+            'count': 0,
+            'summary': []
+        }
+    finally:
+        if journal:
+            journal.close()
+
+    if not products:
+        return {
+            'status': 'error',
+            'message': '검색 결과가 없습니다.',
+            'data': [],
+            'count': 0,
+            'summary': [],
+            'searches': searches
+        }
+
+    # 검색이 모두 끝난 뒤에야 상품별 키워드 목록이 확정되므로 마지막에 붙임
+    all_reviews = []
+    results_summary = []
+    review_counts = {}
+    for reviews, summary in products:
+        goods_no = summary['goods_no']
+        keyword_text = KEYWORD_SEPARATOR.join(matches[goods_no])
+        for review in reviews:
+            review['keywords'] = keyword_text
+        all_reviews.extend(reviews)
+        results_summary.append({**summary, 'keywords': keyword_text})
+        review_counts[goods_no] = summary['review_count']
+
+    keyword_map = [
+        {
+            'keyword': keyword,
+            'rank': rank,
+            'title': title,
+            'goods_no': goods_no,
+            'review_count': review_counts.get(goods_no, -1),
+        }
+        for keyword in keywords
+        for rank, (title, goods_no) in enumerate(rankings.get(keyword, []), 1)
+    ]
+
+    return {
+        'status': 'success',
+        'message': f'키워드 {len(keywords)}개, 상품 {len(products)}개에서 {len(all_reviews)}개의 리뷰를 수집했습니다.',
+        'data': all_reviews,
+        'count': len(all_reviews),
+        'summary': results_summary,
+        'keyword_map': keyword_map,
+        'searches': sorted(searches, key=lambda row: keywords.index(row['keyword'])),
+        'http': http_stats.since(http_before)
+    }
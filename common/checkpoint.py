@@ -0,0 +1,272 @@
+"""
+작업 체크포인트 (재개 가능한 크롤링)
+
+크롤링 중에 끝난 상품의 결과와 받은 페이지를 JSONL 저널에 한 줄씩 바로
+기록한다. 같은 저널로 다시 실행하면 끝난 상품은 저널의 결과를 그대로 쓰고,
+중간에 멈춘 상품은 이미 받은 페이지를 다시 요청하지 않는다.
+
+저널 레코드 (한 줄에 JSON 하나):
+- {"type": "job", "params": {...}}              : 작업 설정 (첫 줄)
+- {"type": "search", "key": 검색 키, "items": [[제목, 상품번호], ...]}: 끝까지 받은 검색 결과
+- {"type": "page", "key": 상품, "page": 페이지 키, "value": ...}: 받은 페이지 결과
+- {"type": "product", "key": 상품, "value": ...}: 끝난 상품 결과 (부분 출력)
+- {"type": "output", "key": 상품, "rows": 행 수}: 출력 파일에 확정된 상품과 그때까지의 행 수
+
+    with JobJournal("./jobs/toeic.jsonl", params={...}) as journal:
+        products = journal.iter_search(lambda: iter_search_products(keyword))
+        result = journal.run(goods_no, crawl, title, goods_no)  # 끝난 상품이면 저널 결과
+
+JobJournal(None)은 아무것도 기록하지 않는다 (체크포인트를 쓰지 않는 실행).
+"""
+
+import contextvars
+import json
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class JobMismatchError(ValueError):
+    """저널의 작업 설정이 지금 실행의 설정과 다름"""
+
+
+class _ProductScope:
+    """처리 중인 상품 (페이지 요청이 한 번이라도 실패하면 failed)"""
+
+    __slots__ = ('journal', 'key', 'failed')
+
+    def __init__(self, journal, key):
+        self.journal = journal
+        self.key = key
+        self.failed = False
+
+
+# 현재 스레드/태스크가 처리 중인 상품 (_ProductScope)
+_current_product = contextvars.ContextVar('job_product', default=None)
+
+
+class JobJournal:
+    """
+    JSONL 작업 저널 (스레드 안전)
+
+    path: 저널 파일 경로 (None이면 기록하지 않음)
+    params: 작업 설정 (저널이 이미 있으면 같아야 재개, 다르면 JobMismatchError)
+    """
+
+    def __init__(self, path, params=None):
+        self.path = Path(path) if path else None
+        # 저널에서 읽은 값과 비교할 수 있도록 JSON 형태로 맞춤 (튜플 → 리스트, Path → 문자열 등)
+        self.params = json.loads(json.dumps(params or {}, ensure_ascii=False, default=str))
+        self._searches = {}       # {검색 키: [(제목, 상품번호), ...]} (끝까지 받은 검색)
+        self._products = {}       # {상품 키: 결과}
+        self._pages = {}          # {(상품 키, 페이지 키): 결과}
+        self._written = {}        # {상품 키: 출력 파일 행 수} (출력에 확정된 상품)
+        self._lock = threading.Lock()
+        self._file = None
+
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            self._load()
+        self._file = open(self.path, 'a', encoding='utf-8')
+        if self.path.stat().st_size == 0:
+            self._append({'type': 'job', 'params': self.params})
+
+    @property
+    def enabled(self):
+        return self.path is not None
+
+    @property
+    def resumed(self):
+        """저널에서 복원한 끝난 상품 수"""
+        return len(self._products)
+
+    def _load(self):
+        good_size = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # 기록 중에 멈춰 잘린 마지막 줄: 버리고 그 앞부터 이어서 기록
+                    break
+                good_size += len(line)
+                self._apply(record)
+        if good_size < self.path.stat().st_size:
+            with open(self.path, 'r+b') as f:
+                f.truncate(good_size)
+
+    def _apply(self, record):
+        kind = record.get('type')
+        if kind == 'job':
+            if record.get('params') != self.params:
+                raise JobMismatchError(
+                    f"작업 설정이 저널과 다릅니다: {self.path} "
+                    f"(저널 {record.get('params')}, 지금 {self.params})"
+                )
+        elif kind == 'search':
+            self._searches[record.get('key', '')] = [tuple(item) for item in record['items']]
+        elif kind == 'page':
+            self._pages[(record['key'], record['page'])] = record['value']
+        elif kind == 'product':
+            self._products[record['key']] = record['value']
+        elif kind == 'output':
+            self._written[record['key']] = record['rows']
+
+    def _append(self, record):
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            self._file.write(line)
+            # 프로세스가 죽어도 여기까지는 남도록 줄마다 내보냄
+            self._file.flush()
+
+    # ------------------------------------------------------------------
+    # 상품 단위
+    # ------------------------------------------------------------------
+
+    def done(self, key):
+        return key in self._products
+
+    def result(self, key):
+        return self._products.get(key)
+
+    def record(self, key, value):
+        """끝난 상품 결과 기록"""
+        if not self.enabled:
+            return
+        self._products[key] = value
+        self._append({'type': 'product', 'key': key, 'value': value})
+
+    @contextmanager
+    def product(self, key):
+        """
+        범위 안의 checkpointed_page() 호출을 key 상품의 페이지로 기록
+
+        상품 범위 객체를 내보낸다. 범위 안에서 페이지 요청이 실패하면
+        (수집 함수가 예외를 삼키고 부분 결과를 돌려줘도) failed가 True가 된다.
+        """
+        scope = _ProductScope(self, key)
+        token = _current_product.set(scope if self.enabled else None)
+        try:
+            yield scope
+        finally:
+            _current_product.reset(token)
+
+    def run(self, key, func, *args, succeeded=None):
+        """
+        끝난 상품이면 저널의 결과를, 아니면 func(*args)를 실행하고 기록
+
+        succeeded(result)가 False이거나 페이지 요청이 실패했으면 기록하지 않는다
+        (다음 실행에서 다시 시도, 그때도 이미 받은 페이지는 재사용).
+        저널에서 읽은 결과의 튜플은 리스트로 온다.
+        """
+        if key in self._products:
+            return self._products[key]
+        with self.product(key) as scope:
+            result = func(*args)
+        if not scope.failed and (succeeded is None or succeeded(result)):
+            self.record(key, result)
+        return result
+
+    # ------------------------------------------------------------------
+    # 페이지 단위 / 검색 결과
+    # ------------------------------------------------------------------
+
+    def page(self, key, page_key):
+        return self._pages.get((key, page_key))
+
+    def record_page(self, key, page_key, value):
+        self._pages[(key, page_key)] = value
+        self._append({'type': 'page', 'key': key, 'page': page_key, 'value': value})
+
+    def iter_search(self, search, key=''):
+        """
+        search()가 돌려준 (제목, 상품번호) 이터러블을 내보내고, 끝까지 받으면 저널에 기록
+
+        이미 끝까지 받은 key 검색 결과가 저널에 있으면 search를 호출하지 않고
+        (검색 요청 없이) 저널의 결과를 내보낸다. key는 검색이 여러 개인 작업
+        (여러 키워드 일괄 크롤링 등)에서 검색을 구분한다.
+        """
+        if key in self._searches:
+            yield from self._searches[key]
+            return
+        collected = []
+        for item in search():
+            collected.append(tuple(item))
+            yield item
+        if self.enabled:
+            self._searches[key] = collected
+            self._append({'type': 'search', 'key': key, 'items': collected})
+
+    # ------------------------------------------------------------------
+    # 출력 파일 (common.file_utils.CsvSink 이어 쓰기)
+    # ------------------------------------------------------------------
+
+    @property
+    def written(self):
+        """출력 파일에 확정된 상품 {상품 키: 그때까지의 행 수}"""
+        return self._written
+
+    @property
+    def written_rows(self):
+        """출력 파일에 확정된 행 수 (이어서 실행할 때 이 행까지만 남김)"""
+        return max(self._written.values(), default=0)
+
+    def record_written(self, key, rows):
+        """key 상품까지 출력 파일에 rows행을 내보냈음을 기록"""
+        if not self.enabled:
+            return
+        self._written[key] = rows
+        self._append({'type': 'output', 'key': key, 'rows': rows})
+
+    def resume_output(self, sink):
+        """
+        이어 쓰는 sink(CsvSink)를 저널에 확정된 행까지 되돌리고, 다시 내보내지 않을 상품을 돌려줌
+
+        파일에 확정된 행보다 적은 행이 있으면 (새 파일 등) 파일을 비우고 처음부터
+        다시 쓴다 (끝난 상품은 저널의 결과로, 요청 없이).
+        """
+        if not self.enabled:
+            return {}
+        if sink.resumed_rows >= self.written_rows:
+            sink.rewind(self.written_rows)
+            return dict(self._written)
+        sink.rewind(0)
+        return {}
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def checkpointed_page(page_key, fetch, complete=None):
+    """
+    현재 상품(JobJournal.product 범위)의 page_key 페이지 결과를 재사용하거나 기록
+
+    상품 범위 밖이면 fetch()를 그대로 호출한다. 결과는 JSON으로 기록되므로
+    저널에서 읽은 튜플은 리스트로 돌아온다 (언패킹은 그대로 동작).
+    complete(value)가 False인 결과 (일부만 읽은 페이지 등)는 기록하지 않는다.
+    page_key는 페이지를 가리키는 값으로만 만들어야 호출 방식이 달라도
+    (동기/비동기 파이프라인 등) 같은 저널을 재사용할 수 있다.
+    """
+    scope = _current_product.get()
+    if scope is None:
+        return fetch()
+    value = scope.journal.page(scope.key, page_key)
+    if value is None:
+        try:
+            value = fetch()
+        except Exception:
+            scope.failed = True
+            raise
+        if complete is None or complete(value):
+            scope.journal.record_page(scope.key, page_key, value)
+    return value
@@ -0,0 +1,225 @@
+"""
+적응형 동시성 제어 공통 유틸리티
+
+호스트별 AIMD(가산 증가 / 곱셈 감소) 컨트롤러
+- p95 지연시간이 기준선 근처로 유지되면 동시 요청 한도를 1씩 올림
+- 429/5xx 응답, 타임아웃, 지연시간 급증이 보이면 한도를 절반으로 줄임
+- 현재 한도와 최근 결정 내역을 snapshot()으로 확인 가능
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+
+# 기본 설정
+INITIAL_LIMIT = 4
+MIN_LIMIT = 1
+MAX_LIMIT = 8            # common.http_utils.MAX_CONNECTIONS_PER_HOST와 맞춤
+WINDOW_SIZE = 20         # p95 계산에 쓰는 성공 응답 수
+LATENCY_TOLERANCE = 1.5  # p95 <= 기준선 * 1.5 이면 "평탄"
+SPIKE_FACTOR = 2.5       # p95 > 기준선 * 2.5 이면 "급증"
+BACKOFF = 0.5            # 감소 시 곱하는 비율
+
+
+def percentile(values, pct):
+    """최근접 순위(nearest-rank) 방식 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class _Slot:
+    """한 요청이 차지한 동시성 슬롯"""
+
+    def __init__(self, controller):
+        self.controller = controller
+        self.started = controller.clock()
+        self._reported = False
+
+    def success(self, status_code=200):
+        """응답 수신: 429/5xx는 과부하 신호로 처리"""
+        if self._reported:
+            return
+        self._reported = True
+        latency = self.controller.clock() - self.started
+        if status_code == 429 or status_code >= 500:
+            self.controller.on_overload(self.started, f"http_{status_code}")
+        else:
+            self.controller.on_success(latency)
+
+    def failure(self, reason):
+        """타임아웃/연결 오류"""
+        if self._reported:
+            return
+        self._reported = True
+        self.controller.on_overload(self.started, reason)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD 동시성 컨트롤러 (스레드 안전)
+
+    slot() 컨텍스트 매니저로 요청을 감싸면 한도를 넘는 요청은 대기한다.
+
+        with controller.slot() as slot:
+            response = session.get(url)
+            slot.success(response.status_code)
+    """
+
+    def __init__(self, initial=INITIAL_LIMIT, min_limit=MIN_LIMIT, max_limit=MAX_LIMIT,
+                 window=WINDOW_SIZE, tolerance=LATENCY_TOLERANCE, spike_factor=SPIKE_FACTOR,
+                 backoff=BACKOFF, history=50, clock=time.monotonic):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = max(min_limit, min(initial, max_limit))
+        self.window = window
+        self.tolerance = tolerance
+        self.spike_factor = spike_factor
+        self.backoff = backoff
+        self.clock = clock
+
+        self.in_flight = 0
+        self.baseline_p95 = None
+        self._latencies = []
+        self._last_decrease = float('-inf')
+        self.decisions = deque(maxlen=history)
+        self._cond = threading.Condition()
+
+    # ------------------------------------------------------------------
+    # 슬롯 획득/반납
+    # ------------------------------------------------------------------
+
+    def acquire(self):
+        with self._cond:
+            while self.in_flight >= self.limit:
+                self._cond.wait()
+            self.in_flight += 1
+        return _Slot(self)
+
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    class _SlotContext:
+        def __init__(self, controller):
+            self.controller = controller
+
+        def __enter__(self):
+            self.slot = self.controller.acquire()
+            return self.slot
+
+        def __exit__(self, exc_type, exc, tb):
+            if exc_type is not None:
+                self.slot.failure(exc_type.__name__)
+            self.controller.release()
+            return False
+
+    def slot(self):
+        """요청 하나를 감싸는 컨텍스트 매니저 (예외 발생 시 실패로 기록)"""
+        return self._SlotContext(self)
+
+    # ------------------------------------------------------------------
+    # 신호 처리
+    # ------------------------------------------------------------------
+
+    def _decide(self, action, new_limit, reason, p95=None):
+        old = self.limit
+        self.limit = max(self.min_limit, min(new_limit, self.max_limit))
+        self.decisions.append({
+            'time': time.time(),
+            'action': action,
+            'from': old,
+            'to': self.limit,
+            'reason': reason,
+            'p95': round(p95, 4) if p95 is not None else None,
+        })
+        self._cond.notify_all()
+
+    def _decrease(self, reason, p95=None):
+        self._last_decrease = self.clock()
+        self._latencies.clear()
+        self._decide('decrease', max(int(self.limit * self.backoff), self.min_limit), reason, p95)
+
+    def on_overload(self, started, reason):
+        """과부하 신호: 직전 감소 이후에 시작한 요청만 반영 (한 번의 혼잡에 한 번만 감소)"""
+        with self._cond:
+            if started < self._last_decrease:
+                return
+            self._decrease(reason)
+
+    def on_success(self, latency):
+        """성공 응답: 창이 차면 p95로 증가/감소 결정"""
+        with self._cond:
+            self._latencies.append(latency)
+            if len(self._latencies) < self.window:
+                return
+
+            p95 = percentile(self._latencies, 95)
+            self._latencies.clear()
+
+            if self.baseline_p95 is None:
+                self.baseline_p95 = p95
+                return
+
+            if p95 > self.baseline_p95 * self.spike_factor:
+                if self.limit <= self.min_limit:
+                    # 최소 한도에서도 느리다면 서버 자체가 느려진 것: 기준선을 다시 잡음
+                    self.baseline_p95 = p95
+                    return
+                self._decrease('latency_spike', p95)
+            elif p95 <= self.baseline_p95 * self.tolerance:
+                # 평탄한 구간의 p95로 기준선을 천천히 갱신
+                self.baseline_p95 = 0.8 * self.baseline_p95 + 0.2 * p95
+                if self.limit < self.max_limit:
+                    self._decide('increase', self.limit + 1, 'latency_flat', p95)
+
+    def snapshot(self):
+        """현재 한도, 처리 중 요청 수, 기준선, 최근 결정"""
+        with self._cond:
+            return {
+                'limit': self.limit,
+                'in_flight': self.in_flight,
+                'baseline_p95': round(self.baseline_p95, 4) if self.baseline_p95 is not None else None,
+                'decisions': list(self.decisions),
+            }
+
+
+class ConcurrencyRegistry:
+    """호스트별 컨트롤러 모음"""
+
+    def __init__(self, **defaults):
+        self.defaults = defaults
+        self._controllers = {}
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            controller = self._controllers.get(host)
+            if controller is None:
+                controller = self._controllers[host] = AdaptiveConcurrency(**self.defaults)
+            return controller
+
+    def configure(self, host, **options):
+        """호스트의 컨트롤러를 새 설정으로 교체"""
+        with self._lock:
+            self._controllers[host] = AdaptiveConcurrency(**{**self.defaults, **options})
+
+    def snapshot(self):
+        with self._lock:
+            controllers = dict(self._controllers)
+        return {host: controller.snapshot() for host, controller in controllers.items()}
+
+
+concurrency_controllers = ConcurrencyRegistry()
+
+
+def get_concurrency_stats():
+    """호스트별 동시성 컨트롤러 상태"""
+    return concurrency_controllers.snapshot()
@@ -4,8 +4,18 @@
 
 import csv
 import re
+import threading
+import time
 from pathlib import Path
 
+# CsvSink 기본 플러시 간격 (행 수 / 초, 둘 중 먼저 닿는 쪽)
+SINK_FLUSH_ROWS = 200
+SINK_FLUSH_SECONDS = 5.0
+
+
+class CsvSchemaError(ValueError):
+    """이어서 쓸 CSV의 헤더가 선언한 열과 다름"""
+
 
 def save_to_csv(data, filename, output_dir="./results"):
     """
@@ -41,6 +51,161 @@ def save_to_csv(data, filename, output_dir="./results"):
     return {'status': 'success', 'filepath': str(filepath), 'message': 'File saved successfully'}
 
 
+def _intact_size(filepath, fields, max_rows=None):
+    """
+    filepath CSV에서 헤더와 끝까지 기록된 행들의 바이트 길이, 행 수
+
+    헤더가 fields와 다르면 CsvSchemaError. 기록 중에 멈춰 잘린 마지막 행
+    (줄바꿈 없이 끝나거나 따옴표 안에서 끝난 행)은 길이에 넣지 않는다.
+    max_rows를 주면 앞의 max_rows행까지만 센다.
+    파일 전체를 읽어 들이지 않고 한 줄씩 확인한다.
+    """
+    consumed = 0
+
+    def lines():
+        nonlocal consumed
+        with open(filepath, 'rb') as f:
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    return
+                consumed += len(raw)
+                yield raw.decode('utf-8')
+
+    size, rows = 0, -1
+    reader = csv.reader(lines(), strict=True)
+    try:
+        for row in reader:
+            if max_rows is not None and rows >= max_rows:
+                break
+            if rows < 0:
+                if row and row[0].startswith('\ufeff'):
+                    row[0] = row[0][1:]
+                if row != list(fields):
+                    raise CsvSchemaError(f"CSV 헤더가 다릅니다: {filepath} (파일 {row}, 지금 {list(fields)})")
+            elif len(row) != len(fields):
+                break
+            size, rows = consumed, rows + 1
+    except (csv.Error, UnicodeDecodeError):
+        pass
+    return size, max(rows, 0)
+
+
+class CsvSink:
+    """
+    행을 받는 대로 CSV 파일에 이어 쓰는 저장소 (스레드 안전)
+
+    save_to_csv와 달리 전체 데이터를 메모리에 모으지 않는다. 헤더는 선언한
+    fields로 처음에 한 번 쓰고 (fields에 없는 키는 무시), flush_rows행 또는
+    flush_seconds초마다 파일에 내보내므로 실행 중에도 그때까지의 결과를 열어
+    볼 수 있다.
+
+    resume=True면 같은 파일에 이어서 쓴다. 헤더가 fields와 같아야 하고
+    (다르면 CsvSchemaError), 중단될 때 잘린 마지막 행은 잘라내고 이어 쓴다.
+    이미 있던 행 수는 resumed_rows. 작업 저널로 이어서 실행할 때는 저널에
+    확정된 행까지만 남기도록 rewind()를 쓴다.
+
+    닫을 때 행이 하나도 없으면 (헤더만 있는) 파일은 지운다.
+
+        with CsvSink("reviews.csv", REVIEW_COLUMNS) as sink:
+            for review in iter_search_reviews(keyword):
+                sink.write(review)
+    """
+
+    def __init__(self, filename, fields, output_dir="./results", resume=False,
+                 flush_rows=SINK_FLUSH_ROWS, flush_seconds=SINK_FLUSH_SECONDS):
+        self.fields = list(fields)
+        self.filepath = Path(output_dir) / filename
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.resumed_rows = 0
+        self.count = 0  # 이번 실행에서 쓴 행 수
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._result = None
+
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        size = 0
+        if resume and self.filepath.exists():
+            size, self.resumed_rows = _intact_size(self.filepath, self.fields)
+            with open(self.filepath, 'r+b') as f:
+                f.truncate(size)
+        self._file = open(self.filepath, 'a' if size else 'w', encoding='utf-8-sig', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fields, extrasaction='ignore')
+        if not size:
+            self._writer.writeheader()
+            self._file.flush()
+
+    def write(self, row):
+        self.write_rows((row,))
+
+    def write_rows(self, rows):
+        with self._lock:
+            for row in rows:
+                self._writer.writerow(row)
+                self.count += 1
+                self._pending += 1
+            if (self._pending >= self.flush_rows
+                    or time.monotonic() - self._last_flush >= self.flush_seconds):
+                self._flush()
+
+    @property
+    def rows(self):
+        """파일의 행 수 (이어 쓴 행 포함)"""
+        return self.resumed_rows + self.count
+
+    def _flush(self):
+        self._file.flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        """쓴 행을 파일로 내보내고 파일의 행 수를 돌려줌"""
+        with self._lock:
+            self._flush()
+            return self.rows
+
+    def rewind(self, rows):
+        """
+        파일에 앞의 rows행만 남김 (쓰기 전에 호출)
+
+        이어 쓰는 파일에서 작업 저널에 확정되지 않은 행을 버릴 때 쓴다.
+        파일의 행이 rows보다 적으면 있는 행을 모두 남긴다.
+        """
+        with self._lock:
+            self._flush()
+            size, self.resumed_rows = _intact_size(self.filepath, self.fields, max_rows=rows)
+            self._file.truncate(size)
+            self._file.seek(0, 2)
+
+    def close(self):
+        """
+        남은 행을 내보내고 파일을 닫음
+
+        Returns:
+            dict: save_to_csv와 같은 형식 {'status', 'message', 'filepath'}
+                  (행이 없으면 파일을 지우고 status='error')
+        """
+        with self._lock:
+            if self._result is None:
+                self._file.close()
+                if not self.rows:
+                    # 헤더만 있는 파일은 남기지 않음 (save_to_csv도 빈 데이터는 저장하지 않음)
+                    self.filepath.unlink(missing_ok=True)
+                    self._result = {'status': 'error', 'message': 'No data to save'}
+                else:
+                    print(f"✓ 저장 완료: {self.filepath} ({self.rows}행)")
+                    self._result = {'status': 'success', 'filepath': str(self.filepath),
+                                    'message': 'File saved successfully'}
+            return self._result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 def sanitize_filename(filename):
     """
     파일명에 사용할 수 없는 문자 제거
@@ -0,0 +1,261 @@
+"""
+HTML 파서 백엔드 공통 유틸리티
+
+모든 파싱 코드는 make_soup()으로 문서를 만들고 select / select_one /
+get_text(strip=True) / get(속성) 만 사용한다. 그래서 백엔드를 바꿔도
+추출 결과가 같다.
+
+백엔드:
+- 'html.parser' : BeautifulSoup + 표준 라이브러리 파서 (기본값, 추가 설치 불필요)
+- 'lxml'        : BeautifulSoup + lxml (pip install lxml)
+- 'selectolax'  : selectolax(lexbor) + BeautifulSoup 호환 어댑터 (pip install selectolax)
+
+선택 방법 (우선순위 순):
+- make_soup(content, backend='lxml')
+- set_parser_backend('lxml')
+- 환경 변수 HTML_PARSER_BACKEND=lxml
+
+부분 파싱: make_soup(content, scope=ParseScope(...))로 추출에 필요한 하위 트리만
+만든다 (html.parser / lxml). selectolax는 C 파서가 전체 트리를 만들므로 무시한다.
+"""
+
+import os
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import UnicodeDammit
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as _SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as _SelectolaxParser
+    except ImportError:
+        _SelectolaxParser = None
+
+
+PARSER_BACKENDS = ('html.parser', 'lxml', 'selectolax')
+DEFAULT_BACKEND = 'html.parser'
+BACKEND_ENV = 'HTML_PARSER_BACKEND'
+
+# BeautifulSoup의 get_text()가 건너뛰는 문자열을 담는 태그 (Script, Stylesheet 등)
+_NON_TEXT_TAGS = frozenset({'script', 'style', 'template', 'rt', 'rp'})
+
+# html.parser는 <textarea> 안을 마크업으로 파싱하지만 lxml/lexbor는 원문 텍스트로 둔다.
+# (Yes24 책 소개는 textarea 안에 HTML이 들어 있음) 같은 결과를 내려고 다시 파싱한다.
+_TEXTAREA_PATTERN = re.compile(rb'<textarea\b[^>]*>(.*?)</textarea\s*>', re.I | re.S)
+_SKIP_PATTERN = re.compile(rb'<!--.*?-->|<(script|style)\b.*?</\1\s*>', re.I | re.S)
+
+
+def available_backends():
+    """현재 환경에서 쓸 수 있는 백엔드 목록"""
+    backends = ['html.parser']
+    try:
+        import lxml  # noqa: F401
+        backends.append('lxml')
+    except ImportError:
+        pass
+    if _SelectolaxParser is not None:
+        backends.append('selectolax')
+    return backends
+
+
+def _check_backend(name):
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"알 수 없는 파서 백엔드: {name} (선택: {', '.join(PARSER_BACKENDS)})")
+    if name not in available_backends():
+        raise ValueError(f"설치되지 않은 파서 백엔드: {name}")
+    return name
+
+
+_backend = _check_backend(os.environ.get(BACKEND_ENV) or DEFAULT_BACKEND)
+
+
+def set_parser_backend(name):
+    """전역 파서 백엔드 설정 ('html.parser' / 'lxml' / 'selectolax')"""
+    global _backend
+    _backend = _check_backend(name)
+
+
+def get_parser_backend():
+    """현재 전역 파서 백엔드 이름"""
+    return _backend
+
+
+# ==============================================================================
+# 부분 파싱
+# ==============================================================================
+
+class ParseScope(SoupStrainer):
+    """
+    지정한 class 또는 속성을 가진 태그와 그 하위 트리만 만드는 SoupStrainer
+
+    classes: 이 중 하나라도 class에 있으면 포함
+    attrs: 이 중 하나라도 속성으로 가지고 있으면 포함
+
+    SoupStrainer의 class_ 규칙은 bs4 버전에 따라 파싱 중 여러 class를 가진 태그
+    ("reviewInfoGrp clearfix")를 놓치므로 원본 속성을 직접 비교한다.
+    """
+
+    def __init__(self, classes=(), attrs=()):
+        super().__init__()
+        self.scope_classes = frozenset(classes)
+        self.scope_attrs = tuple(attrs)
+
+    def matches_attrs(self, attrs):
+        if not attrs:
+            return False
+        if any(name in attrs for name in self.scope_attrs):
+            return True
+        classes = attrs.get('class')
+        if not classes:
+            return False
+        if isinstance(classes, str):
+            classes = classes.split()
+        return not self.scope_classes.isdisjoint(classes)
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return self.matches_attrs(attrs)
+
+    def allow_string_creation(self, string):
+        return False
+
+    def search_tag(self, markup_name=None, markup_attrs=None):
+        # bs4 4.13 이전 버전의 parse_only 인터페이스
+        return self.matches_attrs(markup_attrs)
+
+    def __repr__(self):
+        return f"ParseScope(classes={sorted(self.scope_classes)}, attrs={list(self.scope_attrs)})"
+
+
+# ==============================================================================
+# selectolax 어댑터
+# ==============================================================================
+
+class SelectolaxNode:
+    """selectolax 노드를 BeautifulSoup Tag처럼 쓰기 위한 얇은 래퍼"""
+
+    __slots__ = ('_node',)
+
+    def __init__(self, node):
+        self._node = node
+
+    def select(self, selector):
+        return [SelectolaxNode(node) for node in self._node.css(selector)]
+
+    def select_one(self, selector):
+        node = self._node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def get(self, name, default=None):
+        value = self._node.attributes.get(name, default)
+        return default if value is None else value
+
+    def get_text(self, separator='', strip=False):
+        """BeautifulSoup Tag.get_text()와 같은 결과 (주석, script/style 등 제외)"""
+        node = self._node
+        if node.css_first(','.join(_NON_TEXT_TAGS)) is None:
+            return node.text(deep=True, separator=separator, strip=strip)
+
+        parts = []
+        for child in node.traverse(include_text=True):
+            if child.tag != '-text' or _inside_non_text(child, node):
+                continue
+            text = child.text_content
+            if strip:
+                text = text.strip()
+                if not text:
+                    continue
+            parts.append(text)
+        return separator.join(parts)
+
+    @property
+    def name(self):
+        return self._node.tag
+
+    def __repr__(self):
+        return f"SelectolaxNode({self._node.tag})"
+
+
+def _inside_non_text(text_node, root):
+    parent = text_node.parent
+    while parent is not None:
+        if parent.tag in _NON_TEXT_TAGS:
+            return True
+        if parent == root:
+            return False
+        parent = parent.parent
+    return False
+
+
+def _textarea_sources(content):
+    """문서 순서대로 textarea 안의 원문 (주석/스크립트 안의 것은 제외)"""
+    return [m.group(1) for m in _TEXTAREA_PATTERN.finditer(_SKIP_PATTERN.sub(b'', content))]
+
+
+def _reparse_textareas_bs4(soup, content):
+    textareas = soup.find_all('textarea')
+    sources = _textarea_sources(content)
+    if len(textareas) != len(sources):
+        return
+    for textarea, source in zip(textareas, sources):
+        fragment = BeautifulSoup(source, 'html.parser', from_encoding=soup.original_encoding or 'utf-8')
+        textarea.clear()
+        for child in list(fragment.contents):
+            textarea.append(child.extract())
+
+
+def _reparse_textareas_selectolax(root, content):
+    textareas = root.css('textarea')
+    sources = _textarea_sources(content)
+    if len(textareas) != len(sources):
+        return
+    for textarea, source in zip(textareas, sources):
+        fragment = _SelectolaxParser(_decode(source)).body
+        for child in list(textarea.iter(include_text=True)):
+            child.remove()
+        for child in list(fragment.iter(include_text=True)):
+            textarea.insert_child(child)
+
+
+def _decode(content):
+    """selectolax용 문자열 변환 (BeautifulSoup과 같은 인코딩 판별)"""
+    if isinstance(content, str):
+        return content
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        return UnicodeDammit(content, is_html=True).unicode_markup
+
+
+# ==============================================================================
+# 문서 생성
+# ==============================================================================
+
+def make_soup(content, backend=None, scope=None):
+    """
+    HTML 문서 파싱
+
+    Args:
+        content: HTML (bytes 또는 str)
+        backend: 파서 백엔드 (None이면 전역 설정)
+        scope: ParseScope, 지정하면 일치하는 하위 트리만 만듦 (selectolax는 무시)
+
+    Returns:
+        BeautifulSoup 또는 SelectolaxNode (select / select_one / get_text / get 지원)
+    """
+    backend = backend or _backend
+    if backend == 'html.parser':
+        return BeautifulSoup(content, backend, parse_only=scope)
+
+    raw = content.encode('utf-8') if isinstance(content, str) else content
+    if backend == 'selectolax':
+        root = _SelectolaxParser(_decode(content)).root
+        if b'<textarea' in raw:
+            _reparse_textareas_selectolax(root, raw)
+        return SelectolaxNode(root)
+
+    soup = BeautifulSoup(content, backend, parse_only=scope)
+    if b'<textarea' in raw:
+        _reparse_textareas_bs4(soup, raw)
+    return soup
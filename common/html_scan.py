@@ -0,0 +1,80 @@
+"""
+DOM 없이 HTML 원문을 훑는 추출 유틸리티
+
+상품 목록처럼 (상품번호, 제목)만 필요한 페이지는 트리를 만들지 않고
+정규식으로 원문을 훑는다. 결과는 BeautifulSoup(html.parser)의
+get(속성) / get_text(strip=True)와 같게 맞춘다.
+
+가정이 깨지는 페이지(UTF-8이 아님, 중첩된 a 태그, 닫히지 않은 태그 등)에서는
+ScanFallback을 던진다. 호출자는 이때 트리 파싱(common.html_parser)으로 돌아간다.
+"""
+
+import html
+import re
+
+
+class ScanFallback(Exception):
+    """원문 훑기로는 트리 파싱과 같은 결과를 보장할 수 없는 페이지"""
+
+
+# 트리 파싱에서도 텍스트/태그로 보지 않는 구간
+_IGNORED = re.compile(r'<!--.*?-->|<(script|style)\b.*?</\1\s*>', re.I | re.S)
+_TAG = re.compile(r'</?[a-zA-Z][^>]*>')
+_START_TAG = re.compile(r'<([a-zA-Z][\w:-]*)([^>]*)>')
+_ATTR = re.compile(r'''([^\s=/>"']+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?''')
+
+
+def prepare(content):
+    """bytes를 str로 바꾸고 주석/script/style 구간 제거"""
+    if isinstance(content, bytes):
+        try:
+            content = content.decode('utf-8')
+        except UnicodeDecodeError:
+            raise ScanFallback("UTF-8이 아닌 문서")
+    return _IGNORED.sub('', content)
+
+
+def parse_attrs(attr_text):
+    """시작 태그의 속성 문자열을 dict로 (이름 소문자, 값은 엔티티 해석, 값 없으면 '')"""
+    attrs = {}
+    for name, double, single, bare in _ATTR.findall(attr_text):
+        attrs[name.lower()] = html.unescape(double or single or bare)
+    return attrs
+
+
+def has_class(attrs, name):
+    return name in attrs.get('class', '').split()
+
+
+def iter_start_tags(text, tag=None, start=0, end=None):
+    """[start, end) 구간의 시작 태그를 (match, attrs)로 순회 (tag 지정 시 그 태그만)"""
+    end = len(text) if end is None else end
+    for match in _START_TAG.finditer(text, start, end):
+        if tag is None or match.group(1).lower() == tag:
+            yield match, parse_attrs(match.group(2))
+
+
+def element_end(text, tag, pos):
+    """
+    pos(시작 태그 바로 뒤)에서 시작한 tag 요소가 닫히는 위치
+
+    같은 이름의 중첩 태그를 세어 짝이 맞는 닫는 태그의 시작 위치를 반환하고,
+    끝까지 닫히지 않으면 len(text)를 반환한다.
+    """
+    pattern = re.compile(rf'<(/?){tag}\b[^>]*>', re.I)
+    depth = 1
+    for match in pattern.finditer(text, pos):
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            return match.start()
+    return len(text)
+
+
+def text_content(fragment):
+    """마크업 조각의 get_text(strip=True) 결과 (태그 사이 문자열마다 strip 후 연결)"""
+    parts = []
+    for piece in _TAG.split(fragment):
+        piece = html.unescape(piece).strip()
+        if piece:
+            parts.append(piece)
+    return ''.join(parts)
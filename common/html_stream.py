@@ -0,0 +1,111 @@
+"""
+HTML 점진 파싱 공통 유틸리티
+
+응답 본문을 내려받는 대로 표준 라이브러리 HTMLParser에 넣고, ParseScope에
+일치하는 요소가 닫히는 즉시 그 요소의 원문 조각을 내보낸다.
+호출자가 필요한 만큼 받았으면 순회를 멈추고 나머지 다운로드를 버릴 수 있다.
+
+    for fragment in iter_fragments(response.iter_content(8192), REVIEW_PAGE_SCOPE):
+        soup = make_soup(fragment)
+        ...
+"""
+
+import bisect
+import codecs
+from html.parser import HTMLParser
+
+
+class _FragmentCollector(HTMLParser):
+    """scope에 일치하는 최상위 요소의 원문 조각을 모으는 파서"""
+
+    def __init__(self, scope):
+        super().__init__(convert_charrefs=False)
+        self.scope = scope
+        self.text = ''
+        self.line_starts = [0]  # 줄 시작 위치 (절대 위치, 앞에서 버린 줄은 제외)
+        self._lines_dropped = 0
+        self.completed = []
+        self._tag = None      # 수집 중인 요소 태그 이름
+        self._depth = 0       # 수집 중인 요소와 같은 이름의 열린 태그 수
+        self._start = 0       # 수집 중인 요소의 시작 위치
+        self._consumed = 0    # 완료된 조각을 잘라낸 뒤 버린 앞부분 길이
+
+    def push(self, chunk):
+        # getpos()의 (줄, 열)을 절대 위치로 바꾸기 위해 줄 시작 위치를 기록
+        base = self._consumed + len(self.text)
+        position = chunk.find('\n')
+        while position != -1:
+            self.line_starts.append(base + position + 1)
+            position = chunk.find('\n', position + 1)
+        self.text += chunk
+        self.feed(chunk)
+
+    def _offset(self):
+        line, column = self.getpos()
+        return self.line_starts[line - 1 - self._lines_dropped] + column
+
+    def _drop(self, length):
+        """이미 처리한 앞부분 length 글자를 버림 (메모리 절약)"""
+        if length <= 0:
+            return
+        self._consumed += length
+        self.text = self.text[length:]
+        # 버린 위치가 속한 줄의 시작은 남겨야 getpos()를 계속 변환할 수 있음
+        lines = bisect.bisect_right(self.line_starts, self._consumed) - 1
+        if lines > 0:
+            del self.line_starts[:lines]
+            self._lines_dropped += lines
+
+    def handle_starttag(self, tag, attrs):
+        if self._tag is None:
+            if self.scope.matches_attrs({name: value or '' for name, value in attrs}):
+                self._tag = tag
+                self._depth = 1
+                self._start = self._offset()
+        elif tag == self._tag:
+            self._depth += 1
+
+    def handle_endtag(self, tag):
+        if self._tag is None or tag != self._tag:
+            return
+        self._depth -= 1
+        if self._depth:
+            return
+
+        start = self._start - self._consumed
+        end = self.text.index('>', self._offset() - self._consumed) + 1
+        self.completed.append(self.text[start:end])
+        self._tag = None
+        self._drop(end)
+
+    def trim(self):
+        """수집 중인 요소가 없으면 이미 처리한 앞부분을 버림"""
+        if self._tag is None:
+            # HTMLParser가 아직 처리하지 않은 부분(self.rawdata)은 남김
+            self._drop(len(self.text) - len(self.rawdata))
+
+
+def iter_fragments(chunks, scope, encoding=None):
+    """
+    바이트 조각을 순서대로 파싱하며 scope에 일치하는 요소의 원문 조각을 내보냄
+
+    Args:
+        chunks: bytes 이터러블 (예: response.iter_content(8192))
+        scope: common.html_parser.ParseScope
+        encoding: 본문 인코딩 (None이면 UTF-8)
+
+    Yields:
+        str: 요소 하나의 원문 (시작 태그부터 닫는 태그까지, 문서 순서대로)
+    """
+    decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+    collector = _FragmentCollector(scope)
+
+    for chunk in chunks:
+        collector.push(decoder.decode(chunk))
+        yield from collector.completed
+        collector.completed.clear()
+        collector.trim()
+
+    collector.push(decoder.decode(b'', final=True))
+    collector.close()
+    yield from collector.completed
@@ -0,0 +1,247 @@
+"""
+HTTP 응답 디스크 캐시
+
+자주 바뀌지 않는 페이지(도서 상세, 카테고리 목록)를 디스크에 보관한다.
+- 정규화된 URL을 키로 사용
+- URL 종류별 TTL (CACHE_TTL_RULES)
+- TTL이 지나면 ETag/Last-Modified로 조건부 요청 → 304면 본문 재사용
+- 전체 크기 상한을 넘으면 가장 오래 안 쓴 항목부터 삭제 (LRU)
+- 여러 프로세스가 같은 파일을 써도 되도록 WAL 모드 + 잠금 대기(BUSY_TIMEOUT)
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+DEFAULT_CACHE_PATH = "./.cache/http_cache.sqlite"
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # 200MB
+BUSY_TIMEOUT = 30  # 다른 프로세스가 쓰는 중이면 기다리는 시간 (초)
+
+# URL 종류별 TTL (초): 첫 번째로 일치하는 규칙 적용, 일치하지 않으면 캐시하지 않음
+CACHE_TTL_RULES = [
+    (re.compile(r'^https?://www\.yes24\.com/product/goods/\d+'), 7 * 24 * 3600),  # 도서 상세
+    (re.compile(r'^https?://www\.yes24\.com/product/category/'), 12 * 3600),      # 카테고리 목록
+]
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url):
+    """
+    캐시 키용 URL 정규화
+
+    - scheme/host 소문자, 기본 포트 제거, fragment 제거
+    - 쿼리 파라미터를 이름순 정렬
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or '/', query, ''))
+
+
+class CacheStats:
+    """캐시 사용 통계 (스레드 안전)"""
+
+    FIELDS = ('hits', 'revalidated', 'misses', 'stores', 'evictions')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def add(self, field, n=1):
+        with self._lock:
+            self._counts[field] += n
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._counts)
+
+    def since(self, before):
+        """before 스냅샷 이후 증가분"""
+        now = self.snapshot()
+        return {field: now[field] - before.get(field, 0) for field in self.FIELDS}
+
+
+cache_stats = CacheStats()
+
+
+def _build_response(url, status, headers, body):
+    """캐시 항목으로 requests.Response 생성"""
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = body
+    response.url = url
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response._content_consumed = True
+    response.from_cache = True
+    return response
+
+
+class ResponseCache:
+    """
+    SQLite 기반 응답 캐시 (스레드 안전)
+
+    path: 캐시 DB 파일 경로
+    max_bytes: 본문 총 크기 상한
+    rules: [(URL 정규식, TTL초), ...]
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES, rules=None):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.rules = CACHE_TTL_RULES if rules is None else rules
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _db(self):
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=BUSY_TIMEOUT, check_same_thread=False)
+            # 읽기와 쓰기가 서로 막지 않도록 (쓰기끼리는 timeout만큼 대기)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, status INTEGER, headers TEXT, body BLOB,"
+                " etag TEXT, last_modified TEXT, stored_at REAL, last_access REAL, size INTEGER)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON entries(last_access)")
+            self._conn.commit()
+        return self._conn
+
+    def ttl_for(self, url):
+        """URL에 적용할 TTL (캐시 대상이 아니면 None)"""
+        for pattern, ttl in self.rules:
+            if pattern.search(url):
+                return ttl
+        return None
+
+    def get(self, key):
+        with self._lock:
+            row = self._db().execute(
+                "SELECT status, headers, body, etag, last_modified, stored_at FROM entries WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        status, headers, body, etag, last_modified, stored_at = row
+        return {
+            'status': status,
+            'headers': json.loads(headers),
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': stored_at,
+        }
+
+    def put(self, key, response):
+        headers = dict(response.headers)
+        body = response.content
+        now = time.time()
+        with self._lock:
+            self._db().execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, response.status_code, json.dumps(headers), body,
+                 headers.get('ETag'), headers.get('Last-Modified'), now, now, len(body))
+            )
+            self._conn.commit()
+            self._evict()
+        cache_stats.add('stores')
+
+    def touch(self, key):
+        """304 응답 후 신선도 갱신"""
+        now = time.time()
+        with self._lock:
+            self._db().execute("UPDATE entries SET stored_at = ?, last_access = ? WHERE key = ?", (now, now, key))
+            self._conn.commit()
+
+    def _evict(self):
+        """크기 상한을 넘으면 LRU 순으로 삭제 (잠금 보유 상태에서 호출)"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall()
+        evicted = 0
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        self._conn.commit()
+        cache_stats.add('evictions', evicted)
+
+    def fetch(self, url, send, ttl):
+        """
+        캐시를 거쳐 URL 요청
+
+        Args:
+            url: 요청 URL
+            send: send(extra_headers) -> requests.Response, 실제 요청 함수
+            ttl: 신선도 유지 시간 (초)
+
+        Returns:
+            requests.Response (캐시에서 온 응답은 from_cache=True)
+        """
+        key = normalize_url(url)
+        entry = self.get(key)
+
+        if entry and time.time() - entry['stored_at'] < ttl:
+            cache_stats.add('hits')
+            return _build_response(url, entry['status'], entry['headers'], entry['body'])
+
+        conditional = {}
+        if entry:
+            if entry['etag']:
+                conditional['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                conditional['If-Modified-Since'] = entry['last_modified']
+
+        response = send(conditional)
+
+        if entry and response.status_code == 304:
+            cache_stats.add('revalidated')
+            self.touch(key)
+            return _build_response(url, entry['status'], entry['headers'], entry['body'])
+
+        cache_stats.add('misses')
+        if response.status_code == 200:
+            self.put(key, response)
+        return response
+
+
+_cache = None
+_cache_enabled = True
+_cache_lock = threading.Lock()
+
+
+def configure_cache(path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES, rules=None, enabled=True):
+    """전역 응답 캐시 설정 (enabled=False면 캐시 사용 안 함)"""
+    global _cache, _cache_enabled
+    with _cache_lock:
+        _cache = ResponseCache(path, max_bytes, rules)
+        _cache_enabled = enabled
+
+
+def get_cache():
+    """전역 응답 캐시 (비활성화 상태면 None)"""
+    global _cache
+    if not _cache_enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
@@ -1,8 +1,259 @@
 """
 HTTP 관련 공통 유틸리티
+
+모든 크롤러(Yes24, 교보문고)가 공유하는 HTTP 클라이언트
+- 프로세스 전역 커넥션 풀 (keep-alive, 호스트당 연결 수 제한)
+- 스레드별 세션 (쿠키는 스레드별, 커넥션 풀은 공유)
+- 기본 타임아웃 / 공통 헤더 적용
+- 호스트별 속도 제한 (common.rate_limit)
+- 호스트별 적응형 동시성 제한 (common.concurrency)
+- 재시도 / 서킷 브레이커 (common.retry)
+- 디스크 응답 캐시 (common.http_cache)
+- 원본 페이지 아카이브 기록 / replay (common.archive)
+- 연결 통계 (새 연결 vs 재사용, 받은 본문 크기)
 """
 
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .rate_limit import rate_limiter
+from .concurrency import concurrency_controllers
+from .retry import DEFAULT_RETRY_POLICY, RETRY_STATUS, RetryableHTTPError, call_with_retry, current_report
+from .http_cache import get_cache
+from .archive import get_archive
+
 # 공통 HTTP 헤더
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 }
+
+# 기본 타임아웃 (연결, 읽기) 초
+DEFAULT_TIMEOUT = (5, 10)
+
+# 커넥션 풀 설정
+MAX_HOSTS = 10            # 풀을 유지할 최대 호스트 수
+MAX_CONNECTIONS_PER_HOST = 8  # 호스트당 최대 동시 연결 수
+
+
+# ==============================================================================
+# 연결 통계
+# ==============================================================================
+
+class HttpStats:
+    """커넥션 풀 사용 통계 (스레드 안전, bytes는 네트워크로 받은 본문 크기)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.bytes = 0
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def record_bytes(self, n):
+        with self._lock:
+            self.bytes += n
+
+    def record_connection(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    @property
+    def connections_reused(self):
+        """재사용된 연결로 처리된 요청 수"""
+        return max(self.requests - self.connections_opened, 0)
+
+    def snapshot(self):
+        """현재 통계를 딕셔너리로 반환"""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'connections_opened': self.connections_opened,
+                'connections_reused': max(self.requests - self.connections_opened, 0),
+                'bytes': self.bytes,
+            }
+
+    def since(self, before):
+        """before 스냅샷 이후 증가분"""
+        now = self.snapshot()
+        return {field: now[field] - before.get(field, 0) for field in now}
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.connections_opened = 0
+            self.bytes = 0
+
+
+http_stats = HttpStats()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        http_stats.record_connection()
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        http_stats.record_connection()
+        return super()._new_conn()
+
+
+class PooledAdapter(HTTPAdapter):
+    """새 연결 수를 집계하고 호스트당 연결 수를 제한하는 어댑터"""
+
+    def __init__(self, pool_connections=MAX_HOSTS, pool_maxsize=MAX_CONNECTIONS_PER_HOST):
+        # pool_block=True: 호스트당 연결이 가득 차면 새 연결을 만들지 않고 대기
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=True)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CountingHTTPConnectionPool,
+            'https': _CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        http_stats.record_request()
+        return super().send(request, **kwargs)
+
+
+# ==============================================================================
+# 세션 풀
+# ==============================================================================
+
+# 모든 세션이 공유하는 어댑터 (= 공유 커넥션 풀)
+_adapter = PooledAdapter()
+_local = threading.local()
+
+
+def new_session(headers=None):
+    """
+    공유 커넥션 풀을 사용하는 새 세션 생성
+
+    Args:
+        headers: 기본 헤더(HEADERS)에 추가/덮어쓸 헤더 (optional)
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    if headers:
+        session.headers.update(headers)
+    session.mount('http://', _adapter)
+    session.mount('https://', _adapter)
+    return session
+
+
+def get_session():
+    """현재 스레드의 기본 세션 반환 (없으면 생성)"""
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = new_session()
+        _local.session = session
+    return session
+
+
+def _record_transfer(requests=0, size=0):
+    """받은 본문 크기를 전역 통계와 현재 FetchReport에 기록"""
+    http_stats.record_bytes(size)
+    report = current_report()
+    if report:
+        report.add(requests=requests, bytes=size)
+
+
+def _send(session, url, timeout, **kwargs):
+    """속도 제한 + 동시성 한도 안에서 요청 1회 전송"""
+    rate_limiter.acquire(url)
+    with concurrency_controllers.get(url).slot() as slot:
+        response = session.get(url, timeout=timeout, **kwargs)
+        slot.success(response.status_code)
+    # stream 요청의 본문은 iter_body()로 읽으면서 기록
+    _record_transfer(requests=1, size=0 if kwargs.get('stream') else len(response.content))
+    if response.status_code in RETRY_STATUS:
+        raise RetryableHTTPError(response)
+    return response
+
+
+def http_get(url, session=None, timeout=DEFAULT_TIMEOUT, retry=DEFAULT_RETRY_POLICY, cache=True, **kwargs):
+    """
+    공유 커넥션 풀을 통한 GET 요청
+
+    요청 전에 호스트별 속도 제한 토큰을 얻고, 적응형 동시성 한도 안에서
+    요청한다. 응답 상태/지연시간/예외는 동시성 컨트롤러에 보고된다.
+    타임아웃/연결 오류/429/5xx는 retry 정책에 따라 재시도한다.
+    캐시 규칙에 해당하는 URL은 디스크 캐시를 거친다 (common.http_cache).
+    아카이브가 'record' 모드면 가져온 본문을 저장하고, 'replay' 모드면
+    네트워크 없이 아카이브에서 응답한다 (common.archive).
+
+    Args:
+        url: 요청 URL
+        session: 사용할 세션 (None이면 스레드 기본 세션)
+        timeout: 타임아웃 (기본: DEFAULT_TIMEOUT)
+        retry: RetryPolicy (None이면 재시도/서킷 브레이커 없이 1회 요청)
+        cache: False면 응답 캐시를 사용하지 않음
+        **kwargs: requests.Session.get에 전달할 추가 인자
+
+    Returns:
+        requests.Response
+
+    Raises:
+        RetryableHTTPError: 재시도 후에도 429/5xx 응답
+        CircuitOpenError: 호스트 서킷이 열려 있음
+        ArchiveMissError: replay 모드인데 아카이브에 없는 URL
+    """
+    archive, archive_mode = get_archive()
+    if archive_mode == 'replay':
+        return archive.replay(url)
+
+    session = session or get_session()
+    if archive_mode == 'record':
+        # 아카이브에는 본문 전체를 남겨야 하므로 내려받다 멈추는 stream 요청을 쓰지 않음
+        kwargs.pop('stream', None)
+
+    def send(extra_headers=None):
+        request_kwargs = kwargs
+        if extra_headers:
+            request_kwargs = {**kwargs, 'headers': {**kwargs.get('headers', {}), **extra_headers}}
+        if retry is None:
+            response = _send(session, url, timeout, **request_kwargs)
+        else:
+            response = call_with_retry(lambda: _send(session, url, timeout, **request_kwargs), url, policy=retry)
+        return response
+
+    response_cache = get_cache() if cache and not kwargs.get('stream') else None
+    ttl = response_cache.ttl_for(url) if response_cache else None
+    if ttl is None:
+        response = send()
+    else:
+        response = response_cache.fetch(url, send, ttl)
+
+    # 캐시 적중/304 재검증으로 받은 본문도 기록해야 replay에서 찾을 수 있음
+    if archive_mode == 'record' and response.status_code == 200:
+        archive.record(url, response.content, response.headers.get('Content-Type', ''))
+    return response
+
+
+def iter_body(response, chunk_size):
+    """
+    stream=True 응답 본문을 chunk_size 조각으로 순회 (받은 크기를 통계에 기록)
+
+    아카이브 replay처럼 네트워크를 거치지 않은 응답은 기록하지 않는다.
+    """
+    from_network = response.raw is not None
+    for chunk in response.iter_content(chunk_size):
+        if from_network:
+            _record_transfer(size=len(chunk))
+        yield chunk
+
+
+def get_http_stats():
+    """연결 통계 스냅샷 반환"""
+    return http_stats.snapshot()
@@ -0,0 +1,55 @@
+"""
+JSON 디코딩 공통 유틸리티
+
+- loads(): orjson이 설치돼 있으면 orjson, 없으면 표준 json
+- iter_json_events(): ijson으로 바이트 조각을 받는 대로 파싱 (큰 응답용)
+
+    pip install orjson ijson  # 둘 다 선택 사항
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+JSON_BACKEND = 'orjson' if orjson else 'json'
+
+
+def loads(content):
+    """bytes/str JSON 디코딩 (orjson 우선)"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def streaming_available():
+    """iter_json_events()를 쓸 수 있는지 (ijson 설치 여부)"""
+    return ijson is not None
+
+
+def iter_json_events(chunks):
+    """
+    바이트 조각을 순서대로 파싱하며 ijson 이벤트를 내보냄
+
+    Args:
+        chunks: bytes 이터러블 (예: response.iter_content(65536))
+
+    Yields:
+        (prefix, event, value): 예) ('data.totalCount', 'number', 3)
+    """
+    events = ijson.sendable_list()
+    parser = ijson.parse_coro(events, use_float=True)
+    for chunk in chunks:
+        parser.send(chunk)
+        yield from events
+        del events[:]
+    parser.close()
+    yield from events
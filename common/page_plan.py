@@ -0,0 +1,110 @@
+"""
+리뷰 페이지 요청 계획 공통 유틸리티
+
+첫 응답에서 알게 된 정보(전체 리뷰 수, 마지막 페이지, 페이지당 리뷰 수)와
+호출자의 max_reviews로 꼭 필요한 페이지만 계산하고, 한 번에 동시에 요청한다.
+
+- plan_fixed_pages(): 페이지 크기가 고정인 경우 (Yes24)
+- plan_offset_pages(): 페이지 크기를 요청마다 정할 수 있는 경우 (교보문고 pageLimit)
+- fetch_batch(): 계획한 요청들을 동시에 보내고 결과를 계획 순서대로 반환
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+# fetch_batch 기본 동시 요청 수 (호스트별 속도/동시성 제한은 http_get이 따로 지킴)
+BATCH_WORKERS = 4
+
+
+def plan_fixed_pages(next_page, last_page, remaining, per_page):
+    """
+    페이지 크기가 고정일 때 remaining개를 채우는 데 필요한 페이지 범위
+
+    Args:
+        next_page: 아직 받지 않은 첫 페이지 번호
+        last_page: 마지막 페이지 번호
+        remaining: 더 필요한 리뷰 수 (None이면 마지막 페이지까지)
+        per_page: 페이지당 리뷰 수 (첫 페이지 기준)
+
+    Returns:
+        range: 요청할 페이지 번호 (필요 없으면 빈 range)
+    """
+    if remaining is None:
+        return range(next_page, last_page + 1)
+    if remaining <= 0:
+        return range(next_page, next_page)
+    needed = -(-remaining // max(per_page, 1))
+    return range(next_page, min(last_page, next_page - 1 + needed) + 1)
+
+
+def plan_offset_pages(offset, wanted, max_size):
+    """
+    offset번째 항목부터 wanted개를 받는 (page, 페이지 크기) 요청 목록
+
+    API가 page/pageLimit 방식이라 요청마다 offset = (page - 1) * size가
+    맞아떨어져야 한다. offset을 나누어떨어지게 하는 크기 중에서 요청 수가
+    가장 적고, 그다음으로 받는 항목 수가 가장 적은 크기를 고른다.
+    마지막 요청은 남은 개수를 덮는 가장 작은 크기로 줄인다.
+
+    Args:
+        offset: 이미 받은 항목 수
+        wanted: 더 받을 항목 수
+        max_size: API가 허용하는 최대 페이지 크기
+
+    Returns:
+        list: [(page, size), ...] (offset 순서)
+    """
+    if wanted <= 0:
+        return []
+
+    best = None
+    for size in range(1, max_size + 1):
+        if offset % size:
+            continue
+        count = -(-(offset + wanted) // size) - offset // size
+        key = (count, count * size)
+        if best is None or key < best[0]:
+            best = (key, size)
+    size = best[1]
+
+    first = offset // size
+    plan = [(page + 1, size) for page in range(first, first + best[0][0])]
+
+    tail_offset = (plan[-1][0] - 1) * size
+    tail = offset + wanted - tail_offset
+    tail_size = next(n for n in range(tail, size + 1) if tail_offset % n == 0)
+    plan[-1] = (tail_offset // tail_size + 1, tail_size)
+    return plan
+
+
+def fetch_batch(func, arg_list, max_workers=BATCH_WORKERS):
+    """
+    func(*args)들을 동시에 실행하고 결과를 arg_list 순서대로 내보냄
+
+    호출한 쪽의 컨텍스트(track_fetches 집계 등)를 그대로 이어받는다.
+    순회를 중간에 멈추면 아직 시작하지 않은 요청은 취소되고, 실패한 요청을
+    만나면 그 예외를 그대로 던진다 (앞선 결과는 이미 내보낸 상태).
+
+    Args:
+        func: 요청 함수
+        arg_list: 요청별 인자 튜플 리스트
+        max_workers: 최대 동시 요청 수
+
+    Yields:
+        func(*args)의 반환값
+    """
+    if len(arg_list) <= 1:
+        for args in arg_list:
+            yield func(*args)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(arg_list)))
+    try:
+        futures = [
+            executor.submit(contextvars.copy_context().run, func, *args)
+            for args in arg_list
+        ]
+        for future in futures:
+            yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
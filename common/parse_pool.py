@@ -0,0 +1,113 @@
+"""
+HTML 파싱 프로세스 풀
+
+BeautifulSoup 파싱은 CPU를 쓰고 GIL을 잡고 있어서, 요청을 스레드로 나눠도
+파싱은 코어 하나만 쓴다. 파싱 작업자 수를 설정하면 응답 본문(bytes)을
+ProcessPoolExecutor로 넘겨 파싱하고, 요청 스레드는 결과를 기다리는 동안
+GIL을 놓으므로 다른 스레드가 계속 요청을 보낼 수 있다.
+
+- 본문은 디코딩/복사 없이 response.content(bytes) 그대로 넘긴다
+- 파싱 함수는 모듈 최상위 함수여야 하고, 결과는 튜플 같은 작은 레코드로
+  돌려준다 (soup 같은 큰 객체를 프로세스 사이로 옮기지 않음)
+- 작업자 프로세스는 부모의 파서 백엔드(common.html_parser) 설정을 따른다
+
+설정 방법 (우선순위 순):
+- set_parse_workers(4)
+- 환경 변수 PARSE_WORKERS=4
+
+0(기본값)이면 풀 없이 호출한 스레드에서 바로 파싱한다.
+작업자는 spawn으로 시작하므로, 풀을 쓰는 스크립트는 실행 코드를
+if __name__ == "__main__": 아래에 두어야 한다.
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from .html_parser import get_parser_backend, set_parser_backend
+
+PARSE_WORKERS_ENV = 'PARSE_WORKERS'
+
+
+def _check_workers(value):
+    workers = int(value)
+    if workers < 0:
+        raise ValueError(f"파싱 작업자 수는 0 이상이어야 합니다: {value}")
+    return workers
+
+
+_workers = _check_workers(os.environ.get(PARSE_WORKERS_ENV) or 0)
+_pool = None
+_pool_backend = None
+_lock = threading.Lock()
+
+
+def _init_worker(backend):
+    set_parser_backend(backend)
+
+
+def _shutdown():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+atexit.register(_shutdown)
+
+
+def set_parse_workers(workers):
+    """파싱 작업자 프로세스 수 설정 (0이면 프로세스 풀을 쓰지 않음)"""
+    global _workers
+    with _lock:
+        _workers = _check_workers(workers)
+        _shutdown()
+
+
+def get_parse_workers():
+    """현재 파싱 작업자 프로세스 수"""
+    return _workers
+
+
+def _get_pool():
+    """설정에 맞는 프로세스 풀 (작업자 수가 0이면 None)"""
+    global _pool, _pool_backend
+    with _lock:
+        if not _workers:
+            return None
+        backend = get_parser_backend()
+        if _pool is not None and _pool_backend != backend:
+            # 파서 백엔드가 바뀌면 작업자를 새로 띄움
+            _shutdown()
+        if _pool is None:
+            # 요청 스레드가 도는 중에 fork하지 않도록 spawn으로 시작
+            _pool = ProcessPoolExecutor(
+                max_workers=_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(backend,),
+            )
+            _pool_backend = backend
+        return _pool
+
+
+def run_parse(func, content, *args):
+    """
+    func(content, *args)를 파싱 풀에서 실행하고 결과를 반환
+
+    작업자 수가 0이면 호출한 스레드에서 바로 실행한다.
+
+    Args:
+        func: 모듈 최상위 파싱 함수 (pickle 가능해야 함)
+        content: 응답 본문 bytes
+        *args: func에 넘길 추가 인자
+
+    Returns:
+        func의 반환값
+    """
+    pool = _get_pool()
+    if pool is None:
+        return func(content, *args)
+    return pool.submit(func, content, *args).result()
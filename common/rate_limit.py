@@ -0,0 +1,134 @@
+"""
+요청 속도 제한 공통 유틸리티
+
+호스트별 토큰 버킷으로 초당 요청 수(rate)와 순간 허용량(burst)을 제한한다.
+- 모든 스레드가 같은 버킷을 공유하므로 동시 요청에서도 호스트 예산이 지켜짐
+- 직전 요청이 오래 걸렸다면 그동안 토큰이 쌓이므로 추가 대기 없음
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+# 서점별 호스트
+STORE_HOSTS = {
+    'yes24': ('www.yes24.com',),
+    'kyobo': ('search.kyobobook.co.kr', 'product.kyobobook.co.kr'),
+}
+
+# 서점별 기본 속도 제한: (초당 요청 수, 버스트)
+STORE_RATE_LIMITS = {
+    'yes24': (2.0, 2),
+    'kyobo': (1.0, 2),
+}
+
+# 등록되지 않은 호스트의 기본 속도 제한
+DEFAULT_RATE_LIMIT = (2.0, 2)
+
+
+class TokenBucket:
+    """
+    토큰 버킷 (스레드 안전)
+
+    rate: 초당 채워지는 토큰 수 (None이면 제한 없음)
+    burst: 버킷 최대 용량
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.total_wait = 0.0
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self):
+        """
+        토큰 하나를 예약하고 기다려야 할 시간(초)을 반환
+
+        토큰이 모자라면 잔량을 음수로 만들어 순서를 예약하므로,
+        동시에 호출한 스레드들은 서로 겹치지 않는 시점에 깨어난다.
+        """
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            self.total_wait += wait
+            return wait
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기, 대기한 시간(초) 반환"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """호스트별 토큰 버킷 모음"""
+
+    def __init__(self, default=DEFAULT_RATE_LIMIT):
+        self.default = default
+        self._limits = {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host, rate, burst=1):
+        """호스트의 속도 제한 설정 (rate=None이면 제한 없음)"""
+        with self._lock:
+            self._limits[host] = (rate, burst)
+            self._buckets[host] = TokenBucket(rate, burst)
+
+    def bucket(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self._limits.get(host, self.default)
+                bucket = self._buckets[host] = TokenBucket(rate, burst)
+            return bucket
+
+    def acquire(self, url):
+        """URL의 호스트 예산에서 토큰 하나를 얻을 때까지 대기"""
+        host = urlsplit(url).hostname or ''
+        return self.bucket(host).acquire()
+
+    def snapshot(self):
+        """호스트별 설정과 누적 대기 시간"""
+        with self._lock:
+            return {
+                host: {
+                    'rate': bucket.rate,
+                    'burst': bucket.burst,
+                    'total_wait': round(bucket.total_wait, 3),
+                }
+                for host, bucket in self._buckets.items()
+            }
+
+
+rate_limiter = RateLimiter()
+
+
+def configure_store_rate_limit(store, rate, burst=1):
+    """
+    서점 단위 속도 제한 설정
+
+    Args:
+        store: 'yes24' 또는 'kyobo'
+        rate: 초당 요청 수 (None이면 제한 없음)
+        burst: 순간 허용 요청 수
+    """
+    for host in STORE_HOSTS[store]:
+        rate_limiter.configure(host, rate, burst)
+
+
+for _store, (_rate, _burst) in STORE_RATE_LIMITS.items():
+    configure_store_rate_limit(_store, _rate, _burst)
@@ -0,0 +1,303 @@
+"""
+재시도 / 서킷 브레이커 공통 유틸리티
+
+- 지수 백오프 + 지터 재시도 (Retry-After 헤더 우선, max_delay보다 길면 포기하고 서킷을 엶)
+- 호스트별 서킷 브레이커: 연속 실패가 쌓이면 일정 시간 요청을 보내지 않음
+- 상품 단위 결과 집계: track_fetches() 안에서 일어난 재시도/포기, 요청 수/받은 크기를 기록
+"""
+
+import contextvars
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class RetryableError(Exception):
+    """재시도하면 성공할 수도 있는 오류 (retry_after: 서버가 요청한 대기 시간)"""
+
+    retry_after = None
+
+
+class RetryableHTTPError(RetryableError, requests.HTTPError):
+    """재시도 대상 상태 코드(429/5xx) 응답"""
+
+    def __init__(self, response):
+        super().__init__(f"{response.status_code} 응답: {response.url}", response=response)
+        self.retry_after = parse_retry_after(response.headers.get('Retry-After'))
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 요청을 보내지 않음"""
+
+
+# 네트워크 수준에서 재시도할 예외
+RETRY_EXCEPTIONS = (RetryableError, requests.Timeout, requests.ConnectionError)
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 초 단위로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+# ==============================================================================
+# 재시도 정책
+# ==============================================================================
+
+class RetryPolicy:
+    """
+    지수 백오프 재시도 정책
+
+    max_attempts: 최초 요청을 포함한 최대 시도 횟수
+    base_delay: 첫 재시도 대기 시간의 상한 (초)
+    max_delay: 대기 시간 상한 (초, Retry-After가 이보다 길면 재시도하지 않음)
+    jitter: True면 [0, 백오프] 구간에서 무작위 대기 (full jitter)
+    """
+
+    def __init__(self, max_attempts=4, base_delay=0.5, max_delay=20.0, jitter=True):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempt, retry_after=None):
+        """
+        attempt번째 시도가 실패한 뒤 기다릴 시간
+
+        서버가 알려준 Retry-After가 max_delay보다 길면 None (재시도하지 않음).
+        """
+        backoff = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        if retry_after is not None:
+            # 서버가 알려준 시간보다 먼저 재시도하지 않음
+            if retry_after > self.max_delay:
+                return None
+            return max(retry_after, backoff)
+        return backoff
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+# ==============================================================================
+# 서킷 브레이커
+# ==============================================================================
+
+class CircuitBreaker:
+    """
+    호스트 하나의 서킷 브레이커 (스레드 안전)
+
+    closed → (연속 실패 failure_threshold회) → open
+    open → (reset_timeout초 경과) → half_open: 시험 요청 1개만 허용
+    half_open → 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = 'closed'
+        self.failures = 0
+        self._opened_at = 0.0
+        self._open_for = reset_timeout
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """지금 요청을 보내도 되는지"""
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open' and self.clock() - self._opened_at >= self._open_for:
+                self.state = 'half_open'
+                self._probing = False
+            if self.state == 'half_open' and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = 'closed'
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                self.state = 'open'
+                self._opened_at = self.clock()
+                self._open_for = self.reset_timeout
+                self._probing = False
+
+    def trip(self, duration):
+        """서버가 duration초 뒤에 다시 오라고 했을 때: 그동안(최소 reset_timeout) 서킷을 엶"""
+        with self._lock:
+            self.state = 'open'
+            self._opened_at = self.clock()
+            self._open_for = max(duration, self.reset_timeout)
+            self._probing = False
+
+
+class CircuitBreakerRegistry:
+    """호스트별 서킷 브레이커 모음"""
+
+    def __init__(self, **defaults):
+        self.defaults = defaults
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(**self.defaults)
+            return breaker
+
+    def snapshot(self):
+        with self._lock:
+            return {host: {'state': b.state, 'failures': b.failures} for host, b in self._breakers.items()}
+
+
+circuit_breakers = CircuitBreakerRegistry()
+
+
+# ==============================================================================
+# 상품 단위 결과 집계
+# ==============================================================================
+
+class FetchReport:
+    """track_fetches() 범위 안의 요청 결과 집계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.recovered = 0
+        self.abandoned = 0
+        self.requests = 0  # 실제로 보낸 요청 수 (캐시/replay 제외, 재시도 포함)
+        self.bytes = 0     # 네트워크로 받은 본문 크기
+
+    def add(self, retries=0, recovered=0, abandoned=0, requests=0, bytes=0):
+        with self._lock:
+            self.retries += retries
+            self.recovered += recovered
+            self.abandoned += abandoned
+            self.requests += requests
+            self.bytes += bytes
+
+    @property
+    def outcome(self):
+        """'ok' | 'recovered' (재시도 후 성공) | 'abandoned' (재시도 후에도 실패한 요청 있음)"""
+        if self.abandoned:
+            return 'abandoned'
+        if self.retries:
+            return 'recovered'
+        return 'ok'
+
+    def as_dict(self):
+        return {'outcome': self.outcome, 'retries': self.retries, 'requests': self.requests, 'bytes': self.bytes}
+
+
+_current_report = contextvars.ContextVar('fetch_report', default=None)
+
+
+@contextmanager
+def track_fetches():
+    """
+    범위 안에서 일어난 재시도/포기, 요청 수/받은 크기를 FetchReport로 집계
+
+        with track_fetches() as report:
+            reviews = get_reviews(...)
+        report.outcome  # 'ok' | 'recovered' | 'abandoned'
+    """
+    report = FetchReport()
+    token = _current_report.set(report)
+    try:
+        yield report
+    finally:
+        _current_report.reset(token)
+
+
+def current_report():
+    """현재 컨텍스트의 FetchReport (없으면 None)"""
+    return _current_report.get()
+
+
+# ==============================================================================
+# 재시도 실행
+# ==============================================================================
+
+def call_with_retry(func, url, policy=DEFAULT_RETRY_POLICY, retry_on=RETRY_EXCEPTIONS):
+    """
+    func()를 재시도 정책과 호스트 서킷 브레이커 아래에서 실행
+
+    Args:
+        func: 인자 없이 호출되는 요청 함수
+        url: 서킷 브레이커를 고를 URL
+        policy: RetryPolicy
+        retry_on: 재시도할 예외 타입들
+
+    Returns:
+        func()의 반환값
+
+    Raises:
+        CircuitOpenError: 서킷이 열려 있음
+        마지막 시도의 예외: 재시도 횟수 초과, 또는 Retry-After가 policy.max_delay보다 김
+                           (이때는 Retry-After 동안 호스트 서킷을 엶)
+    """
+    breaker = circuit_breakers.get(url)
+    report = current_report()
+    attempt = 0
+
+    while True:
+        attempt += 1
+        if not breaker.allow():
+            if report:
+                report.add(abandoned=1)
+            raise CircuitOpenError(f"서킷 열림: {urlsplit(url).hostname}")
+
+        try:
+            result = func()
+        except retry_on as e:
+            breaker.record_failure()
+            retry_after = getattr(e, 'retry_after', None)
+            wait = policy.delay(attempt, retry_after)
+            if wait is None:
+                # 서버가 요청한 대기가 너무 김: 일찍 재시도하지 않고 그동안 호스트 요청을 멈춤
+                breaker.trip(retry_after)
+            if wait is None or attempt >= policy.max_attempts:
+                if report:
+                    report.add(abandoned=1)
+                raise
+            if report:
+                report.add(retries=1)
+            time.sleep(wait)
+            continue
+        except Exception:
+            # 응답은 받았지만 처리 중 실패 (호스트 장애는 아님)
+            breaker.record_success()
+            raise
+
+        breaker.record_success()
+        if attempt > 1 and report:
+            report.add(recovered=1)
+        return result
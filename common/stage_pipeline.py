@@ -0,0 +1,231 @@
+"""
+단계별 파이프라인 공통 유틸리티
+
+검색 → 상세/리뷰 → 저장처럼 이어지는 작업을 크기가 정해진 큐로 연결한다.
+
+- source(예: 검색 결과 제너레이터)는 별도 스레드에서 순회하고, 상품이
+  나오는 즉시 다음 단계로 넘긴다 (검색이 끝나기를 기다리지 않음)
+- 단계마다 자체 작업 스레드 수(workers)를 가진다
+- 큐가 차면 앞 단계가 기다리고(backpressure), 동시에 처리 중인 항목 수도
+  max_in_flight로 제한하므로 상품 수와 무관하게 메모리가 일정하다
+- 마지막 단계(sink)는 호출한 스레드에서 결과를 순회하며 처리한다
+  (Streamlit 진행 표시처럼 호출 스레드에서만 해야 하는 작업용)
+
+    stages = [Stage('reviews', crawl_product, workers=4)]
+    for result in run_stages(iter_search_products(keyword), stages):
+        ...
+"""
+
+import contextvars
+import queue
+import threading
+
+# 큐 기본 크기 (단계 사이에 대기할 수 있는 항목 수)
+DEFAULT_QUEUE_SIZE = 8
+
+# 멈춤 신호를 확인하는 간격 (초)
+_POLL_INTERVAL = 0.1
+
+_DONE = object()
+_STOPPED = object()
+
+
+class Stage:
+    """
+    파이프라인 한 단계
+
+    name: 단계 이름 (스레드 이름에 사용)
+    func: 항목 하나를 받아 다음 단계로 넘길 결과 하나를 반환하는 함수
+    workers: 이 단계의 작업 스레드 수
+    """
+
+    def __init__(self, name, func, workers=1):
+        self.name = name
+        self.func = func
+        self.workers = workers
+
+
+class _Run:
+    """run_stages() 한 번의 실행 상태 (멈춤 신호, 오류, 큐)"""
+
+    def __init__(self, stage_count, queue_size, max_in_flight):
+        self.stop = threading.Event()
+        self.errors = []
+        self.queues = [queue.Queue(queue_size) for _ in range(stage_count + 1)]
+        self.slots = threading.Semaphore(max_in_flight)
+        self._lock = threading.Lock()
+
+    def fail(self, error):
+        with self._lock:
+            self.errors.append(error)
+        self.stop.set()
+
+    def put(self, q, item):
+        """q에 넣기 (가득 차면 기다림), 멈춤 신호를 받으면 False"""
+        while not self.stop.is_set():
+            try:
+                q.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(self, q):
+        """q에서 꺼내기, 멈춤 신호를 받으면 _STOPPED"""
+        while not self.stop.is_set():
+            try:
+                return q.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _STOPPED
+
+    def acquire_slot(self):
+        while not self.stop.is_set():
+            if self.slots.acquire(timeout=_POLL_INTERVAL):
+                return True
+        return False
+
+
+class SourceProgress:
+    """
+    source를 감싸 내보낸 항목 수를 세고, 진행 표시의 전체 수를 정함
+
+    source(검색 등)가 끝나기 전에는 estimate(예: max_products)와 지금까지 나온
+    항목 수 중 큰 값을, 끝난 뒤에는 실제로 나온 항목 수를 전체 수로 쓴다.
+    검색 결과가 estimate보다 적어도 마지막에는 100%가 된다.
+
+        progress = SourceProgress(iter_search_products(keyword), max_products)
+        for idx, result in enumerate(run_stages(progress, stages), 1):
+            progress.report(progress_callback, idx, message)
+        progress.finish(progress_callback)
+    """
+
+    def __init__(self, source, estimate=None):
+        self._source = source
+        self.estimate = estimate
+        self.count = 0
+        self.finished = False
+        self._last = None
+
+    def __iter__(self):
+        for item in self._source:
+            self.count += 1
+            yield item
+        self.finished = True
+
+    def total(self, done):
+        """done개를 처리했을 때의 전체 수"""
+        if self.finished:
+            return max(self.count, done)
+        return max(self.estimate or 0, self.count, done)
+
+    def report(self, callback, done, message):
+        """callback(done, 전체 수, message) 호출 (callback이 None이면 무시)"""
+        if callback is None:
+            return
+        total = self.total(done)
+        self._last = (done, total, message)
+        callback(done, total, message)
+
+    def finish(self, callback):
+        """모든 항목을 처리한 뒤 호출: 마지막 진행 표시가 전체 수에 못 미쳤으면 다시 알림"""
+        if callback is None or self._last is None:
+            return
+        done, total, message = self._last
+        if total != self.total(done):
+            callback(done, self.total(done), message)
+
+
+def _start_thread(name, target, *args):
+    # 호출한 쪽의 컨텍스트(track_fetches 집계 등)를 스레드마다 복사해서 이어받음
+    context = contextvars.copy_context()
+    thread = threading.Thread(target=context.run, args=(target, *args), name=name, daemon=True)
+    thread.start()
+    return thread
+
+
+def _feed(run, source):
+    """source를 순회하며 첫 번째 큐에 (순번, 항목)을 넣음"""
+    try:
+        for seq, item in enumerate(source):
+            if not run.acquire_slot() or not run.put(run.queues[0], (seq, item)):
+                return
+        run.put(run.queues[0], _DONE)
+    except Exception as e:
+        run.fail(e)
+
+
+def _work(run, stage, index, finished):
+    """index번째 단계의 작업 스레드 하나"""
+    inbox, outbox = run.queues[index], run.queues[index + 1]
+    try:
+        while True:
+            item = run.get(inbox)
+            if item is _STOPPED:
+                return
+            if item is _DONE:
+                # 같은 단계의 다른 스레드도 끝나도록 되돌려 놓음
+                run.put(inbox, _DONE)
+                break
+            seq, value = item
+            if not run.put(outbox, (seq, stage.func(value))):
+                return
+    except Exception as e:
+        run.fail(e)
+        return
+
+    # 이 단계의 마지막 스레드가 끝나면 다음 단계에 종료를 알림
+    with finished['lock']:
+        finished['count'] += 1
+        last = finished['count'] == stage.workers
+    if last:
+        run.put(outbox, _DONE)
+
+
+def run_stages(source, stages, queue_size=DEFAULT_QUEUE_SIZE, max_in_flight=None):
+    """
+    source의 항목을 stages 순서대로 처리하고 최종 결과를 source 순서대로 내보냄
+
+    Args:
+        source: 항목 이터러블 (별도 스레드에서 순회하므로 제너레이터면 지연 실행됨)
+        stages: Stage 리스트
+        queue_size: 단계 사이 큐 크기
+        max_in_flight: 동시에 파이프라인 안에 있을 수 있는 최대 항목 수
+                       (None이면 전체 작업 스레드 수 + queue_size)
+
+    Yields:
+        마지막 단계의 결과 (source 순서대로)
+
+    Raises:
+        source 순회나 단계 함수에서 난 첫 번째 예외 (나머지 작업은 멈춤)
+    """
+    if max_in_flight is None:
+        max_in_flight = sum(stage.workers for stage in stages) + queue_size
+    run = _Run(len(stages), queue_size, max_in_flight)
+
+    _start_thread('stage-source', _feed, run, source)
+    for index, stage in enumerate(stages):
+        finished = {'lock': threading.Lock(), 'count': 0}
+        for n in range(stage.workers):
+            _start_thread(f'stage-{stage.name}-{n}', _work, run, stage, index, finished)
+
+    # 순서가 앞선 항목이 끝날 때까지 먼저 끝난 결과를 보관
+    pending = {}
+    next_seq = 0
+    try:
+        while True:
+            item = run.get(run.queues[-1])
+            if item is _STOPPED or run.errors:
+                raise run.errors[0]
+            if item is _DONE:
+                break
+            seq, value = item
+            pending[seq] = value
+            while next_seq in pending:
+                value = pending.pop(next_seq)
+                next_seq += 1
+                run.slots.release()
+                yield value
+    finally:
+        # 중간에 멈추거나 오류가 나면 나머지 스레드도 멈춤 (진행 중인 요청은 끝까지 감)
+        run.stop.set()
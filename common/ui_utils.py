@@ -181,7 +181,7 @@ def render_search_results_selection(search_results, session_key_prefix):
 
 def crawl_selected_reviews(selected_goods_dict, max_reviews, review_crawler_func):
     """
-    선택된 상품들의 리뷰만 크롤링
+    선택된 상품들의 리뷰만 크롤링 (iter_selected_reviews 결과를 리스트로 반환)
 
     Args:
         selected_goods_dict: {제목: 상품번호} 딕셔너리
@@ -191,31 +191,45 @@ def crawl_selected_reviews(selected_goods_dict, max_reviews, review_crawler_func
     Returns:
         list: 수집된 리뷰 리스트
     """
-    all_reviews = []
-    total = len(selected_goods_dict)
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-
-    for idx, (title, goods_no) in enumerate(selected_goods_dict.items(), 1):
-        status_text.text(f"[{idx}/{total}] {title[:50]}... 리뷰 수집 중")
+    return list(iter_selected_reviews(selected_goods_dict, max_reviews, review_crawler_func))
 
-        try:
-            reviews = review_crawler_func(title, goods_no, max_reviews)
 
-            for review in reviews:
-                review['title'] = title
-                review['goods_no'] = goods_no
+def iter_selected_reviews(selected_goods_dict, max_reviews, review_crawler_func):
+    """
+    선택된 상품들의 리뷰를 하나씩 내보냄 (진행 표시줄 포함)
 
-            all_reviews.extend(reviews)
-        except Exception as e:
-            st.warning(f"⚠️ '{title[:30]}...' 리뷰 수집 실패: {str(e)}")
+    review_crawler_func가 제너레이터(iter_reviews, iter_kyobo_reviews 등)면
+    리뷰가 파싱되는 대로 내보내므로 결과 전체를 메모리에 모으지 않는다.
 
-        progress_bar.progress(idx / total)
+    Args:
+        selected_goods_dict: {제목: 상품번호} 딕셔너리
+        max_reviews: 상품당 최대 리뷰 수
+        review_crawler_func: 리뷰 크롤링 함수 (title, goods_no, max_reviews 인자를 받고
+                             리뷰 이터러블을 반환)
 
-    status_text.empty()
-    progress_bar.empty()
+    Yields:
+        dict: 리뷰 레코드 (title, goods_no 열 포함)
+    """
+    total = len(selected_goods_dict)
+    progress_bar = st.progress(0)
+    status_text = st.empty()
 
-    return all_reviews
+    try:
+        for idx, (title, goods_no) in enumerate(selected_goods_dict.items(), 1):
+            status_text.text(f"[{idx}/{total}] {title[:50]}... 리뷰 수집 중")
+
+            try:
+                for review in review_crawler_func(title, goods_no, max_reviews):
+                    review['title'] = title
+                    review['goods_no'] = goods_no
+                    yield review
+            except Exception as e:
+                st.warning(f"⚠️ '{title[:30]}...' 리뷰 수집 실패: {str(e)}")
+
+            progress_bar.progress(idx / total)
+    finally:
+        status_text.empty()
+        progress_bar.empty()
 
 
 def render_crawl_results(all_reviews, filename_prefix):
@@ -0,0 +1,129 @@
+"""
+증분 크롤링용 상품별 리뷰 최고 수위 (high-water mark)
+
+같은 상품 목록을 주기적으로 다시 크롤링할 때, 지난 실행에서 본 가장 최근
+리뷰를 상품마다 기록해 두고 다음 실행에서는 최신순으로 받다가 이미 본
+리뷰에 닿으면 멈춘다. 요청 수가 전체 리뷰 수가 아니라 새 리뷰 수에 비례한다.
+
+수위 (상품 하나):
+    {'date': 가장 최근 리뷰 날짜 (YYYY-MM-DD), 'hashes': [그 날짜 리뷰들의 내용 해시, ...]}
+
+날짜만으로는 같은 날 나중에 올라온 리뷰를 구분할 수 없으므로, 가장 최근
+날짜의 리뷰는 내용 해시로 본 것인지 확인한다.
+
+    marks = ReviewWatermarks("./yes24_watermarks.json")
+    reviews, _ = get_new_reviews(title, goods_no, marks.get('yes24', goods_no))
+    save(reviews)                               # 새 리뷰를 먼저 저장하고
+    marks.advance('yes24', goods_no, reviews)   # 저장한 리뷰로 수위를 올린 뒤
+    marks.commit()                              # 파일에 기록
+
+수위를 리뷰 저장보다 먼저 기록하면, 그 사이에 멈췄을 때 저장하지 못한 새
+리뷰를 다음 실행이 이미 본 리뷰로 여겨 영영 잃는다. 그래서 advance()는
+메모리에만 반영하고, 호출자가 리뷰를 저장한 뒤 commit()으로 기록한다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from itertools import takewhile
+from pathlib import Path
+
+
+def review_hash(review):
+    """리뷰 내용 해시 (작성자 + 내용)"""
+    text = f"{review.get('author') or ''}\n{review.get('content') or ''}"
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def is_seen(review, mark):
+    """최신순으로 받은 review가 mark 이전(지난 실행에서 본 리뷰)인지"""
+    if not mark:
+        return False
+    date = review.get('date') or ''
+    if date != mark['date']:
+        return date < mark['date']
+    return review_hash(review) in mark['hashes']
+
+
+def take_new(reviews, mark):
+    """최신순 reviews에서 mark 이전 리뷰가 나오기 전까지의 새 리뷰"""
+    return list(takewhile(lambda review: not is_seen(review, mark), reviews))
+
+
+def advance_mark(mark, new_reviews):
+    """
+    최신순 새 리뷰로 갱신한 수위 반환 (새 리뷰가 없으면 mark 그대로)
+
+    가장 최근 날짜가 지난 수위와 같으면 그 날짜의 해시를 합친다.
+    """
+    if not new_reviews:
+        return mark
+    newest = max(review.get('date') or '' for review in new_reviews)
+    hashes = [review_hash(review) for review in new_reviews if (review.get('date') or '') == newest]
+    if mark and mark['date'] == newest:
+        hashes = list(dict.fromkeys(hashes + mark['hashes']))
+    return {'date': newest, 'hashes': hashes}
+
+
+class ReviewWatermarks:
+    """
+    서점/상품별 수위 JSON 파일 (스레드 안전)
+
+    commit()/update()마다 파일 전체를 임시 파일에 쓰고 교체하므로, 실행이
+    중간에 멈춰도 그때까지 기록한 상품의 수위는 남는다. get()은 파일에
+    기록된 수위만 돌려준다 (advance()로 보류 중인 수위는 제외).
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._marks = {}
+        self._pending = {}  # {(서점, 상품번호): 기록 전 수위}
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._marks = json.load(f)
+
+    def get(self, store, goods_no):
+        """상품의 수위 (처음 보는 상품이면 None)"""
+        return self._marks.get(store, {}).get(str(goods_no))
+
+    @property
+    def pending(self):
+        """기록을 기다리는 상품 수"""
+        return len(self._pending)
+
+    def advance(self, store, goods_no, new_reviews):
+        """저장을 마친 새 리뷰로 상품의 수위를 올림 (commit() 전까지 파일에 기록하지 않음)"""
+        key = (store, str(goods_no))
+        with self._lock:
+            base = self._pending.get(key, self.get(store, goods_no))
+            mark = advance_mark(base, new_reviews)
+            if mark is not None and mark != self.get(store, goods_no):
+                self._pending[key] = mark
+
+    def commit(self):
+        """보류 중인 수위를 파일에 기록"""
+        with self._lock:
+            if not self._pending:
+                return
+            for (store, goods_no), mark in self._pending.items():
+                self._marks.setdefault(store, {})[goods_no] = mark
+            self._pending.clear()
+            self._write()
+
+    def update(self, store, goods_no, mark):
+        """mark를 바로 기록"""
+        if mark is None:
+            return
+        with self._lock:
+            self._marks.setdefault(store, {})[str(goods_no)] = mark
+            self._pending.pop((store, str(goods_no)), None)
+            self._write()
+
+    def _write(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._marks, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
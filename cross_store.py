@@ -0,0 +1,194 @@
+"""
+서점 통합 크롤러
+
+키워드 하나로 Yes24와 교보문고 리뷰를 동시에 수집한다. 두 서점은 호스트가
+달라 속도 제한/동시성 한도가 따로 적용되므로, 전체 시간은 두 서점 중
+오래 걸리는 쪽과 비슷하다.
+
+결과는 서점과 상관없이 UNIFIED_FIELDS 열로 맞추고 store 열로 구분한다.
+
+사용법:
+    python cross_store.py <키워드> [상품당 최대 리뷰 수] [최대 상품 수]
+"""
+
+import contextvars
+import queue
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+
+from common.file_utils import save_to_csv
+from common.http_utils import http_stats
+from yes24.pipeline import run_search_reviews as yes24_search_reviews
+from kyobo.pipeline import run_search_reviews as kyobo_search_reviews
+
+
+# 통합 리뷰 열 (서점별 열 이름 차이를 맞춤)
+UNIFIED_FIELDS = ('store', 'title', 'goods_no', 'rating', 'content', 'author', 'date')
+
+# 서점별 리뷰의 상품 제목 열
+TITLE_FIELDS = {
+    'yes24': 'product_title',
+    'kyobo': 'title',
+}
+
+
+def to_unified(store, review):
+    """서점별 리뷰 레코드 → UNIFIED_FIELDS 레코드"""
+    return {
+        'store': store,
+        'title': review.get(TITLE_FIELDS[store], ''),
+        'goods_no': review.get('goods_no', ''),
+        'rating': review.get('rating'),
+        'content': review.get('content', ''),
+        'author': review.get('author', ''),
+        'date': review.get('date', ''),
+    }
+
+
+def run_cross_store_reviews(keyword, max_products=10, max_reviews=10, yes24_order='RELATION', kyobo_order='',
+                            progress_callback=None):
+    """
+    키워드 검색 → Yes24/교보문고 리뷰 동시 크롤링 (핵심 로직)
+
+    서점마다 run_search_reviews를 별도 스레드에서 실행한다. 진행상황 콜백은
+    두 서점의 진행을 합쳐 호출한 스레드에서 호출된다.
+
+    Args:
+        keyword: 검색 키워드
+        max_products: 서점별 최대 상품 수
+        max_reviews: 상품당 최대 리뷰 수
+        yes24_order: Yes24 정렬 방식
+        kyobo_order: 교보문고 정렬 방식
+        progress_callback: 진행상황 콜백 함수 (optional)
+                         callback(current, total, message) 형식
+
+    Returns:
+        dict: {
+            'status': 'success' | 'error',
+            'message': str,
+            'data': list,  # 통합 리뷰 리스트 (UNIFIED_FIELDS, Yes24 → 교보문고 순서)
+            'count': int,
+            'summary': list,  # 상품별 요약 (store 열 추가)
+            'stores': dict,  # 서점별 결과 {store: {'status', 'message', 'count', 'elapsed'}}
+            'http': dict  # 이번 실행의 요청 수/받은 본문 크기 (두 서점 합계)
+        }
+    """
+    http_before = http_stats.snapshot()
+    runners = {
+        'yes24': lambda callback: yes24_search_reviews(
+            keyword, max_products=max_products, max_reviews=max_reviews,
+            order=yes24_order, progress_callback=callback
+        ),
+        'kyobo': lambda callback: kyobo_search_reviews(
+            keyword, max_products=max_products, max_reviews_per_book=max_reviews,
+            order=kyobo_order, progress_callback=callback
+        ),
+    }
+
+    # 작업 스레드의 진행 상황은 큐로 모아서 호출 스레드에서 콜백 호출
+    events = queue.Queue()
+    progress = {store: (0, max_products) for store in runners}
+
+    def report_progress(store, current, total, message):
+        progress[store] = (current, total)
+        if progress_callback:
+            current_sum = sum(done for done, _ in progress.values())
+            total_sum = sum(total for _, total in progress.values())
+            progress_callback(current_sum, max(total_sum, current_sum), f"[{store}] {message}")
+
+    def run_store(store):
+        start = time.monotonic()
+        result = runners[store](lambda current, total, message: events.put((store, current, total, message)))
+        return result, time.monotonic() - start
+
+    with ThreadPoolExecutor(max_workers=len(runners)) as executor:
+        futures = {
+            store: executor.submit(contextvars.copy_context().run, run_store, store)
+            for store in runners
+        }
+        while not all(future.done() for future in futures.values()) or not events.empty():
+            try:
+                report_progress(*events.get(timeout=0.1))
+            except queue.Empty:
+                continue
+
+    all_reviews = []
+    results_summary = []
+    stores = {}
+    for store, future in futures.items():
+        try:
+            result, elapsed = future.result()
+        except Exception as e:
+            result, elapsed = {'status': 'error', 'message': f'오류 발생: {str(e)}', 'data': [], 'count': 0, 'summary': []}, 0.0
+        stores[store] = {
+            'status': result['status'],
+            'message': result['message'],
+            'count': result['count'],
+            'elapsed': round(elapsed, 2),
+        }
+        all_reviews.extend(to_unified(store, review) for review in result['data'])
+        results_summary.extend({'store': store, **summary} for summary in result['summary'])
+
+    if all(row['status'] == 'error' for row in stores.values()):
+        return {
+            'status': 'error',
+            'message': ' / '.join(f"{store}: {row['message']}" for store, row in stores.items()),
+            'data': [],
+            'count': 0,
+            'summary': [],
+            'stores': stores
+        }
+
+    counts = ', '.join(f"{store} {row['count']}개" for store, row in stores.items())
+    return {
+        'status': 'success',
+        'message': f'{len(all_reviews)}개의 리뷰를 수집했습니다. ({counts})',
+        'data': all_reviews,
+        'count': len(all_reviews),
+        'summary': results_summary,
+        'stores': stores,
+        'http': http_stats.since(http_before)
+    }
+
+
+def main():
+    """CLI 인자로 실행"""
+    if len(sys.argv) < 2:
+        print("사용법: python cross_store.py <키워드> [상품당 최대 리뷰 수] [최대 상품 수]")
+        sys.exit(1)
+
+    keyword = sys.argv[1]
+    max_reviews = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    max_products = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+    print("=" * 60)
+    print(f"🔍 '{keyword}' Yes24 + 교보문고 동시 검색 중...")
+    print("=" * 60)
+
+    def progress_callback(current, total, message):
+        print(f"[{current}/{total}] {message}")
+
+    result = run_cross_store_reviews(keyword, max_products=max_products, max_reviews=max_reviews,
+                                     progress_callback=progress_callback)
+
+    for store, row in result.get('stores', {}).items():
+        print(f"   {store}: {row['message']} ({row['elapsed']}초)")
+
+    if result['status'] == 'error':
+        print(f"❌ {result['message']}")
+        sys.exit(1)
+
+    print(f"\n📊 {result['message']}")
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    save_to_csv(result['data'], f"cross_store_reviews_{keyword}_{timestamp}.csv")
+    save_to_csv(result['summary'], f"cross_store_summary_{keyword}_{timestamp}.csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,12 +15,14 @@ from .utils import (
 from .product_search import (
     build_search_url,
     get_goods_no,
+    iter_goods_no,
     ORDER_OPTIONS,
 )
 
 from .review_scraper import (
     build_review_api_url,
     get_kyobo_reviews,
+    iter_kyobo_reviews,
 )
 
 from .pipeline import (
@@ -38,11 +40,13 @@ __all__ = [
     # Product Search
     'build_search_url',
     'get_goods_no',
+    'iter_goods_no',
     'ORDER_OPTIONS',
 
     # Review Scraper
     'build_review_api_url',
     'get_kyobo_reviews',
+    'iter_kyobo_reviews',
 
     # Pipeline
     'run_search_reviews',
@@ -6,12 +6,13 @@
 """
 
 from .product_search import get_goods_no, ORDER_OPTIONS
-from .review_scraper import get_kyobo_reviews
+from .review_scraper import iter_kyobo_reviews
 from .utils import sanitize_filename, select_option
+from common.retry import track_fetches
+from common.file_utils import CsvSink
 import pandas as pd
 import os
 import sys
-import time
 from datetime import datetime
 
 # 저장 방식 옵션
@@ -21,10 +22,16 @@ SAVE_MODE_OPTIONS = {
 }
 
 
+# 리뷰 CSV 열 순서
+REVIEW_COLUMNS = ['goods_no', 'title', 'rating', 'content', 'author', 'date']
+
+
 def crawl_all_reviews(goods_dict, output_dir="./results", max_reviews_per_book=10, save_mode='individual'):
     """
     상품 목록에 대해 리뷰 크롤링
-    
+
+    리뷰는 받는 대로 CSV에 기록하므로 리뷰 수가 많아도 메모리에 모으지 않는다.
+
     goods_dict: {제목: 상품번호} 딕셔너리
     output_dir: 결과 저장 폴더
     max_reviews_per_book: 책당 최대 리뷰 수 (기본값: 10)
@@ -44,81 +51,53 @@ def crawl_all_reviews(goods_dict, output_dir="./results", max_reviews_per_book=1
     print("=" * 60)
     
     results_summary = []
-    all_reviews = []  # 통합 모드용
-    
-    for i, (title, goods_no) in enumerate(goods_dict.items(), 1):
-        print(f"\n[{i}/{len(goods_dict)}] {title}")
-        print("-" * 40)
-        
-        try:
-            # 리뷰 크롤링 (최대 개수 제한)
-            reviews = get_kyobo_reviews(title, goods_no, max_reviews=max_reviews_per_book)
-            
-            if reviews:
-                # 각 리뷰에 goods_no와 title 추가
-                for review in reviews:
-                    review['goods_no'] = goods_no
-                    review['title'] = title
-                
-                if save_mode == 'individual':
-                    # 개별 파일 저장
-                    filename = sanitize_filename(title)
-                    output_path = f"{output_dir}/{filename}.csv"
-                    
-                    df = pd.DataFrame(reviews)
-                    cols = ['goods_no', 'title', 'rating', 'content', 'author', 'date']
-                    df = df.reindex(columns=[c for c in cols if c in df.columns])
-                    df.to_csv(output_path, index=False, encoding="utf-8-sig")
-                    
-                    print(f"✓ {len(reviews)}개 리뷰 저장: {output_path}")
-                    results_summary.append({
-                        'title': title,
-                        'goods_no': goods_no,
-                        'review_count': len(reviews),
-                        'file': output_path
-                    })
-                else:
-                    # 통합 모드: 리스트에 추가
-                    all_reviews.extend(reviews)
-                    print(f"✓ {len(reviews)}개 리뷰 수집")
-                    results_summary.append({
-                        'title': title,
-                        'goods_no': goods_no,
-                        'review_count': len(reviews)
-                    })
-            else:
-                print(f"✗ 리뷰 없음")
-                results_summary.append({
-                    'title': title,
-                    'goods_no': goods_no,
-                    'review_count': 0,
-                    'file': None if save_mode == 'individual' else None
-                })
-            
-            # 서버 부하 방지를 위한 대기 (상품 간 2초)
-            time.sleep(2)
-            
-        except Exception as e:
-            print(f"✗ 에러 발생: {e}")
-            results_summary.append({
-                'title': title,
-                'goods_no': goods_no,
-                'review_count': -1,
-                'file': None if save_mode == 'individual' else None
-            })
-    
-    # 통합 모드: 모든 리뷰를 하나의 파일로 저장
-    if save_mode == 'merged' and all_reviews:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        merged_path = f"{output_dir}/reviews_{timestamp}.csv"
-        
-        df = pd.DataFrame(all_reviews)
-        cols = ['goods_no', 'title', 'rating', 'content', 'author', 'date']
-        df = df.reindex(columns=[c for c in cols if c in df.columns])
-        df.to_csv(merged_path, index=False, encoding="utf-8-sig")
-        
-        print(f"\n📁 통합 파일 저장: {merged_path}")
-    
+    merged = None  # 통합 모드: CsvSink - 첫 리뷰가 나오면 생성
+
+    try:
+        for i, (title, goods_no) in enumerate(goods_dict.items(), 1):
+            print(f"\n[{i}/{len(goods_dict)}] {title}")
+            print("-" * 40)
+
+            review_count = 0
+            output_path = None
+            with track_fetches() as report:
+                try:
+                    # 리뷰를 받는 대로 파일에 기록 (최대 개수 제한, 책 전체 리뷰를 메모리에 모으지 않음)
+                    # 리뷰가 없거나 중간에 실패해 빈 파일은 sink가 닫을 때 지움
+                    if save_mode == 'individual':
+                        with CsvSink(f"{sanitize_filename(title)}.csv", REVIEW_COLUMNS, output_dir) as sink:
+                            for review in iter_kyobo_reviews(title, goods_no, max_reviews=max_reviews_per_book):
+                                sink.write({**review, 'goods_no': goods_no, 'title': title})
+                        review_count = sink.count
+                        output_path = str(sink.filepath) if review_count else None
+                    else:
+                        for review in iter_kyobo_reviews(title, goods_no, max_reviews=max_reviews_per_book):
+                            if merged is None:
+                                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                                merged = CsvSink(f"reviews_{timestamp}.csv", REVIEW_COLUMNS, output_dir)
+                            merged.write({**review, 'goods_no': goods_no, 'title': title})
+                            review_count += 1
+
+                    if review_count:
+                        print(f"✓ {review_count}개 리뷰 수집")
+                    else:
+                        print(f"✗ 리뷰 없음")
+                    row = {'title': title, 'goods_no': goods_no, 'review_count': review_count}
+                    if save_mode == 'individual' or not review_count:
+                        row['file'] = output_path
+
+                except Exception as e:
+                    print(f"✗ 에러 발생: {e}")
+                    row = {'title': title, 'goods_no': goods_no, 'review_count': -1, 'file': None}
+
+            # 재시도 결과 (ok/recovered/abandoned) 기록
+            row.update(report.as_dict())
+            results_summary.append(row)
+    finally:
+        # 통합 모드: 모든 리뷰를 하나의 파일로 저장
+        if merged is not None:
+            merged.close()
+
     # 결과 요약
     print("\n" + "=" * 60)
     print("✅ 크롤링 완료!")
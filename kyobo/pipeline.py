@@ -5,27 +5,90 @@ Kyobo Crawler Main Script
 파이프라인: 키워드 검색 → 리뷰 크롤링
 """
 
-import time
 import sys
 from datetime import datetime
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from common.file_utils import save_to_csv
-from .product_search import get_goods_no, ORDER_OPTIONS
-from .review_scraper import get_kyobo_reviews
+from common.file_utils import save_to_csv, CsvSink
+from .product_search import get_goods_no, iter_goods_no, ORDER_OPTIONS
+from .review_scraper import get_kyobo_reviews, get_new_kyobo_reviews
 from .utils import select_option
+from common.retry import track_fetches
+from common.http_utils import http_stats
+from common.stage_pipeline import Stage, SourceProgress, run_stages
+from common.batch import SEARCH_WORKERS, run_batch
+from common.checkpoint import JobJournal
+from common.watermark import ReviewWatermarks
+
+
+# run_search_reviews에서 리뷰를 동시에 수집할 기본 상품 수
+REVIEW_WORKERS = 4
+
+# 리뷰 CSV 열 (CLI에서 CsvSink로 받는 대로 저장)
+REVIEW_COLUMNS = ('rating', 'content', 'author', 'date', 'goods_no', 'title')
 
 
 # =============================================================================
 # 핵심 로직 함수 (UI-agnostic) - app.py와 공유
 # =============================================================================
 
-def run_search_reviews(keyword, max_products=10, max_reviews_per_book=10, order='', progress_callback=None):
+def crawl_product_reviews(title, goods_no, max_reviews_per_book=10, marks=None):
+    """
+    상품 하나의 리뷰 수집 (run_search_reviews / run_batch_search_reviews 공용)
+
+    실패해도 예외를 던지지 않고 review_count=-1로 요약한다.
+    marks(common.watermark.ReviewWatermarks)를 주면 지난 실행 이후의 새 리뷰만
+    수집한다 (수위는 올리지 않음).
+
+    Returns:
+        tuple: (리뷰 리스트, 상품 요약 dict, 진행 메시지)
+    """
+    reviews = []
+    with track_fetches() as report:
+        try:
+            if marks is None:
+                reviews = get_kyobo_reviews(title, goods_no, max_reviews=max_reviews_per_book)
+                message = f"{title[:50]}... 리뷰 수집 완료"
+            else:
+                # 수위는 리뷰를 저장한 뒤 호출자가 올림 (ReviewWatermarks.advance)
+                reviews, _ = get_new_kyobo_reviews(
+                    title, goods_no, marks.get('kyobo', goods_no), max_reviews=max_reviews_per_book
+                )
+                message = f"{title[:50]}... 새 리뷰 {len(reviews)}개"
+
+            # 각 리뷰에 goods_no와 title 추가
+            for review in reviews:
+                review['goods_no'] = goods_no
+                review['title'] = title
+
+            review_count = len(reviews)
+
+        except Exception as e:
+            # 개별 상품 실패는 무시하고 계속 진행
+            review_count = -1
+            message = f"실패: {title[:30]}... - {str(e)[:50]}"
+
+    summary = {
+        'title': title,
+        'goods_no': goods_no,
+        'review_count': review_count,
+        **report.as_dict()
+    }
+    return reviews, summary, message
+
+
+def run_search_reviews(keyword, max_products=10, max_reviews_per_book=10, order='', progress_callback=None,
+                       workers=REVIEW_WORKERS, job_path=None, watermark_path=None, sink=None):
     """
     키워드 검색 → 리뷰 크롤링 (핵심 로직)
 
+    검색 결과의 상품마다 리뷰 수집을 workers개씩 동시에 진행한다
+    (common.stage_pipeline: 검색 → 리뷰 → 결과 취합).
+    진행상황 콜백은 상품이 끝날 때마다 호출 스레드에서 호출된다.
+    결과를 리스트로 모으지 않고 하나씩 받으려면 iter_search_reviews를 쓴다.
+
     Args:
         keyword: 검색 키워드
         max_products: 최대 상품 수
@@ -33,21 +96,61 @@ def run_search_reviews(keyword, max_products=10, max_reviews_per_book=10, order=
         order: 정렬 방식 ('qntt', 'date', 'kcont', 'krvgr', '' 등)
         progress_callback: 진행상황 콜백 함수 (optional)
                          callback(current, total, message) 형식
+        workers: 리뷰를 동시에 수집할 최대 상품 수
+        job_path: 작업 저널 경로 (optional, common.checkpoint)
+                  같은 경로로 다시 실행하면 끝난 상품/페이지는 다시 받지 않고 이어서 진행
+        watermark_path: 상품별 수위 파일 경로 (optional, common.watermark)
+                        주면 지난 실행 이후의 새 리뷰만 최신순으로 수집 (증분 크롤링)
+        sink: 리뷰를 받는 대로 기록할 common.file_utils.CsvSink (optional)
+              주면 리뷰를 data에 모으지 않고 sink에만 기록 (data는 빈 리스트)
+              watermark_path와 함께 주면 상품마다 sink를 flush한 뒤 수위를 기록
+              job_path와 함께 주면 (resume=True로 같은 파일을 열어) 중단된 뒤 이어서
+              실행할 때 저널에 확정된 행만 남기고 나머지 상품부터 이어 씀
 
     Returns:
         dict: {
             'status': 'success' | 'error',
             'message': str,
-            'data': list,  # 리뷰 리스트
+            'data': list,  # 리뷰 리스트 (증분 크롤링이면 새 리뷰만)
             'count': int,
-            'summary': list  # 상품별 요약 정보
+            'summary': list,  # 상품별 요약 정보 (review_count, outcome, retries, requests, bytes)
+            'http': dict,  # 이번 실행의 요청 수/받은 본문 크기 (requests, bytes, ...)
+            'resumed': int,  # 작업 저널에서 복원한 상품 수
+            'watermarks': ReviewWatermarks | None  # sink 없이 실행하면 기록 전 수위:
+                                                   # data를 저장한 뒤 commit() 호출
         }
     """
+    http_before = http_stats.snapshot()
+    journal = None
+
     try:
-        # 상품 검색
-        goods_dict = get_goods_no(keyword, size=max_products, order=order)
+        journal = JobJournal(job_path, params={
+            'pipeline': 'kyobo.search_reviews', 'keyword': keyword, 'max_products': max_products,
+            'max_reviews_per_book': max_reviews_per_book, 'order': order, 'watermark_path': watermark_path,
+        })
+        resumed = journal.resumed
+        marks = ReviewWatermarks(watermark_path) if watermark_path else None
+        # 이어 쓰는 sink: 저널에 확정된 행만 남기고, 그 상품은 다시 쓰지 않음
+        written = journal.resume_output(sink) if sink is not None else {}
 
-        if not goods_dict:
+        results_summary = []
+        reviews = iter_search_reviews(
+            keyword, max_products=max_products, max_reviews_per_book=max_reviews_per_book, order=order,
+            progress_callback=progress_callback, workers=workers,
+            journal=journal, marks=marks, summary=results_summary,
+            flush=sink.flush if sink is not None else None, written=written
+        )
+        if sink is None:
+            all_reviews = list(reviews)
+            count = len(all_reviews)
+        else:
+            all_reviews = []
+            count = 0
+            for review in reviews:
+                sink.write(review)
+                count += 1
+
+        if not results_summary:
             return {
                 'status': 'error',
                 'message': '검색 결과가 없습니다.',
@@ -56,56 +159,15 @@ def run_search_reviews(keyword, max_products=10, max_reviews_per_book=10, order=
                 'summary': []
             }
 
-        # 각 상품의 리뷰 수집
-        all_reviews = []
-        results_summary = []
-        total_items = len(goods_dict)
-
-        for idx, (title, goods_no) in enumerate(goods_dict.items(), 1):
-            if progress_callback:
-                progress_callback(idx, total_items, f"{title[:50]}... 리뷰 수집 중")
-
-            try:
-                reviews = get_kyobo_reviews(title, goods_no, max_reviews=max_reviews_per_book)
-
-                if reviews:
-                    # 각 리뷰에 goods_no와 title 추가
-                    for review in reviews:
-                        review['goods_no'] = goods_no
-                        review['title'] = title
-
-                    all_reviews.extend(reviews)
-                    results_summary.append({
-                        'title': title,
-                        'goods_no': goods_no,
-                        'review_count': len(reviews)
-                    })
-                else:
-                    results_summary.append({
-                        'title': title,
-                        'goods_no': goods_no,
-                        'review_count': 0
-                    })
-
-            except Exception as e:
-                # 개별 상품 실패는 무시하고 계속 진행
-                if progress_callback:
-                    progress_callback(idx, total_items, f"실패: {title[:30]}... - {str(e)[:50]}")
-
-                results_summary.append({
-                    'title': title,
-                    'goods_no': goods_no,
-                    'review_count': -1
-                })
-
-            time.sleep(2)  # 서버 부하 방지
-
         return {
             'status': 'success',
-            'message': f'{len(all_reviews)}개의 리뷰를 수집했습니다.',
+            'message': f'{count}개의 리뷰를 수집했습니다.',
             'data': all_reviews,
-            'count': len(all_reviews),
-            'summary': results_summary
+            'count': count,
+            'summary': results_summary,
+            'http': http_stats.since(http_before),
+            'resumed': resumed,
+            'watermarks': marks
         }
 
     except Exception as e:
@@ -116,6 +178,128 @@ def run_search_reviews(keyword, max_products=10, max_reviews_per_book=10, order=
             'count': 0,
             'summary': []
         }
+    finally:
+        if journal:
+            journal.close()
+
+
+def iter_search_reviews(keyword, max_products=10, max_reviews_per_book=10, order='', progress_callback=None,
+                        workers=REVIEW_WORKERS, journal=None, marks=None, summary=None, flush=None,
+                        written=()):
+    """
+    키워드 검색 → 리뷰 크롤링 결과를 상품 순서대로 리뷰 하나씩 내보냄
+
+    run_search_reviews와 같은 방식으로 수집하지만 결과를 모으지 않는다.
+    메모리에는 동시에 처리 중인 상품(workers개 + 큐)의 리뷰만 있으므로
+    크롤링 규모가 커져도 메모리 사용량은 일정하다.
+
+    Args:
+        keyword, max_products, max_reviews_per_book, order, progress_callback, workers:
+            run_search_reviews와 같음
+        journal: 작업 저널 (optional, common.checkpoint.JobJournal)
+        marks: 상품별 수위 (optional, common.watermark.ReviewWatermarks, 주면 새 리뷰만)
+               상품의 리뷰를 모두 내보낸 뒤 그 리뷰로 수위를 올린다 (marks.advance)
+        summary: 상품별 요약을 추가할 리스트 (optional)
+        flush: 상품의 리뷰를 모두 내보낸 뒤 호출해 저장을 확정하는 함수 (optional, 예: CsvSink.flush)
+               파일의 행 수를 돌려줘야 한다. 주면 그 뒤 수위를 바로 기록하고, 저널에
+               출력 행 수를 기록한다 (journal.record_written). 없으면 수위는 보류되어
+               호출자가 리뷰를 저장한 뒤 marks.commit()을 호출해야 한다
+        written: 이미 출력에 확정된 상품번호 (다시 내보내지 않음, journal.written)
+
+    Yields:
+        dict: 리뷰 레코드 (goods_no, title 열 포함)
+    """
+    journal = journal or JobJournal(None)
+
+    def search():
+        # 검색은 source 스레드에서 실행됨 (페이지가 오는 대로 리뷰 수집 시작)
+        yield from iter_goods_no(keyword, size=max_products, order=order)
+
+    def crawl(product):
+        title, goods_no = product
+        # 실패한 상품은 기록하지 않아 다음 실행에서 다시 시도
+        return journal.run(goods_no, crawl_product_reviews, title, goods_no, max_reviews_per_book, marks,
+                           succeeded=lambda result: result[1]['review_count'] != -1)
+
+    stages = [Stage('reviews', crawl, workers=workers)]
+    # 진행 표시의 전체 수: 검색이 끝나면 실제로 찾은 상품 수
+    progress = SourceProgress(journal.iter_search(search), max_products)
+    confirmed = True
+    for idx, (reviews, product_summary, message) in enumerate(run_stages(progress, stages), 1):
+        if summary is not None:
+            summary.append(product_summary)
+        progress.report(progress_callback, idx, message)
+        goods_no = product_summary['goods_no']
+        if goods_no in written:
+            continue
+        yield from reviews
+        if marks is not None and product_summary['review_count'] != -1:
+            marks.advance('kyobo', goods_no, reviews)
+        if flush is not None:
+            rows = flush()
+            if marks is not None:
+                marks.commit()
+            # 앞의 상품이 모두 저널에 끝난 상품일 때만 출력 행 수를 확정
+            # (다음 실행에서 다시 받을 상품의 행이 확정된 범위에 섞이지 않도록)
+            confirmed = confirmed and journal.done(goods_no)
+            if confirmed:
+                journal.record_written(goods_no, rows)
+    progress.finish(progress_callback)
+
+
+def _advance_marks(marks, store, result):
+    """일괄 크롤링 결과의 상품별 새 리뷰로 수위를 올림 (기록은 호출자가 결과를 저장한 뒤)"""
+    reviews_by_goods = {}
+    for review in result['data']:
+        reviews_by_goods.setdefault(review['goods_no'], []).append(review)
+    for summary in result['summary']:
+        if summary['review_count'] != -1:
+            marks.advance(store, summary['goods_no'], reviews_by_goods.get(summary['goods_no'], []))
+
+
+def run_batch_search_reviews(keywords, max_products=10, max_reviews_per_book=10, order='', progress_callback=None,
+                             search_workers=SEARCH_WORKERS, workers=REVIEW_WORKERS, job_path=None,
+                             watermark_path=None):
+    """
+    여러 키워드 검색 → 리뷰 크롤링 (common.batch)
+
+    키워드 검색을 동시에 실행하고, 여러 키워드에 나온 상품도 리뷰는 한 번만
+    수집한 뒤 일치한 키워드를 모두 붙인다.
+
+    Args:
+        keywords: 검색 키워드 리스트
+        max_products: 키워드당 최대 상품 수
+        max_reviews_per_book: 상품당 최대 리뷰 수
+        order: 정렬 방식 ('qntt', 'date', 'kcont', 'krvgr', '' 등)
+        progress_callback: 진행상황 콜백 함수 (optional)
+        search_workers: 동시에 실행할 최대 검색 수
+        workers: 리뷰를 동시에 수집할 최대 상품 수
+        job_path: 작업 저널 경로 (optional, common.checkpoint)
+        watermark_path: 상품별 수위 파일 경로 (optional, 주면 새 리뷰만 수집)
+
+    Returns:
+        dict: common.batch.run_batch 반환값
+              (run_search_reviews 결과 + 'keyword_map', 'searches', 리뷰/요약의 'keywords' 열)
+              watermark_path를 주면 'watermarks': 기록 전 수위 (data를 저장한 뒤 commit() 호출)
+    """
+    marks = ReviewWatermarks(watermark_path) if watermark_path else None
+    result = run_batch(
+        keywords,
+        search=lambda keyword: get_goods_no(keyword, size=max_products, order=order),
+        crawl=lambda title, goods_no: crawl_product_reviews(title, goods_no, max_reviews_per_book, marks),
+        search_workers=search_workers,
+        crawl_workers=workers,
+        progress_callback=progress_callback,
+        job_path=job_path,
+        job_params={
+            'pipeline': 'kyobo.batch_search_reviews', 'max_products': max_products,
+            'max_reviews_per_book': max_reviews_per_book, 'order': order, 'watermark_path': watermark_path,
+        }
+    )
+    if marks is not None and result['status'] == 'success':
+        _advance_marks(marks, 'kyobo', result)
+        result['watermarks'] = marks
+    return result
 
 
 # =============================================================================
@@ -145,38 +329,43 @@ def pipeline_search_reviews():
     max_reviews_input = input("책당 최대 리뷰 수 (기본 10): ").strip()
     max_reviews = int(max_reviews_input) if max_reviews_input.isdigit() else 10
 
+    # 작업 저널 (같은 경로로 다시 실행하면 같은 CSV에 이어서 기록)
+    job_path = input("작업 저널 경로 (선택, 엔터=사용 안 함): ").strip() or None
+
     print(f"\n🔍 '{keyword}' 검색 중...")
 
     # 진행상황 콜백
     def progress_callback(current, total, message):
         print(f"[{current}/{total}] {message}")
 
-    # 핵심 로직 실행
-    result = run_search_reviews(
-        keyword=keyword,
-        max_products=size,
-        max_reviews_per_book=max_reviews,
-        order=order,
-        progress_callback=progress_callback
-    )
+    # 핵심 로직 실행 (리뷰는 받는 대로 CSV에 기록)
+    # 저널을 쓰면 파일 이름을 저널 이름으로 고정해 다시 실행할 때 이어 씀
+    suffix = Path(job_path).stem if job_path else datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"kyobo_reviews_{keyword}_{suffix}.csv"
+    with CsvSink(filename, REVIEW_COLUMNS, resume=bool(job_path)) as sink:
+        result = run_search_reviews(
+            keyword=keyword,
+            max_products=size,
+            max_reviews_per_book=max_reviews,
+            order=order,
+            progress_callback=progress_callback,
+            job_path=job_path,
+            sink=sink
+        )
 
     if result['status'] == 'error':
         print(f"❌ {result['message']}")
         return result
 
     print(f"\n📊 {result['message']}")
-
-    # CSV 저장
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"kyobo_reviews_{keyword}_{timestamp}.csv"
-    save_result = save_to_csv(result['data'], filename)
+    print(f"   요청 {result['http']['requests']}회, 받은 본문 {result['http']['bytes'] / 1024:.0f}KB")
 
     # 요약 저장
     if result['summary']:
-        summary_filename = f"kyobo_summary_{keyword}_{timestamp}.csv"
+        summary_filename = f"kyobo_summary_{keyword}_{suffix}.csv"
         save_to_csv(result['summary'], summary_filename)
 
-    return save_result
+    return sink.close()
 
 
 def main_interactive():
@@ -188,12 +377,13 @@ def main_cli():
     """CLI 인자로 실행 (빠른 실행용)"""
     if len(sys.argv) < 2:
         print("사용법:")
-        print("  인터랙티브: python pipeline.py")
-        print("  빠른 실행:  python pipeline.py <키워드> [최대리뷰수] [size] [order]")
+        print("  인터랙티브: python -m kyobo.pipeline")
+        print("  빠른 실행:  python -m kyobo.pipeline <키워드> [최대리뷰수] [size] [order] [작업저널]")
         print("")
         print("예시:")
-        print('  python pipeline.py "토익" 10 40 qntt')
-        print('  python pipeline.py "토익" 10 40 date')
+        print('  python -m kyobo.pipeline "토익" 10 40 qntt')
+        print('  python -m kyobo.pipeline "토익" 10 40 date')
+        print('  python -m kyobo.pipeline "토익" 10 40 date jobs/toeic.jsonl  # 중단돼도 같은 명령으로 이어서 실행')
         print("")
         print("size: 원하는 검색 결과 수")
         print("order: qntt(판매량), date(최신), kcont(클로버리뷰), krvgr(클로버평점), 빈문자열(인기도)")
@@ -203,6 +393,7 @@ def main_cli():
     max_reviews = int(sys.argv[2]) if len(sys.argv) > 2 else 10
     size = int(sys.argv[3]) if len(sys.argv) > 3 else 40
     order = sys.argv[4] if len(sys.argv) > 4 else ''
+    job_path = sys.argv[5] if len(sys.argv) > 5 else None
 
     print("=" * 60)
     print(f"🔍 '{keyword}' 검색 중... (size={size}, order={order})")
@@ -212,32 +403,34 @@ def main_cli():
     def progress_callback(current, total, message):
         print(f"[{current}/{total}] {message}")
 
-    # 핵심 로직 실행
-    result = run_search_reviews(
-        keyword=keyword,
-        max_products=size,
-        max_reviews_per_book=max_reviews,
-        order=order,
-        progress_callback=progress_callback
-    )
+    # 핵심 로직 실행 (리뷰는 받는 대로 CSV에 기록)
+    # 저널을 쓰면 파일 이름을 저널 이름으로 고정해 다시 실행할 때 이어 씀
+    suffix = Path(job_path).stem if job_path else datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"kyobo_reviews_{keyword}_{suffix}.csv"
+    with CsvSink(filename, REVIEW_COLUMNS, resume=bool(job_path)) as sink:
+        result = run_search_reviews(
+            keyword=keyword,
+            max_products=size,
+            max_reviews_per_book=max_reviews,
+            order=order,
+            progress_callback=progress_callback,
+            job_path=job_path,
+            sink=sink
+        )
 
     if result['status'] == 'error':
         print(f"❌ {result['message']}")
         return result
 
     print(f"\n📊 {result['message']}")
-
-    # CSV 저장
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"kyobo_reviews_{keyword}_{timestamp}.csv"
-    save_result = save_to_csv(result['data'], filename)
+    print(f"   요청 {result['http']['requests']}회, 받은 본문 {result['http']['bytes'] / 1024:.0f}KB")
 
     # 요약 저장
     if result['summary']:
-        summary_filename = f"kyobo_summary_{keyword}_{timestamp}.csv"
+        summary_filename = f"kyobo_summary_{keyword}_{suffix}.csv"
         save_to_csv(result['summary'], summary_filename)
 
-    return save_result
+    return sink.close()
 
 
 if __name__ == "__main__":
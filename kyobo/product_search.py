@@ -2,15 +2,18 @@
 교보문고 상품 검색 모듈
 """
 
-import requests
-from bs4 import BeautifulSoup
 import re
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from common.http_utils import HEADERS
+from common.http_utils import http_get
+from common.page_plan import fetch_batch
+from common.html_parser import ParseScope, make_soup
+from common.html_scan import (
+    ScanFallback, element_end, has_class, iter_start_tags, parse_attrs, prepare, text_content,
+)
 
 # 정렬 옵션 상수
 ORDER_OPTIONS = {
@@ -22,26 +25,110 @@ ORDER_OPTIONS = {
 }
 
 
+# 검색 한 요청의 최대 결과 수 (len), 동시에 요청할 기본 페이지 수
+SEARCH_PAGE_SIZE = 50
+SEARCH_PAGE_WORKERS = 4
+
+
+# 검색 결과 페이지에서 파싱할 범위 (상품 링크)
+SEARCH_RESULT_SCOPE = ParseScope(classes=('prod_info',))
+
+_PROD_LINK = re.compile(r'<a\b([^>]*\bprod_info\b[^>]*)>', re.I)
+_DETAIL_HREF = re.compile(r'/detail/(S\d+)')
+_A_CLOSE = re.compile(r'</a\s*>', re.I)
+_A_OPEN = re.compile(r'<a\b', re.I)
+
+
 def build_search_url(query, size=40, order='', page=1):
     """검색 URL 생성"""
     return f"https://search.kyobobook.co.kr/search?keyword={query}&page={page}&ra={order}&len={size}"
 
 
-def get_goods_no(query, size=40, order='', page=1):
+def get_search_page(query, page=1, page_size=SEARCH_PAGE_SIZE, order=''):
+    """
+    검색 결과 한 페이지에서 {제목: 상품번호} 추출 (검색 순위 순서)
+
+    반환값: ({제목: 상품번호}, 페이지의 a.prod_info 수)
+            eBook/제목 없는 결과나 같은 제목은 dict에서 빠지므로, 마지막 페이지인지는
+            a.prod_info 수로 판단한다
+    """
+    url = build_search_url(query, page_size, order, page)
+
+    req = http_get(url)
+
+    try:
+        return _scan_search_results(req.content)
+    except ScanFallback:
+        return _parse_search_results(make_soup(req.content, scope=SEARCH_RESULT_SCOPE))
+
+
+def iter_goods_no(query, size=40, order='', workers=SEARCH_PAGE_WORKERS):
+    """
+    교보문고 키워드 검색 결과를 검색 순위 순서대로 (제목, 상품번호)로 내보냄
+
+    한 요청에 최대 SEARCH_PAGE_SIZE개씩 나눠 받는다. 첫 페이지를 먼저 받고
+    (결과가 적은 검색에서 불필요한 요청을 보내지 않도록), 남은 페이지는
+    workers개씩 동시에 요청해 페이지 순서대로 합친다. size개를 채우거나
+    검색 결과(a.prod_info)가 덜 찬 페이지(마지막 페이지)를 만나면 남은 요청은
+    보내지 않는다.
+    페이지가 밀려 같은 상품이 다시 나오면 처음 나온 순위만 남긴다.
+
+    query: 검색 키워드
+    size: 가져올 검색 결과 수 (자연수)
+    order: 정렬 방식 (qntt/date/kcont/krvgr 또는 빈 문자열)
+    workers: 동시에 요청할 최대 페이지 수
+    """
+    page_size = min(size, SEARCH_PAGE_SIZE)
+    last_page = -(-size // page_size)
+    seen_titles = set()
+    seen_goods = set()
+    next_page = 1
+    batch_size = 1
+
+    while next_page <= last_page:
+        pages = range(next_page, min(last_page, next_page + batch_size - 1) + 1)
+        results = fetch_batch(get_search_page, [(query, page, page_size, order) for page in pages], workers)
+        try:
+            for goods_dict, result_count in results:
+                for title, goods_no in goods_dict.items():
+                    if title in seen_titles or goods_no in seen_goods:
+                        continue
+                    seen_titles.add(title)
+                    seen_goods.add(goods_no)
+                    yield title, goods_no
+                    if len(seen_goods) >= size:
+                        return
+                if result_count < page_size:
+                    return
+        finally:
+            results.close()
+        next_page = pages.stop
+        batch_size = workers
+
+
+def get_goods_no(query, size=40, order='', workers=SEARCH_PAGE_WORKERS):
     """
     교보문고에서 키워드 기반으로 상품 목록 추출
 
     query: 검색 키워드
-    size: 검색 결과 수 (자연수)
+    size: 검색 결과 수 (자연수, SEARCH_PAGE_SIZE개씩 나눠 동시에 요청)
     order: 정렬 방식 (qntt/date/kcont/krvgr 또는 빈 문자열)
+    workers: 동시에 요청할 최대 페이지 수
+
+    반환값: {제목: 상품번호} (검색 순위 순서)
     """
-    url = build_search_url(query, size, order, page)
+    return dict(iter_goods_no(query, size, order, workers))
+
+
+def parse_goods_no(soup):
+    """검색 결과 HTML에서 {제목: 상품번호} 추출"""
+    return _parse_search_results(soup)[0]
+
 
+def _parse_search_results(soup):
+    """parse_goods_no + 페이지의 a.prod_info 수"""
     goods_no_dict = {}
 
-    req = requests.get(url, headers=HEADERS)
-    soup = BeautifulSoup(req.content, 'html.parser')
-    
     # a.prod_info 태그에서 상품 정보 추출
     prod_links = soup.select("a.prod_info")
     
@@ -60,4 +147,49 @@ def get_goods_no(query, size=40, order='', page=1):
             if title and goods_no:
                 goods_no_dict[title] = goods_no
     
-    return goods_no_dict
\ No newline at end of file
+    return goods_no_dict, len(prod_links)
+
+
+def scan_goods_no(content):
+    """
+    검색 결과 원문을 트리 없이 훑어 {제목: 상품번호} 추출
+
+    결과는 parse_goods_no와 같다. 확신할 수 없는 마크업이면 ScanFallback을 던진다.
+    """
+    return _scan_search_results(content)[0]
+
+
+def _scan_search_results(content):
+    """scan_goods_no + 페이지의 a.prod_info 수"""
+    text = prepare(content)
+    goods_no_dict = {}
+    link_count = 0
+
+    for link in _PROD_LINK.finditer(text):
+        attrs = parse_attrs(link.group(1))
+        if not has_class(attrs, 'prod_info'):
+            continue
+        link_count += 1
+
+        match = _DETAIL_HREF.search(attrs.get('href', ''))
+        if not match:
+            continue
+        goods_no = match.group(1)
+
+        close = _A_CLOSE.search(text, link.end())
+        if close is None:
+            raise ScanFallback("닫히지 않은 a 태그")
+        inner = text[link.end():close.start()]
+        if _A_OPEN.search(inner):
+            raise ScanFallback("중첩된 a 태그")
+
+        title = ""
+        for span, span_attrs in iter_start_tags(inner, 'span'):
+            if span_attrs.get('id') == f"cmdtName_{goods_no}":
+                title = text_content(inner[span.end():element_end(inner, 'span', span.end())])
+                break
+
+        if title and goods_no:
+            goods_no_dict[title] = goods_no
+
+    return goods_no_dict, link_count
@@ -3,84 +3,274 @@
 API를 통해 리뷰 데이터 수집
 """
 
-import requests
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from common.http_utils import HEADERS
+from common.http_utils import http_get, iter_body
 from common.file_utils import sanitize_filename
+from common.retry import call_with_retry
+from common.json_utils import iter_json_events, loads, streaming_available
+from common.page_plan import fetch_batch, plan_offset_pages
+from common.checkpoint import checkpointed_page
+from common.watermark import advance_mark, take_new
 
 
-def build_review_api_url(goods_no, page=1, page_limit=10):
+# 리뷰 레코드를 만드는 데 쓰는 API 필드 (평점, 내용, 작성자, 작성일시)
+REVIEW_FIELDS = ('revwRvgr', 'revwCntt', 'mmbrId', 'cretDttm')
+
+# 리뷰 목록 화면에서 쓰는 최대 pageLimit
+MAX_PAGE_LIMIT = 50
+
+# pageLimit이 이 이상이면 응답을 스트리밍으로 파싱 (ijson 설치 시)
+# 요청하는 pageLimit은 MAX_PAGE_LIMIT까지이므로 꽉 찬 페이지를 스트리밍으로 받음
+STREAM_PAGE_LIMIT = MAX_PAGE_LIMIT
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 리뷰 정렬 (reviewSort 값)
+REVIEW_SORT_DEFAULT = '001'  # 리뷰 목록 기본 정렬
+REVIEW_SORT_LATEST = '002'   # 최신순
+
+# 증분 크롤링에서 수위가 있는 상품의 pageLimit (새 리뷰는 보통 적으므로 작게)
+INCREMENTAL_PAGE_LIMIT = 10
+
+
+class KyoboApiError(Exception):
+    """
+    리뷰 API가 statusCode 200이 아닌 응답을 반환
+
+    HTTP 응답은 정상이므로 재시도하지 않고 호스트 서킷 브레이커에도 세지 않는다
+    (한 상품의 API 오류가 다른 상품의 요청까지 막지 않도록).
+    """
+
+
+def build_review_api_url(goods_no, page=1, page_limit=10, sort=REVIEW_SORT_DEFAULT):
     """리뷰 API URL 생성"""
-    return f"https://product.kyobobook.co.kr/api/review/list?page={page}&pageLimit={page_limit}&reviewSort=001&revwPatrCode=002&saleCmdtid={goods_no}"
+    return f"https://product.kyobobook.co.kr/api/review/list?page={page}&pageLimit={page_limit}&reviewSort={sort}&revwPatrCode=002&saleCmdtid={goods_no}"
+
+
+def _to_record(item):
+    """API 리뷰 항목 → 리뷰 레코드"""
+    return {
+        'rating': item.get('revwRvgr'),
+        'content': item.get('revwCntt'),
+        'author': item.get('mmbrId'),
+        'date': item.get('cretDttm', '')[:10],  # YYYY-MM-DD만
+    }
+
+
+def _check_status(status_code, result_message):
+    if status_code != 200:
+        raise KyoboApiError(f"API 에러: {result_message}")
+
+
+def parse_review_page(content):
+    """
+    리뷰 API 응답 본문 파싱 (orjson 사용 가능하면 orjson)
+
+    반환값: (내용 있는 리뷰 레코드 리스트, 페이지의 리뷰 항목 수, 전체 리뷰 수)
+    """
+    data = loads(content)
+    _check_status(data.get('statusCode'), data.get('resultMessage'))
+
+    review_list = data.get('data', {}).get('reviewList', [])
+    total_count = data.get('data', {}).get('totalCount', 0)
+    reviews = [record for record in map(_to_record, review_list) if record.get('content')]
+    return reviews, len(review_list), total_count
+
+
+# 스트리밍 파싱에서 값을 꺼낼 위치: {ijson prefix: 필드}
+_ITEM_PREFIX = 'data.reviewList.item'
+_FIELD_PREFIXES = {f"{_ITEM_PREFIX}.{field}": field for field in REVIEW_FIELDS}
+
+
+def stream_review_page(chunks):
+    """
+    리뷰 API 응답을 내려받는 대로 파싱 (ijson)
+
+    reviewList 항목마다 REVIEW_FIELDS만 모아 바로 레코드로 만들고, 나머지
+    필드는 버린다. 반환값은 parse_review_page와 같다.
+    """
+    status_code = result_message = None
+    total_count = 0
+    reviews = []
+    item_count = 0
+    item = None
+
+    for prefix, event, value in iter_json_events(chunks):
+        if item is not None:
+            field = _FIELD_PREFIXES.get(prefix)
+            if field is not None and event not in ('start_map', 'start_array', 'map_key'):
+                item[field] = value
+            elif prefix == _ITEM_PREFIX and event == 'end_map':
+                item_count += 1
+                record = _to_record(item)
+                if record.get('content'):
+                    reviews.append(record)
+                item = None
+        elif prefix == _ITEM_PREFIX and event == 'start_map':
+            item = {}
+        elif prefix == 'statusCode':
+            status_code = value
+        elif prefix == 'resultMessage':
+            result_message = value
+        elif prefix == 'data.totalCount':
+            total_count = value
+
+    _check_status(status_code, result_message)
+    return reviews, item_count, total_count
+
+
+def fetch_review_page(goods_no, page=1, page_limit=10, sort=REVIEW_SORT_DEFAULT):
+    """
+    리뷰 API 한 페이지 요청 (HTTP 429/5xx와 연결 오류만 재시도, API 오류는 바로 KyoboApiError)
+
+    page_limit이 STREAM_PAGE_LIMIT 이상이고 ijson이 있으면 본문 전체를
+    메모리에 올리지 않고 스트리밍으로 파싱한다.
+
+    작업 저널(common.checkpoint)로 실행 중이면 이미 받은 페이지는 다시 요청하지 않는다.
+
+    반환값: (내용 있는 리뷰 레코드 리스트, 페이지의 리뷰 항목 수, 전체 리뷰 수)
+    """
+    return checkpointed_page(
+        f"review:{page}:{page_limit}:{sort}",
+        lambda: _download_review_page(goods_no, page, page_limit, sort)
+    )
+
+
+def _download_review_page(goods_no, page, page_limit, sort=REVIEW_SORT_DEFAULT):
+    url = build_review_api_url(goods_no, page, page_limit, sort)
+    stream = page_limit >= STREAM_PAGE_LIMIT and streaming_available()
+
+    def fetch():
+        if not stream:
+            return parse_review_page(http_get(url, retry=None).content)
+        response = http_get(url, retry=None, stream=True)
+        try:
+            return stream_review_page(iter_body(response, STREAM_CHUNK_SIZE))
+        finally:
+            response.close()
+
+    return call_with_retry(fetch, url)
 
 
 def get_kyobo_reviews(title, goods_no, max_reviews=10):
     """
-    교보문고 상품 리뷰 크롤링
+    교보문고 상품 리뷰 크롤링 (iter_kyobo_reviews 결과를 리스트로 반환)
 
     title: 상품 제목
     goods_no: 상품 번호 (S로 시작)
     max_reviews: 최대 수집할 리뷰 수 (기본값: 10, None이면 전체 수집)
     """
-    all_reviews = []
-    page = 1
-    page_limit = 50  # 한 번에 최대 50개씩 요청
-    
+    return list(iter_kyobo_reviews(title, goods_no, max_reviews=max_reviews))
+
+
+def iter_kyobo_reviews(title, goods_no, max_reviews=10):
+    """
+    교보문고 상품 리뷰를 순서대로 하나씩 내보냄
+
+    첫 요청은 max_reviews만큼만 받고(최대 MAX_PAGE_LIMIT), 응답의 전체 리뷰
+    수(totalCount)로 남은 요청의 page/pageLimit을 계산해 한 번에 동시에 보낸다.
+    totalCount만큼 받으면 마지막 페이지가 꽉 차 있어도 멈추고, totalCount가
+    없거나 받은 수와 맞지 않을 때만 덜 찬 페이지가 나올 때까지 더 요청한다.
+    페이지가 파싱되는 대로 내보내므로 상품 리뷰 전체를 메모리에 모으지 않는다.
+
+    인자는 get_kyobo_reviews와 같다. 요청이 실패하면 그때까지 내보낸 리뷰로 끝난다.
+    """
+    count = 0
+
+    def _remaining():
+        return max_reviews - count if max_reviews else None
+
+    def _enough():
+        return bool(max_reviews) and count >= max_reviews
+
     try:
         print(f"상품명: {title}")
-        
-        while True:
-            url = build_review_api_url(goods_no, page, page_limit)
-            response = requests.get(url, headers=HEADERS)
-            data = response.json()
-            
-            if data.get('statusCode') != 200:
-                print(f"API 에러: {data.get('resultMessage')}")
-                break
-            
-            review_list = data.get('data', {}).get('reviewList', [])
-            total_count = data.get('data', {}).get('totalCount', 0)
-            
-            if page == 1:
-                print(f"총 {total_count}개의 리뷰가 있습니다.")
-            
-            if not review_list:
-                break
-            
-            # 리뷰 파싱
-            for item in review_list:
-                review_data = {
-                    'rating': item.get('revwRvgr'),
-                    'content': item.get('revwCntt'),
-                    'author': item.get('mmbrId'),
-                    'date': item.get('cretDttm', '')[:10],  # YYYY-MM-DD만
-                }
-                
-                if review_data.get('content'):
-                    all_reviews.append(review_data)
-            
-            print(f"페이지 {page}: {len(review_list)}개 리뷰 수집")
-            
-            # max_reviews 제한 체크
-            if max_reviews and len(all_reviews) >= max_reviews:
-                all_reviews = all_reviews[:max_reviews]
-                print(f"\n최대 {max_reviews}개 리뷰 수집 완료.")
-                break
-            
-            # 다음 페이지 체크
-            if len(review_list) < page_limit:
-                print(f"\n총 {len(all_reviews)}개의 리뷰를 수집했습니다.")
-                break
-            
-            page += 1
-    
+
+        page_limit = min(max_reviews, MAX_PAGE_LIMIT) if max_reviews else MAX_PAGE_LIMIT
+        reviews, item_count, total_count = fetch_review_page(goods_no, 1, page_limit)
+        print(f"총 {total_count}개의 리뷰가 있습니다.")
+        if item_count:
+            print(f"페이지 1: {item_count}개 리뷰 수집")
+        for review in reviews[:_remaining()]:
+            count += 1
+            yield review
+
+        offset = item_count  # 지금까지 받은 리뷰 항목 수 (내용 없는 리뷰 포함)
+        exhausted = item_count < page_limit or offset == total_count
+
+        while not exhausted and not _enough():
+            # totalCount가 맞지 않으면 (이미 받은 수 이하) 한 페이지씩 확인
+            counted = total_count > offset
+            available = total_count - offset if counted else MAX_PAGE_LIMIT
+            wanted = min(_remaining(), available) if max_reviews else available
+            plan = plan_offset_pages(offset, wanted, MAX_PAGE_LIMIT)
+
+            results = fetch_batch(fetch_review_page, [(goods_no, page, size) for page, size in plan])
+            try:
+                for (page, size), (reviews, item_count, _) in zip(plan, results):
+                    offset += item_count
+                    if item_count:
+                        print(f"페이지 {page} (pageLimit {size}): {item_count}개 리뷰 수집")
+                    for review in reviews[:_remaining()]:
+                        count += 1
+                        yield review
+                    # 덜 찬 페이지, 또는 totalCount만큼 받았으면 마지막
+                    last = item_count < size or (counted and offset >= total_count)
+                    if last or _enough():
+                        exhausted = last
+                        break
+            finally:
+                results.close()
+
+        if _enough():
+            print(f"\n최대 {max_reviews}개 리뷰 수집 완료.")
+        else:
+            print(f"\n총 {count}개의 리뷰를 수집했습니다.")
+
     except Exception as e:
         print(f"에러 발생: {e}")
         import traceback
         traceback.print_exc()
-    
-    return all_reviews
+
+
+def get_new_kyobo_reviews(title, goods_no, mark=None, max_reviews=10):
+    """
+    교보문고 상품의 새 리뷰만 수집 (증분 크롤링, common.watermark)
+
+    리뷰를 최신순(reviewSort=REVIEW_SORT_LATEST)으로 한 페이지씩 받다가
+    mark(지난 실행의 수위) 이전 리뷰에 닿으면 멈춘다. get_kyobo_reviews와
+    달리 요청이 실패하면 예외를 그대로 던진다 (수위를 올리지 않도록).
+
+    title: 상품 제목
+    goods_no: 상품 번호 (S로 시작)
+    mark: 지난 실행의 수위 (None이면 처음 수집하는 상품)
+    max_reviews: 처음 수집하는 상품의 최대 리뷰 수 (None이면 전체 수집,
+                 수위가 있으면 제한 없이 새 리뷰를 모두 수집)
+
+    반환값: (새 리뷰 리스트 (최신순), 갱신한 수위)
+    """
+    print(f"상품명: {title}")
+    limit = max_reviews if mark is None else None
+    if mark is not None:
+        page_limit = INCREMENTAL_PAGE_LIMIT
+    else:
+        page_limit = min(limit, MAX_PAGE_LIMIT) if limit else MAX_PAGE_LIMIT
+
+    new_reviews = []
+    page = 1
+    while True:
+        reviews, item_count, _ = fetch_review_page(goods_no, page, page_limit, sort=REVIEW_SORT_LATEST)
+        fresh = take_new(reviews, mark)
+        new_reviews.extend(fresh)
+        # 이미 본 리뷰에 닿았거나, 마지막 페이지거나, 제한을 채웠으면 멈춤
+        if len(fresh) < len(reviews) or item_count < page_limit or (limit and len(new_reviews) >= limit):
+            break
+        page += 1
+
+    if limit:
+        new_reviews = new_reviews[:limit]
+    print(f"새 리뷰 {len(new_reviews)}개 ({page} 페이지 확인)")
+    return new_reviews, advance_mark(mark, new_reviews)
@@ -0,0 +1,120 @@
+"""
+테스트 공통 설정
+
+저장소 루트를 import 경로에 추가하고, 127.0.0.1에서 응답하는 스텁 서버를 제공한다.
+yes24_reviews는 스텁 서버로 예스24 리뷰 페이지와 검색 결과(PRODUCTS)를 흉내 낸다.
+"""
+
+import importlib
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+class StubServer:
+    """
+    handler(path, active) → (status, headers, body)를 돌려주는 로컬 HTTP 서버
+
+    동시에 처리 중인 요청 수(active)와 최대값(peak)을 센다.
+    """
+
+    def __init__(self):
+        self.handler = lambda path, active: (404, {}, b'')
+        self.active = 0
+        self.peak = 0
+        self.requests = []
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with stub._lock:
+                    stub.active += 1
+                    stub.peak = max(stub.peak, stub.active)
+                    stub.requests.append(self.path)
+                    active = stub.active
+                try:
+                    status, headers, body = stub.handler(self.path, active)
+                finally:
+                    with stub._lock:
+                        stub.active -= 1
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    from common.rate_limit import rate_limiter
+
+    server = StubServer()
+    rate_limiter.configure('127.0.0.1', None)
+    yield server
+    server.close()
+
+
+# yes24_reviews 스텁의 검색 결과와 페이지당 리뷰 수
+PRODUCTS = [('책 하나', '101'), ('책 둘', '102')]
+REVIEWS_PER_PAGE = 5
+
+
+def _yes24_review_page(reviews, path):
+    goods_no = urlsplit(path).path.rsplit('/', 1)[-1]
+    page = int(parse_qs(urlsplit(path).query)['PageNumber'][0])
+    product_reviews = reviews.get(goods_no, [])
+    items = ''.join(
+        f'<div class="reviewInfoGrp"><div class="reviewInfoTop">'
+        f'<span class="review_rating"><span class="total_rating">평점5점</span></span>'
+        f'<em class="txt_id"><a class="lnk_id">{author}</a></em><em class="txt_date">{date}</em></div>'
+        f'<div class="reviewInfoBot origin"><div class="review_cont">{content}</div></div></div>'
+        for author, content, date in product_reviews[(page - 1) * REVIEWS_PER_PAGE:page * REVIEWS_PER_PAGE]
+    )
+    max_page = max(-(-len(product_reviews) // REVIEWS_PER_PAGE), 1)
+    pager = '<div class="yesUI_pagenS">' + ''.join(f'<a class="num">{n}</a>' for n in range(1, max_page + 1)) + '</div>'
+    return f'<html><body>{items}{pager}</body></html>'.encode('utf-8')
+
+
+@pytest.fixture
+def yes24_reviews(stub_server, monkeypatch):
+    """
+    예스24 리뷰 스텁: stub_server.reviews = {상품번호: [(작성자, 내용, 날짜), ...] (최신순)}
+
+    검색은 요청 없이 PRODUCTS를 돌려준다. 상품마다 리뷰 10개로 시작한다.
+    """
+    get_reviews = importlib.import_module('yes24.get_reviews')
+    pipeline = importlib.import_module('yes24.pipeline')
+
+    stub_server.reviews = {
+        goods_no: [(f'user{n}', f'리뷰 {goods_no}-{n}', '2025-01-01') for n in range(10)]
+        for _, goods_no in PRODUCTS
+    }
+    stub_server.handler = lambda path, active: (
+        200, {'Content-Type': 'text/html; charset=utf-8'}, _yes24_review_page(stub_server.reviews, path)
+    )
+    monkeypatch.setattr(get_reviews, 'build_review_url', lambda goods_no, page=1, **kwargs: (
+        f"{stub_server.base}/review/{goods_no}?PageNumber={page}"
+    ))
+    monkeypatch.setattr(pipeline, 'iter_search_products', lambda *args, **kwargs: iter(PRODUCTS))
+    monkeypatch.setattr(pipeline, 'search_products', lambda *args, **kwargs: dict(PRODUCTS))
+    return stub_server
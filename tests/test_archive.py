@@ -0,0 +1,29 @@
+"""
+원본 페이지 아카이브 record/replay (common.archive)
+"""
+
+import re
+
+from common import http_cache
+from common.archive import archive_mode
+from common.http_utils import http_get
+
+
+def test_cached_pages_are_recorded_for_replay(stub_server, tmp_path, monkeypatch):
+    stub_server.handler = lambda path, active: (200, {'Content-Type': 'text/html; charset=utf-8'}, path.encode())
+    monkeypatch.setattr(http_cache, '_cache', http_cache.ResponseCache(
+        tmp_path / 'cache.sqlite', rules=[(re.compile(r'127\.0\.0\.1'), 600)]
+    ))
+    monkeypatch.setattr(http_cache, '_cache_enabled', True)
+    url = f"{stub_server.base}/page/1"
+
+    http_get(url)  # 아카이브 없이 캐시에 저장
+    with archive_mode(tmp_path / 'archive', 'record'):
+        response = http_get(url)
+    assert response.from_cache
+    assert len(stub_server.requests) == 1
+
+    with archive_mode(tmp_path / 'archive', 'replay'):
+        replayed = http_get(url)
+    assert replayed.content == b'/page/1'
+    assert len(stub_server.requests) == 1
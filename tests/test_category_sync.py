@@ -0,0 +1,56 @@
+"""
+카테고리 동기화 작업자 설정 (yes24.category_sync)
+
+작업자 프로세스마다 따로 적용되는 예산(속도 제한, 동시 요청 한도)은
+부모의 예산을 작업자 수로 나눠야 하고, 응답 캐시는 부모 설정을 따라야 한다.
+"""
+
+import importlib
+
+from common import http_cache
+from common.concurrency import concurrency_controllers
+from common.html_parser import get_parser_backend
+from common.rate_limit import rate_limiter
+
+category_sync = importlib.import_module('yes24.category_sync')
+
+HOST = 'www.yes24.com'
+
+
+def _start_worker(processes, monkeypatch):
+    """부모 설정으로 작업자 초기화를 이 프로세스에서 실행 (전역 상태는 테스트 후 복원)"""
+    bucket = rate_limiter.bucket(HOST)
+    initargs = (bucket.rate, bucket.burst, processes, get_parser_backend(),
+                category_sync._worker_concurrency(processes), category_sync._worker_cache())
+    monkeypatch.setattr(concurrency_controllers, '_controllers', {})
+    monkeypatch.setattr(rate_limiter, '_limits', dict(rate_limiter._limits))
+    monkeypatch.setattr(rate_limiter, '_buckets', dict(rate_limiter._buckets))
+    category_sync._init_worker(*initargs)
+    return concurrency_controllers.get(f"https://{HOST}/"), rate_limiter.bucket(HOST)
+
+
+def test_worker_splits_concurrency_and_rate_budget(monkeypatch, tmp_path):
+    monkeypatch.setattr(concurrency_controllers, '_controllers', {})
+    concurrency_controllers.configure(HOST, initial=4, max_limit=8)
+    monkeypatch.setattr(http_cache, '_cache', None)
+    monkeypatch.setattr(http_cache, '_cache_enabled', True)
+    http_cache.configure_cache(path=tmp_path / 'cache.sqlite')
+    rate = rate_limiter.bucket(HOST).rate
+
+    controller, bucket = _start_worker(4, monkeypatch)
+
+    assert (controller.max_limit, controller.limit) == (2, 1)
+    assert bucket.rate == rate / 4
+    assert http_cache.get_cache().path == tmp_path / 'cache.sqlite'
+
+
+def test_worker_keeps_at_least_one_slot_and_disabled_cache(monkeypatch):
+    monkeypatch.setattr(concurrency_controllers, '_controllers', {})
+    concurrency_controllers.configure(HOST, initial=2, max_limit=3)
+    monkeypatch.setattr(http_cache, '_cache', None)
+    monkeypatch.setattr(http_cache, '_cache_enabled', False)
+
+    controller, _ = _start_worker(8, monkeypatch)
+
+    assert (controller.min_limit, controller.max_limit, controller.limit) == (1, 1, 1)
+    assert http_cache.get_cache() is None
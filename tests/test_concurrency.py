@@ -0,0 +1,97 @@
+"""
+AIMD 동시성 컨트롤러 (common.concurrency)
+
+동시 요청이 일정 수를 넘으면 429를 돌려주는 스텁 서버로, 한도가 줄었다가
+스로틀링이 풀리면 다시 늘어나는지 확인한다. 컨트롤러의 시계는 고정해
+지연시간이 실제 시간에 따라 흔들리지 않게 한다 (증가/감소는 응답 상태로만 결정).
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from common.concurrency import AdaptiveConcurrency, concurrency_controllers
+from common.http_utils import http_get
+from common.retry import RetryableHTTPError
+
+
+def _hammer(base, requests_per_thread, threads):
+    def worker(n):
+        statuses = []
+        for i in range(requests_per_thread):
+            try:
+                statuses.append(http_get(f"{base}/item/{n}/{i}", retry=None, cache=False).status_code)
+            except RetryableHTTPError as e:
+                statuses.append(e.response.status_code)
+        return statuses
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return [status for statuses in executor.map(worker, range(threads)) for status in statuses]
+
+
+@pytest.fixture
+def controllers(monkeypatch):
+    """전역 컨트롤러 모음을 테스트 동안만 비워 둠 (다음 테스트에 설정이 남지 않도록)"""
+    monkeypatch.setattr(concurrency_controllers, '_controllers', {})
+    return concurrency_controllers
+
+
+def test_limit_backs_off_and_recovers(stub_server, controllers):
+    throttle = {'max_active': 2}
+
+    def handler(path, active):
+        time.sleep(0.01)
+        if active > throttle['max_active']:
+            return 429, {}, b'slow down'
+        return 200, {'Content-Type': 'text/plain'}, b'ok'
+
+    stub_server.handler = handler
+    controllers.configure('127.0.0.1', initial=8, max_limit=8, window=5, clock=lambda: 0.0)
+    controller = controllers.get(stub_server.base)
+
+    # 스로틀링 중: 429를 받고 한도가 줄어듦
+    statuses = _hammer(stub_server.base, requests_per_thread=15, threads=12)
+    assert 429 in statuses
+    decreases = [d for d in controller.decisions if d['action'] == 'decrease']
+    assert decreases and decreases[0]['reason'] == 'http_429'
+    assert min(d['to'] for d in decreases) <= throttle['max_active']
+
+    # 스로틀링이 풀리면 평탄한 지연시간(모두 0)으로 창마다 한도가 다시 늘어남
+    throttle['max_active'] = 100
+    low = controller.limit
+    controller.decisions.clear()
+    statuses = _hammer(stub_server.base, requests_per_thread=30, threads=12)
+    assert set(statuses) == {200}
+    assert {d['action'] for d in controller.decisions} == {'increase'}
+    assert controller.limit == 8 > low
+
+
+def test_overload_from_one_congestion_decreases_once():
+    now = [0.0]
+    controller = AdaptiveConcurrency(initial=8, clock=lambda: now[0])
+    slots = [controller.acquire() for _ in range(4)]
+    now[0] = 1.0
+    for slot in slots:
+        slot.success(503)
+        controller.release()
+    assert controller.limit == 4
+    assert [d['action'] for d in controller.decisions] == ['decrease']
+
+
+def test_latency_window_decides_increase_and_decrease():
+    controller = AdaptiveConcurrency(initial=4, window=4, clock=lambda: 0.0)
+
+    def window(latency):
+        for _ in range(controller.window):
+            controller.on_success(latency)
+
+    window(0.1)  # 기준선
+    assert controller.limit == 4 and not controller.decisions
+    window(0.12)  # 기준선의 1.5배 이내: 증가
+    assert controller.limit == 5
+    window(0.5)  # 기준선의 2.5배 초과: 감소
+    assert controller.limit == 2
+    assert [(d['action'], d['reason']) for d in controller.decisions] == [
+        ('increase', 'latency_flat'), ('decrease', 'latency_spike'),
+    ]
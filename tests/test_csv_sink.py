@@ -0,0 +1,78 @@
+"""
+CSV 이어 쓰기 (common.file_utils.CsvSink + 작업 저널)
+
+작업 저널과 함께 같은 파일을 resume=True로 열면, 중단된 실행이 저널에
+확정한 행만 남기고 나머지 상품부터 이어 써서 행이 빠지거나 겹치지 않아야 한다.
+"""
+
+import csv
+import importlib
+
+from common.file_utils import CsvSink
+
+pipeline = importlib.import_module('yes24.pipeline')
+
+
+def _rows(path):
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        return [(row['goods_no'], row['content']) for row in csv.DictReader(f)]
+
+
+def _expected(stub_server):
+    return [(goods_no, content) for goods_no, reviews in stub_server.reviews.items() for _, content, _ in reviews]
+
+
+def _run(tmp_path, job_path, fail_after=None):
+    with CsvSink('reviews.csv', pipeline.REVIEW_COLUMNS, tmp_path, resume=True) as sink:
+        if fail_after is not None:
+            write = sink.write
+
+            def crashing_write(row):
+                if sink.count == fail_after:
+                    raise RuntimeError("중단")
+                write(row)
+
+            sink.write = crashing_write
+        return pipeline.run_search_reviews('파이썬', max_products=2, max_reviews=None,
+                                           job_path=job_path, sink=sink)
+
+
+def test_resumed_run_continues_after_confirmed_rows(yes24_reviews, tmp_path):
+    job_path = tmp_path / 'job.jsonl'
+
+    # 두 번째 상품의 행을 일부 쓴 뒤 중단 (첫 상품만 저널에 확정)
+    assert _run(tmp_path, job_path, fail_after=13)['status'] == 'error'
+    assert len(_rows(tmp_path / 'reviews.csv')) == 13
+    requests = len(yes24_reviews.requests)
+
+    result = _run(tmp_path, job_path)
+
+    assert result['status'] == 'success'
+    assert result['count'] == 10
+    assert _rows(tmp_path / 'reviews.csv') == _expected(yes24_reviews)
+    assert len(yes24_reviews.requests) == requests
+
+
+def test_new_file_with_existing_journal_is_rewritten(yes24_reviews, tmp_path):
+    job_path = tmp_path / 'job.jsonl'
+    assert _run(tmp_path, job_path)['status'] == 'success'
+    (tmp_path / 'reviews.csv').unlink()
+
+    result = _run(tmp_path, job_path)
+
+    assert result['count'] == 20
+    assert _rows(tmp_path / 'reviews.csv') == _expected(yes24_reviews)
+
+
+def test_empty_sink_removes_its_file(tmp_path):
+    with CsvSink('empty.csv', ['a', 'b'], tmp_path) as sink:
+        pass
+    assert sink.close()['status'] == 'error'
+    assert not (tmp_path / 'empty.csv').exists()
+
+    try:
+        with CsvSink('failed.csv', ['a', 'b'], tmp_path):
+            raise RuntimeError("검색 실패")
+    except RuntimeError:
+        pass
+    assert not (tmp_path / 'failed.csv').exists()
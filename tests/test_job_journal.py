@@ -0,0 +1,65 @@
+"""
+작업 저널로 재개 (common.checkpoint, yes24.pipeline)
+
+run_search_reviews와 arun_search_reviews는 같은 저널 형식을 쓰므로
+한쪽이 남긴 저널로 다른 쪽이 요청 없이 재개할 수 있어야 한다.
+"""
+
+import asyncio
+import importlib
+import json
+
+import pytest
+
+from common.checkpoint import JobJournal, checkpointed_page
+from conftest import PRODUCTS
+
+pipeline = importlib.import_module('yes24.pipeline')
+
+
+def _run_sync(job_path):
+    return pipeline.run_search_reviews('파이썬', max_products=2, max_reviews=8, job_path=job_path)
+
+
+def _run_async(job_path):
+    return asyncio.run(pipeline.arun_search_reviews('파이썬', max_products=2, max_reviews=8, job_path=job_path))
+
+
+@pytest.mark.parametrize('first, second', [(_run_sync, _run_async), (_run_async, _run_sync)])
+def test_sync_and_async_resume_each_other(yes24_reviews, tmp_path, first, second):
+    job_path = tmp_path / 'job.jsonl'
+    result = first(job_path)
+    assert result['status'] == 'success' and result['count'] == 16
+    requests = len(yes24_reviews.requests)
+
+    resumed = second(job_path)
+    assert resumed['status'] == 'success', resumed['message']
+    assert resumed['resumed'] == len(PRODUCTS)
+    assert len(yes24_reviews.requests) == requests
+    assert resumed['data'] == result['data']
+
+
+@pytest.mark.parametrize('first, second', [(_run_sync, _run_async), (_run_async, _run_sync)])
+def test_pages_from_interrupted_run_are_reused(yes24_reviews, tmp_path, first, second):
+    job_path = tmp_path / 'job.jsonl'
+    result = first(job_path)
+    requests = len(yes24_reviews.requests)
+
+    # 페이지만 기록하고 상품 결과는 기록하기 전에 멈춘 실행
+    lines = job_path.read_text(encoding='utf-8').splitlines(keepends=True)
+    job_path.write_text(''.join(line for line in lines if json.loads(line)['type'] != 'product'), encoding='utf-8')
+
+    resumed = second(job_path)
+    assert resumed['status'] == 'success', resumed['message']
+    assert resumed['resumed'] == 0
+    assert len(yes24_reviews.requests) == requests
+    assert resumed['data'] == result['data']
+
+
+def test_partial_pages_are_not_recorded(tmp_path):
+    with JobJournal(tmp_path / 'job.jsonl') as journal, journal.product('101'):
+        complete = lambda result: result[1] is not None
+        checkpointed_page('full', lambda: (['a', 'b'], 3), complete=complete)
+        checkpointed_page('partial', lambda: (['a'], None), complete=complete)
+    assert list(journal.page('101', 'full')) == [['a', 'b'], 3]
+    assert journal.page('101', 'partial') is None
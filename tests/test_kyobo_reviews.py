@@ -0,0 +1,102 @@
+"""
+교보문고 리뷰 페이지 계획 (kyobo.review_scraper)
+
+page/pageLimit 요청을 받아 totalCount개의 리뷰를 돌려주는 스텁 서버로
+요청 수를 확인한다.
+"""
+
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from common.retry import circuit_breakers
+from kyobo import review_scraper
+
+
+def _review_api(total, reported_total=None):
+    """전체 total개 리뷰 (응답의 totalCount는 reported_total)"""
+    def handler(path, active):
+        query = parse_qs(urlsplit(path).query)
+        page, limit = int(query['page'][0]), int(query['pageLimit'][0])
+        start = (page - 1) * limit
+        items = [
+            {'revwRvgr': 5, 'revwCntt': f'리뷰 {i}', 'mmbrId': f'user{i}', 'cretDttm': '2025-01-01 00:00:00'}
+            for i in range(start, min(start + limit, total))
+        ]
+        body = {'statusCode': 200, 'resultMessage': 'OK', 'data': {
+            'totalCount': total if reported_total is None else reported_total, 'reviewList': items,
+        }}
+        return 200, {'Content-Type': 'application/json'}, json.dumps(body).encode('utf-8')
+    return handler
+
+
+@pytest.fixture
+def review_api(stub_server, monkeypatch):
+    monkeypatch.setattr(review_scraper, 'build_review_api_url', lambda goods_no, page=1, page_limit=10, sort=None: (
+        f"{stub_server.base}/api/review/list?page={page}&pageLimit={page_limit}&saleCmdtid={goods_no}"
+    ))
+    return stub_server
+
+
+@pytest.mark.parametrize('total, max_reviews, requests', [
+    (120, None, 3),   # 50 + 50 + 20 (마지막 페이지가 꽉 차도 멈춤)
+    (60, 100, 2),     # 50 + 10
+    (50, None, 1),
+    (10, 10, 1),
+    (7, 10, 1),
+])
+def test_stops_at_total_count(review_api, total, max_reviews, requests):
+    review_api.handler = _review_api(total)
+    reviews = review_scraper.get_kyobo_reviews('책', 'S1', max_reviews=max_reviews)
+    assert [r['content'] for r in reviews] == [f'리뷰 {i}' for i in range(min(total, max_reviews or total))]
+    assert len(review_api.requests) == requests
+
+
+def test_probes_when_total_count_is_wrong(review_api):
+    review_api.handler = _review_api(130, reported_total=40)
+    reviews = review_scraper.get_kyobo_reviews('책', 'S2', max_reviews=None)
+    assert len(reviews) == 130
+
+
+def test_api_errors_are_not_retried_or_counted_by_breaker(review_api):
+    ok = _review_api(3)
+
+    def handler(path, active):
+        if 'saleCmdtid=BAD' in path:
+            body = {'statusCode': 500, 'resultMessage': '상품 없음', 'data': None}
+            return 200, {'Content-Type': 'application/json'}, json.dumps(body).encode('utf-8')
+        return ok(path, active)
+
+    review_api.handler = handler
+    breaker = circuit_breakers.get(review_api.base)
+    for _ in range(breaker.failure_threshold + 1):
+        with pytest.raises(review_scraper.KyoboApiError):
+            review_scraper.fetch_review_page('BAD')
+    assert len(review_api.requests) == breaker.failure_threshold + 1
+    assert breaker.failures == 0
+
+    # 다른 상품은 그대로 요청됨
+    assert len(review_scraper.get_kyobo_reviews('책', 'S3')) == 3
+
+
+def test_streamed_page_matches_orjson_path(review_api, monkeypatch):
+    pytest.importorskip('ijson')
+    items = [
+        {'revwRvgr': i % 5 + 0.5, 'revwCntt': f'리뷰 "{i}"\n줄바꿈' if i % 7 else '', 'mmbrId': f'user{i}',
+         'cretDttm': '2025-01-02 03:04:05', 'revwNum': i, 'imgs': [{'url': f'{i}.jpg'}], 'meta': {'revwCntt': 'x'}}
+        for i in range(review_scraper.MAX_PAGE_LIMIT)
+    ]
+    body = json.dumps({'statusCode': 200, 'resultMessage': 'OK',
+                       'data': {'totalCount': 321, 'reviewList': items}}, ensure_ascii=False).encode('utf-8')
+    review_api.handler = lambda path, active: (200, {'Content-Type': 'application/json'}, body)
+    streamed = []
+    stream = review_scraper.stream_review_page
+    monkeypatch.setattr(review_scraper, 'stream_review_page', lambda chunks: streamed.append(1) or stream(chunks))
+    monkeypatch.setattr(review_scraper, 'STREAM_CHUNK_SIZE', 256)
+
+    result = review_scraper.fetch_review_page('S4', page_limit=review_scraper.MAX_PAGE_LIMIT)
+
+    assert streamed == [1]
+    assert result == review_scraper.parse_review_page(body)
+    assert result[1:] == (review_scraper.MAX_PAGE_LIMIT, 321)
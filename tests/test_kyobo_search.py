@@ -0,0 +1,55 @@
+"""
+교보문고 검색 페이지 넘김 (kyobo.product_search)
+
+eBook이나 같은 제목처럼 {제목: 상품번호}에서 빠지는 결과가 있어도,
+a.prod_info가 꽉 찬 페이지면 다음 페이지를 요청해야 한다.
+"""
+
+from urllib.parse import parse_qs, urlsplit
+
+from kyobo import product_search
+
+
+def _link(goods_no, title, host='product.kyobobook.co.kr/detail'):
+    return (
+        f'<li class="prod_item"><a href="https://{host}/{goods_no}" class="prod_info">'
+        f'<span id="cmdtName_{goods_no}">{title}</span></a></li>'
+    )
+
+
+PAGES = {
+    1: [
+        _link('S001', '책 1'),
+        _link('E001', '책 1 (eBook)', host='ebook-product.kyobobook.co.kr/dig/epd/ebook'),
+        _link('S002', '책 2'),
+        _link('S003', '책 2'),  # 같은 제목의 다른 판
+    ],
+    2: [_link('S004', '책 4'), _link('S005', '책 5')],
+}
+
+
+def _search(path, active):
+    page = int(parse_qs(urlsplit(path).query)['page'][0])
+    body = '<html><body><ul>' + ''.join(PAGES.get(page, [])) + '</ul></body></html>'
+    return 200, {'Content-Type': 'text/html; charset=utf-8'}, body.encode('utf-8')
+
+
+def test_full_page_with_filtered_results_is_not_last(stub_server, monkeypatch):
+    stub_server.handler = _search
+    monkeypatch.setattr(product_search, 'SEARCH_PAGE_SIZE', 4)
+    monkeypatch.setattr(product_search, 'build_search_url', lambda query, size=40, order='', page=1: (
+        f"{stub_server.base}/search?keyword={query}&page={page}&len={size}"
+    ))
+
+    goods = product_search.get_goods_no('책', size=8, workers=1)
+
+    assert goods == {'책 1': 'S001', '책 2': 'S003', '책 4': 'S004', '책 5': 'S005'}
+    assert len(stub_server.requests) == 2
+
+
+def test_page_result_count_matches_between_scan_and_parse():
+    content = ('<html><body><ul>' + ''.join(PAGES[1]) + '</ul></body></html>').encode('utf-8')
+    soup = product_search.make_soup(content, scope=product_search.SEARCH_RESULT_SCOPE)
+
+    assert product_search._scan_search_results(content) == product_search._parse_search_results(soup)
+    assert product_search._scan_search_results(content)[1] == 4
@@ -0,0 +1,23 @@
+"""
+목록 원문 훑기(scan)와 트리 파싱 결과 일치 (benchmarks/listing_conformance.py)
+
+저장소에 포함된 표본 목록 페이지(fixtures/listings)로 검사한다.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+from listing_conformance import SAMPLE_PAGES, check  # noqa: E402
+from parse_backends import load_pages  # noqa: E402
+
+
+def test_scanners_match_tree_parser():
+    results = check(load_pages(SAMPLE_PAGES), repeat=1)
+
+    assert set(results) == {'yes24_listing', 'kyobo_listing'}
+    for kind, row in results.items():
+        assert row['mismatches'] == [], kind
+        # 표본은 원문 훑기로 끝까지 처리되어야 함 (트리 파싱 대체로는 훑기를 검사하지 못함)
+        assert row['fallbacks'] == [], kind
@@ -0,0 +1,36 @@
+"""
+진행 표시의 전체 수 (common.stage_pipeline.SourceProgress)
+
+검색 결과가 max_products보다 적어도 마지막 진행 표시는 100%여야 한다.
+"""
+
+import importlib
+
+from common.stage_pipeline import SourceProgress
+
+pipeline = importlib.import_module('yes24.pipeline')
+
+
+def test_search_reviews_progress_reaches_found_count(yes24_reviews):
+    calls = []
+    result = pipeline.run_search_reviews('파이썬', max_products=10, max_reviews=5,
+                                         progress_callback=lambda *args: calls.append(args[:2]))
+    assert result['status'] == 'success'
+    assert calls[-1] == (2, 2)
+    assert all(current <= total for current, total in calls)
+
+
+def test_finish_reports_again_when_source_ends_late():
+    calls = []
+    callback = lambda current, total, message: calls.append((current, total, message))
+    progress = SourceProgress(['a', 'b'], estimate=10)
+    items = iter(progress)
+
+    next(items)
+    progress.report(callback, 1, 'a')
+    next(items)
+    progress.report(callback, 2, 'b')  # 검색이 아직 끝나지 않음: 추정치 사용
+    assert next(items, None) is None
+    progress.finish(callback)
+
+    assert calls == [(1, 10, 'a'), (2, 10, 'b'), (2, 2, 'b')]
@@ -0,0 +1,49 @@
+"""
+재시도 정책의 Retry-After 처리 (common.retry)
+"""
+
+import time
+
+import pytest
+
+from common.http_utils import http_get
+from common.retry import CircuitOpenError, RetryPolicy, RetryableHTTPError, circuit_breakers
+
+
+def test_delay_honors_retry_after():
+    policy = RetryPolicy(max_delay=20.0)
+    assert policy.delay(1, retry_after=15.0) == 15.0
+    assert policy.delay(1, retry_after=0.0) <= policy.base_delay
+    assert policy.delay(1, retry_after=60.0) is None
+
+
+def test_short_retry_after_is_waited_out(stub_server):
+    calls = []
+
+    def handler(path, active):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return 429, {'Retry-After': '1'}, b''
+        return 200, {}, b'ok'
+
+    stub_server.handler = handler
+    response = http_get(f"{stub_server.base}/short", retry=RetryPolicy(max_delay=5.0), cache=False)
+    assert response.status_code == 200
+    assert calls[1] - calls[0] >= 1.0
+
+
+def test_long_retry_after_gives_up_and_opens_circuit(stub_server):
+    stub_server.handler = lambda path, active: (503, {'Retry-After': '3600'}, b'')
+    policy = RetryPolicy(max_delay=5.0)
+
+    start = time.monotonic()
+    with pytest.raises(RetryableHTTPError):
+        http_get(f"{stub_server.base}/long", retry=policy, cache=False)
+    assert time.monotonic() - start < 1.0
+    assert len(stub_server.requests) == 1
+
+    # 서버가 요청한 시간 동안은 같은 호스트로 요청을 보내지 않음
+    with pytest.raises(CircuitOpenError):
+        http_get(f"{stub_server.base}/other", retry=policy, cache=False)
+    assert len(stub_server.requests) == 1
+    circuit_breakers.get(stub_server.base).record_success()
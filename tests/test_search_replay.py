@@ -0,0 +1,83 @@
+"""
+예스24 검색 쿠키 (yes24.search_products)
+
+아카이브 replay 중에는 메인 페이지를 방문하지 않고, 평소에는 마지막 방문 후
+COOKIE_MAX_AGE가 지나면 (그 사이 검색이 계속돼도) 다시 방문해야 한다.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from common.archive import archive_mode
+from yes24 import search_products as sp
+
+
+LISTING = """
+<ul id="yesSchList">
+  <li data-goods-no="101"><div class="item_info">
+    <a class="gd_name" href="/Product/Goods/101">책 하나</a>
+  </div></li>
+</ul>
+""".encode('utf-8')
+
+
+@pytest.fixture
+def no_cookies(tmp_path, monkeypatch):
+    monkeypatch.setattr(sp, 'COOKIE_FILE', str(tmp_path / 'cookies.txt'))
+    monkeypatch.setattr(sp, '_session', None)
+    monkeypatch.setattr(sp, '_warmed_at', None)
+    monkeypatch.setattr(sp, '_saved_state', None)
+
+
+def test_replay_skips_warm_up(tmp_path, no_cookies):
+    url = sp.build_search_url('파이썬', page=1, size=24, order='RELATION')
+    with archive_mode(tmp_path / 'archive', 'record') as archive:
+        archive.record(url, LISTING, 'text/html; charset=utf-8')
+
+    # 쿠키가 없고 메인 페이지가 아카이브에 없어도 검색은 replay됨
+    with archive_mode(tmp_path / 'archive', 'replay'):
+        products = list(sp.iter_search_products('파이썬', size=24, max_products=1))
+    assert products and products[0][1] == '101'
+    assert not (tmp_path / 'cookies.txt').exists()
+
+
+def test_cookies_are_refreshed_after_max_age(stub_server, tmp_path, no_cookies, monkeypatch):
+    def handler(path, active):
+        if path == '/':
+            return 200, {'Set-Cookie': 'sid=abc; Path=/'}, b'main'
+        return 200, {'Content-Type': 'text/html; charset=utf-8'}, LISTING
+
+    stub_server.handler = handler
+    monkeypatch.setattr(sp, 'WARMUP_URL', f"{stub_server.base}/")
+    monkeypatch.setattr(sp, 'build_search_url', lambda query, page=1, size=24, order='': (
+        f"{stub_server.base}/search?query={query}&page={page}"
+    ))
+    now = [1_000_000.0]
+    monkeypatch.setattr(sp, 'time', SimpleNamespace(time=lambda: now[0]))
+    saves = []
+    save = sp.LWPCookieJar.save
+    monkeypatch.setattr(sp.LWPCookieJar, 'save', lambda jar, *args, **kwargs: (
+        saves.append(1), save(jar, *args, **kwargs)
+    ))
+
+    def search():
+        list(sp.iter_search_products('파이썬', max_products=1))
+        return stub_server.requests.count('/')
+
+    assert search() == 1
+    # 검색이 이어져도 쿠키가 그대로면 파일을 다시 쓰지 않음
+    now[0] += sp.COOKIE_MAX_AGE / 2
+    assert search() == 1
+    assert len(saves) == 1
+
+    # 마지막 방문 후 COOKIE_MAX_AGE가 지나면 다시 방문
+    now[0] += sp.COOKIE_MAX_AGE / 2 + 1
+    assert search() == 2
+
+    # 다음 프로세스: 파일의 쿠키는 방문 시각 기준으로 재사용하거나 만료
+    monkeypatch.setattr(sp, '_session', None)
+    assert search() == 2
+    monkeypatch.setattr(sp, '_session', None)
+    now[0] += sp.COOKIE_MAX_AGE + 1
+    assert search() == 3
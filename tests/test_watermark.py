@@ -0,0 +1,55 @@
+"""
+증분 크롤링 수위 (common.watermark, yes24.pipeline)
+
+수위는 새 리뷰가 저장된 뒤에만 기록되어야 한다. 그 전에 멈추면 다음
+실행이 같은 리뷰를 다시 받아야 한다 (잃지 않음).
+"""
+
+import csv
+import importlib
+import json
+
+from common.file_utils import CsvSink
+
+pipeline = importlib.import_module('yes24.pipeline')
+
+
+def test_batch_marks_are_recorded_only_on_commit(yes24_reviews, tmp_path):
+    marks_path = tmp_path / 'marks.json'
+
+    first = pipeline.run_batch_search_reviews(['파이썬'], max_products=2, watermark_path=marks_path)
+    assert first['count'] == 20
+    assert first['watermarks'].pending == 2
+    assert not marks_path.exists()
+
+    # 결과를 저장하기 전에 멈춘 실행: 다음 실행이 같은 리뷰를 다시 받음
+    retried = pipeline.run_batch_search_reviews(['파이썬'], max_products=2, watermark_path=marks_path)
+    assert retried['count'] == 20
+    retried['watermarks'].commit()
+    assert set(json.loads(marks_path.read_text(encoding='utf-8'))['yes24']) == {'101', '102'}
+
+    yes24_reviews.reviews['101'].insert(0, ('new', '새 리뷰', '2025-02-01'))
+    incremental = pipeline.run_batch_search_reviews(['파이썬'], max_products=2, watermark_path=marks_path)
+    assert [review['content'] for review in incremental['data']] == ['새 리뷰']
+
+
+def test_sink_run_records_marks_after_rows_are_flushed(yes24_reviews, tmp_path):
+    marks_path = tmp_path / 'marks.json'
+    flushed = []
+
+    with CsvSink('reviews.csv', pipeline.REVIEW_COLUMNS, tmp_path) as sink:
+        original_flush = sink.flush
+
+        def flush():
+            # 수위를 기록하기 직전: 이 상품의 행은 이미 sink에 있어야 함
+            flushed.append((sink.count, marks_path.exists()))
+            original_flush()
+
+        sink.flush = flush
+        result = pipeline.run_search_reviews('파이썬', max_products=2, watermark_path=marks_path, sink=sink)
+
+    assert result['count'] == 20
+    assert flushed == [(10, False), (20, True)]
+    with open(tmp_path / 'reviews.csv', encoding='utf-8-sig', newline='') as f:
+        assert len(list(csv.DictReader(f))) == 20
+    assert set(json.loads(marks_path.read_text(encoding='utf-8'))['yes24']) == {'101', '102'}
@@ -18,8 +18,8 @@ from .utils import (
 )
 
 from .get_goods_no import get_goods_no
-from .get_reviews import get_reviews
-from .get_books_info import get_book_info
+from .get_reviews import get_reviews, iter_reviews, aget_reviews
+from .get_books_info import get_book_info, iter_book_info
 
 __all__ = [
     # Constants
@@ -35,7 +35,10 @@ __all__ = [
     # Main Functions
     'get_goods_no',
     'get_reviews',
+    'iter_reviews',
+    'aget_reviews',
     'get_book_info',
+    'iter_book_info',
 ]
 
 __version__ = '1.0.0'
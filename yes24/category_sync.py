@@ -0,0 +1,379 @@
+"""
+예스24 카테고리 트리 전체 신간 동기화 (야간 카탈로그 동기화)
+
+카테고리 트리(yes24_categories.json)의 모든 리프(또는 지정한 깊이의 모든
+노드)에서 신간 목록을 받고, 여러 카테고리에 나온 책도 세부정보는 한 번만
+받는다. 책마다 속한 카테고리를 모두 기록한다.
+
+1. 목록: 같은 부모 아래 카테고리를 한 샤드로 묶어 작업자 프로세스에 나눠 줌
+2. 중복 제거: 상품번호 기준으로 합치고 카테고리 소속(membership) 기록
+3. 세부정보: 중복 없는 상품을 작업자 프로세스에 고르게 나눠 줌
+
+- 호스트 속도 제한과 동시 요청 한도(AIMD)는 프로세스마다 따로 적용되므로,
+  부모의 예스24 예산을 작업자 수로 나눠 전체 요청 속도/동시 요청 수는 그대로 유지한다
+- 작업자는 부모와 같은 응답 캐시 파일을 쓴다 (common.http_cache: 잠금은 대기 후 재시도)
+- window(초)가 지나면 새 카테고리/상품은 시작하지 않고 'skipped'로 남긴다
+  (진행 중인 요청은 끝까지 기다림)
+
+작업자는 spawn으로 시작하므로 스크립트에서 쓸 때는 실행 코드를
+if __name__ == "__main__": 아래에 두어야 한다.
+
+사용법:
+    python -m yes24.category_sync [--depth N] [--max-products N] [--processes N] [--window 분]
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common.concurrency import concurrency_controllers
+from common.file_utils import save_to_csv
+from common.http_cache import configure_cache, get_cache
+from common.html_parser import get_parser_backend, set_parser_backend
+from common.rate_limit import STORE_HOSTS, configure_store_rate_limit, rate_limiter
+from common.retry import track_fetches
+from common.stage_pipeline import Stage, run_stages
+from .utils import build_newly_published_url
+from .get_goods_no import get_goods_no
+from .get_books_info import get_book_info
+
+CATEGORY_FILE = Path(__file__).parent / "yes24_categories.json"
+
+# 기본 작업자 프로세스 수 / 프로세스 안에서 동시에 처리할 카테고리·상품 수
+SYNC_PROCESSES = 4
+SHARD_THREADS = 2
+
+# 기본 시간 창 (초)
+SYNC_WINDOW = 60 * 60
+
+# 책의 카테고리 목록 구분자
+CATEGORY_SEPARATOR = ', '
+
+
+def load_category_tree(path=CATEGORY_FILE):
+    """카테고리 트리 {카테고리 ID: {'name', 'depth', 'parent', 'children'}}"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def select_categories(tree, depth=None):
+    """동기화할 카테고리 ID (depth가 None이면 리프 전체, 아니면 그 깊이의 노드 전체)"""
+    if depth is None:
+        return [cat_id for cat_id, info in tree.items() if not info['children']]
+    return [cat_id for cat_id, info in tree.items() if info['depth'] == depth]
+
+
+def shard_categories(tree, category_ids, shards):
+    """
+    카테고리를 shards개 이하의 샤드로 나눔
+
+    같은 부모의 카테고리(같은 하위 트리)는 한 샤드에 두고, 큰 묶음부터
+    가장 작은 샤드에 넣어 샤드 크기를 고르게 맞춘다. 묶음이 shards개보다
+    적으면 큰 묶음을 반으로 나눠 작업자를 모두 쓴다.
+    """
+    grouped = {}
+    for cat_id in category_ids:
+        grouped.setdefault(tree[cat_id]['parent'], []).append(cat_id)
+    groups = list(grouped.values())
+    while len(groups) < shards:
+        largest = max(groups, key=len, default=[])
+        if len(largest) < 2:
+            break
+        groups.remove(largest)
+        half = len(largest) // 2
+        groups += [largest[:half], largest[half:]]
+
+    buckets = [[] for _ in range(max(min(shards, len(groups)), 1))]
+    for group in sorted(groups, key=len, reverse=True):
+        min(buckets, key=len).extend(group)
+    return [bucket for bucket in buckets if bucket]
+
+
+def _worker_concurrency(processes):
+    """작업자 한 프로세스의 예스24 동시성 설정 (부모 컨트롤러의 한도를 작업자 수로 나눔)"""
+    controller = concurrency_controllers.get(f"https://{STORE_HOSTS['yes24'][0]}/")
+    max_limit = max(controller.max_limit // processes, 1)
+    return {
+        'initial': max(controller.limit // processes, 1),
+        'min_limit': min(controller.min_limit, max_limit),
+        'max_limit': max_limit,
+    }
+
+
+def _worker_cache():
+    """작업자가 쓸 응답 캐시 설정 (부모가 캐시를 끄면 None)"""
+    cache = get_cache()
+    if cache is None:
+        return None
+    return {'path': str(cache.path), 'max_bytes': cache.max_bytes, 'rules': cache.rules}
+
+
+def _init_worker(rate, burst, processes, backend, concurrency, cache):
+    # 부모의 예스24 예산(속도, 동시 요청 한도)을 작업자 수로 나눔
+    configure_store_rate_limit('yes24', rate / processes if rate else None, burst)
+    for host in STORE_HOSTS['yes24']:
+        concurrency_controllers.configure(host, **concurrency)
+    # spawn된 작업자는 기본 설정으로 시작하므로 부모의 캐시 설정을 그대로 적용
+    if cache is None:
+        configure_cache(enabled=False)
+    else:
+        configure_cache(**cache)
+    set_parser_backend(backend)
+
+
+def list_shard(category_ids, max_products, deadline, threads=SHARD_THREADS):
+    """
+    샤드의 카테고리별 신간 목록 (작업자 프로세스에서 실행됨)
+
+    반환값: [(카테고리 ID, [(제목, 상품번호), ...], 상태, 요청 결과 집계), ...]
+            상태는 'ok' | 'skipped' | 오류 메시지
+    """
+    def list_one(cat_id):
+        if time.time() >= deadline:
+            return cat_id, [], 'skipped', {}
+        with track_fetches() as report:
+            try:
+                goods_dict = get_goods_no(build_newly_published_url(cat_id), max_products=max_products)
+                return cat_id, list(goods_dict.items()), 'ok', report.as_dict()
+            except Exception as e:
+                return cat_id, [], str(e), report.as_dict()
+
+    return list(run_stages(category_ids, [Stage('listing', list_one, workers=threads)]))
+
+
+def detail_shard(goods_nos, deadline, threads=SHARD_THREADS):
+    """
+    샤드의 상품 세부정보 (작업자 프로세스에서 실행됨)
+
+    반환값: [(상품번호, get_book_info 반환값 또는 None, 상태, 요청 결과 집계), ...]
+    """
+    def detail_one(goods_no):
+        if time.time() >= deadline:
+            return goods_no, None, 'skipped', {}
+        with track_fetches() as report:
+            try:
+                return goods_no, get_book_info(goods_no), 'ok', report.as_dict()
+            except Exception as e:
+                return goods_no, None, str(e), report.as_dict()
+
+    return list(run_stages(goods_nos, [Stage('details', detail_one, workers=threads)]))
+
+
+def _run_shards(pool, func, shards, *args):
+    """샤드마다 func(shard, *args) 실행, 끝나는 순서대로 (샤드 번호, 결과) 내보냄"""
+    if pool is None:
+        for idx, shard in enumerate(shards):
+            yield idx, func(shard, *args)
+        return
+    futures = {pool.submit(func, shard, *args): idx for idx, shard in enumerate(shards)}
+    for future in as_completed(futures):
+        yield futures[future], future.result()
+
+
+def run_category_sync(depth=None, max_products=None, processes=SYNC_PROCESSES, threads=SHARD_THREADS,
+                      window=SYNC_WINDOW, category_file=CATEGORY_FILE, progress_callback=None):
+    """
+    카테고리 트리 전체 신간 → 중복 제거 → 세부정보 추출 (핵심 로직)
+
+    Args:
+        depth: 동기화할 카테고리 깊이 (None이면 리프 전체)
+        max_products: 카테고리당 최대 상품 수 (None이면 전체)
+        processes: 작업자 프로세스 수 (0이면 프로세스 없이 이 프로세스에서 실행)
+        threads: 작업자 프로세스마다 동시에 처리할 카테고리/상품 수
+        window: 시간 창 (초, 지나면 남은 작업은 skipped)
+        category_file: 카테고리 트리 파일
+        progress_callback: 진행상황 콜백 함수 (optional)
+                         callback(current, total, message) 형식, 샤드가 끝날 때마다 호출
+
+    Returns:
+        dict: {
+            'status': 'success' | 'error',
+            'message': str,
+            'data': list,  # 도서 정보 리스트 (책마다 한 번, category_ids/category_names 열 추가)
+            'count': int,
+            'memberships': list,  # 카테고리 소속 (category_id, category_name, rank, goods_no, title)
+            'categories': list,  # 카테고리별 결과 (category_id, category_name, product_count, status)
+            'skipped': dict,  # 시간 창을 넘겨 건너뛴 수 {'categories': int, 'books': int}
+            'http': dict,  # 요청 수/받은 본문 크기 (모든 작업자 합계)
+            'elapsed': float
+        }
+    """
+    start = time.time()
+    deadline = start + window
+    http = {'requests': 0, 'bytes': 0}
+
+    def add_report(report):
+        http['requests'] += report.get('requests', 0)
+        http['bytes'] += report.get('bytes', 0)
+
+    try:
+        tree = load_category_tree(category_file)
+        category_ids = select_categories(tree, depth)
+        if not category_ids:
+            return {
+                'status': 'error',
+                'message': '동기화할 카테고리가 없습니다.',
+                'data': [],
+                'count': 0,
+                'summary': []
+            }
+
+        pool = None
+        if processes:
+            bucket = rate_limiter.bucket(STORE_HOSTS['yes24'][0])
+            pool = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(bucket.rate, bucket.burst, processes, get_parser_backend(),
+                          _worker_concurrency(processes), _worker_cache()),
+            )
+
+        try:
+            # 1. 카테고리별 신간 목록 (하위 트리 단위 샤드)
+            category_shards = shard_categories(tree, category_ids, processes or 1)
+            listings = {}
+            for done, (idx, rows) in enumerate(
+                _run_shards(pool, list_shard, category_shards, max_products, deadline, threads), 1
+            ):
+                for cat_id, items, status, report in rows:
+                    listings[cat_id] = (items, status)
+                    add_report(report)
+                if progress_callback:
+                    progress_callback(done, len(category_shards),
+                                      f"목록 샤드 {idx + 1}: 카테고리 {len(category_shards[idx])}개 완료")
+
+            # 2. 상품번호 기준 중복 제거 (트리 순서로 처음 나온 제목 사용)
+            titles = {}       # {상품번호: 제목}
+            memberships = []
+            book_categories = {}  # {상품번호: [카테고리 ID, ...]}
+            for cat_id in category_ids:
+                for rank, (title, goods_no) in enumerate(listings[cat_id][0], 1):
+                    titles.setdefault(goods_no, title)
+                    book_categories.setdefault(goods_no, []).append(cat_id)
+                    memberships.append({
+                        'category_id': cat_id,
+                        'category_name': tree[cat_id]['name'],
+                        'rank': rank,
+                        'goods_no': goods_no,
+                        'title': title,
+                    })
+
+            # 3. 중복 없는 상품 세부정보 (고르게 나눈 샤드)
+            goods_nos = list(titles)
+            shard_count = max(min(processes or 1, len(goods_nos)), 1)
+            goods_shards = [goods_nos[i::shard_count] for i in range(shard_count)]
+            details = {}
+            for done, (idx, rows) in enumerate(
+                _run_shards(pool, detail_shard, goods_shards, deadline, threads), 1
+            ):
+                for goods_no, info, status, report in rows:
+                    details[goods_no] = (info, status)
+                    add_report(report)
+                if progress_callback:
+                    progress_callback(done, len(goods_shards),
+                                      f"세부정보 샤드 {idx + 1}: 상품 {len(goods_shards[idx])}개 완료")
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        all_books_info = []
+        for goods_no in goods_nos:
+            info, _ = details.get(goods_no, (None, 'skipped'))
+            if info is None:
+                continue
+            cat_ids = book_categories[goods_no]
+            info['category_ids'] = CATEGORY_SEPARATOR.join(cat_ids)
+            info['category_names'] = CATEGORY_SEPARATOR.join(tree[cat_id]['name'] for cat_id in cat_ids)
+            all_books_info.append(info)
+
+        categories = [
+            {
+                'category_id': cat_id,
+                'category_name': tree[cat_id]['name'],
+                'product_count': len(listings[cat_id][0]),
+                'status': listings[cat_id][1],
+            }
+            for cat_id in category_ids
+        ]
+        skipped = {
+            'categories': sum(1 for row in categories if row['status'] == 'skipped'),
+            'books': sum(1 for _, status in details.values() if status == 'skipped'),
+        }
+
+        message = (f'카테고리 {len(category_ids)}개, 상품 {len(goods_nos)}개 중 '
+                   f'{len(all_books_info)}개의 도서 정보를 추출했습니다.')
+        if skipped['categories'] or skipped['books']:
+            message += f" (시간 창 초과로 카테고리 {skipped['categories']}개, 상품 {skipped['books']}개 건너뜀)"
+
+        return {
+            'status': 'success',
+            'message': message,
+            'data': all_books_info,
+            'count': len(all_books_info),
+            'memberships': memberships,
+            'categories': categories,
+            'skipped': skipped,
+            'http': http,
+            'elapsed': round(time.time() - start, 2)
+        }
+
+    except Exception as e:
+        return {
+            'status': 'error',
+            'message': f'오류 발생: {str(e)}',
+            'data': [],
+            'count': 0,
+            'summary': []
+        }
+
+
+def main():
+    """CLI 인자로 실행"""
+    parser = argparse.ArgumentParser(description="예스24 카테고리 트리 전체 신간 동기화")
+    parser.add_argument('--depth', type=int, default=None, help="동기화할 카테고리 깊이 (기본: 리프 전체)")
+    parser.add_argument('--max-products', type=int, default=None, help="카테고리당 최대 상품 수 (기본: 전체)")
+    parser.add_argument('--processes', type=int, default=SYNC_PROCESSES, help="작업자 프로세스 수 (0이면 사용 안 함)")
+    parser.add_argument('--threads', type=int, default=SHARD_THREADS, help="프로세스당 동시 처리 수")
+    parser.add_argument('--window', type=float, default=SYNC_WINDOW / 60, help="시간 창 (분)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📚 예스24 카테고리 신간 동기화")
+    print("=" * 60)
+
+    def progress_callback(current, total, message):
+        print(f"[{current}/{total}] {message}")
+
+    result = run_category_sync(
+        depth=args.depth,
+        max_products=args.max_products,
+        processes=args.processes,
+        threads=args.threads,
+        window=args.window * 60,
+        progress_callback=progress_callback
+    )
+
+    if result['status'] == 'error':
+        print(f"❌ {result['message']}")
+        sys.exit(1)
+
+    print(f"\n📊 {result['message']}")
+    print(f"   {result['elapsed']}초, 요청 {result['http']['requests']}회, "
+          f"받은 본문 {result['http']['bytes'] / 1024:.0f}KB")
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    save_to_csv(result['data'], f"category_sync_books_{timestamp}.csv")
+    save_to_csv(result['memberships'], f"category_sync_memberships_{timestamp}.csv")
+    save_to_csv(result['categories'], f"category_sync_categories_{timestamp}.csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,14 @@
-import requests
-from bs4 import BeautifulSoup
 import re
-from .utils import HEADERS, build_book_url
+from .utils import http_get, make_soup, build_book_url
+from common.parse_pool import run_parse
+from common.retry import track_fetches
+from common.stage_pipeline import Stage, SourceProgress, run_stages
+
+# get_book_infos 기본 동시 요청 상품 수
+DETAIL_WORKERS = 4
+
+# 세부 정보 필드 (parse_book_body가 돌려주는 튜플 순서, goods_no 제외)
+BOOK_FIELDS = ('title', 'author', 'publisher', 'pub_date', 'pages', 'size', 'category_path', 'description')
 
 ### 세부 정보 추출 ###
 def get_book_info(goods_no):
@@ -21,9 +28,81 @@ def get_book_info(goods_no):
     """
     url = build_book_url(goods_no)
 
-    response = requests.get(url, headers=HEADERS, timeout=10)
-    soup = BeautifulSoup(response.content, 'html.parser')
+    response = http_get(url)
+    # 파싱 풀(common.parse_pool)이 설정돼 있으면 작업자 프로세스에서 파싱
+    values = run_parse(parse_book_body, response.content)
+
+    return {'goods_no': goods_no, **dict(zip(BOOK_FIELDS, values))}
+
+
+def get_book_infos(goods_dict, workers=DETAIL_WORKERS, progress_callback=None, journal=None):
+    """
+    여러 상품의 세부 정보를 최대 workers개씩 동시에 추출 (iter_book_info 결과를 리스트로 반환)
+
+    인자와 결과 항목은 iter_book_info와 같다.
+    """
+    return list(iter_book_info(goods_dict, workers=workers, progress_callback=progress_callback, journal=journal))
+
+
+def iter_book_info(goods_dict, workers=DETAIL_WORKERS, progress_callback=None, journal=None):
+    """
+    여러 상품의 세부 정보를 최대 workers개씩 동시에 추출해 상품 순서대로 하나씩 내보냄
+
+    상품 하나가 실패해도 나머지는 계속 진행한다. 동시에 처리 중인 상품만
+    메모리에 있으므로 상품 수가 많아도 메모리 사용량이 늘지 않는다.
+    진행상황 콜백은 상품이 끝날 때마다 순회하는 스레드에서 호출된다.
+
+    goods_dict: {제목: 상품번호} (또는 (제목, 상품번호) 이터러블)
+    workers: 동시에 요청할 최대 상품 수
+    progress_callback: callback(current, total, message) (optional)
+    journal: 작업 저널 (optional, common.checkpoint.JobJournal)
+             저널에 있는 상품은 요청하지 않고, 성공한 상품은 저널에 기록
+
+    내보내는 항목: {
+        'title': 제목,
+        'goods_no': 상품번호,
+        'info': get_book_info 반환값 (실패하면 None),
+        'error': 실패 원인 예외 (성공하면 None),
+        'report': 요청 결과 집계 (outcome, retries, requests, bytes)
+    }
+    """
+    def fetch(product):
+        title, goods_no = product
+        if journal is not None and journal.done(goods_no):
+            stored = journal.result(goods_no)
+            return {'title': title, 'goods_no': goods_no, 'info': stored['info'], 'error': None,
+                    'report': stored['report']}
+        info = error = None
+        with track_fetches() as report:
+            try:
+                info = get_book_info(goods_no)
+            except Exception as e:
+                error = e
+        if journal is not None and error is None:
+            journal.record(goods_no, {'info': info, 'report': report.as_dict()})
+        return {'title': title, 'goods_no': goods_no, 'info': info, 'error': error, 'report': report.as_dict()}
+
+    products = goods_dict.items() if isinstance(goods_dict, dict) else goods_dict
+    total = len(goods_dict) if isinstance(goods_dict, dict) else None
+    progress = SourceProgress(products, total)
+    for idx, result in enumerate(run_stages(progress, [Stage('details', fetch, workers=workers)]), 1):
+        if result['error'] is None:
+            message = f"{result['title'][:50]}... 세부정보 추출 완료"
+        else:
+            message = f"실패: {result['title'][:30]}... - {str(result['error'])[:50]}"
+        progress.report(progress_callback, idx, message)
+        yield result
+    progress.finish(progress_callback)
+
+
+def parse_book_body(content):
+    """상품 상세 페이지 본문 파싱 (파싱 프로세스 풀에서도 실행됨), BOOK_FIELDS 순서의 튜플 반환"""
+    info = parse_book_info(make_soup(content), '')
+    return tuple(info[field] for field in BOOK_FIELDS)
+
 
+def parse_book_info(soup, goods_no):
+    """상품 상세 페이지 HTML에서 정보 추출 (get_book_info 반환값과 같은 형식)"""
     info = {'goods_no': goods_no}
 
     # 제목
@@ -1,8 +1,17 @@
-import requests
-from bs4 import BeautifulSoup
-import time
 import re
-from .utils import HEADERS
+from .utils import http_get, make_soup, LISTING_SCOPE
+from common.html_scan import (
+    ScanFallback, element_end, has_class, iter_start_tags, parse_attrs, prepare, text_content,
+)
+
+# 다음 페이지 버튼 (비활성화된 버튼은 dim 클래스)
+NEXT_PAGE_SELECTOR = ".yesUI_pagen .next:not(.dim)"
+
+_GOODS_LI = re.compile(r'<li\b([^>]*\bdata-goods-no\b[^>]*)>', re.I)
+_LI_TAG = re.compile(r'<(/?)li\b[^>]*>', re.I)
+_PAGER = re.compile(r'<([a-zA-Z][\w-]*)\b([^>]*\byesUI_pagen\b[^>]*)>')
+_A_CLOSE = re.compile(r'</a\s*>', re.I)
+_A_OPEN = re.compile(r'<a\b', re.I)
 
 def _parse_products_from_soup(soup):
     """HTML에서 상품 목록 추출"""
@@ -19,6 +28,82 @@ def _parse_products_from_soup(soup):
     
     return goods_dict
 
+def scan_listing(content):
+    """
+    목록 페이지 원문을 트리 없이 훑어 ({제목: 상품번호}, 다음 페이지 여부) 추출
+
+    결과는 _parse_products_from_soup / NEXT_PAGE_SELECTOR와 같다.
+    확신할 수 없는 마크업이면 ScanFallback을 던진다.
+    """
+    text = prepare(content)
+
+    items = []
+    for match in _GOODS_LI.finditer(text):
+        li_attrs = parse_attrs(match.group(1))
+        if 'data-goods-no' in li_attrs:
+            items.append((match, li_attrs['data-goods-no']))
+
+    goods_dict = {}
+    for i, (match, goods_no) in enumerate(items):
+        segment_end = items[i + 1][0].start() if i + 1 < len(items) else len(text)
+        title = _scan_item_title(text, match.end(), segment_end)
+        if title and goods_no:
+            goods_dict[title] = goods_no
+
+    return goods_dict, _scan_has_next(text)
+
+def _scan_item_title(text, start, end):
+    """li 하나([start, end))에서 첫 a.gd_name의 텍스트"""
+    anchor = None
+    for tag_match, attrs in iter_start_tags(text, 'a', start, end):
+        if has_class(attrs, 'gd_name'):
+            anchor = tag_match
+            break
+
+    # li가 a.gd_name보다 먼저 닫혔는지 확인 (닫혔으면 li 밖의 링크)
+    depth = 1
+    for li_match in _LI_TAG.finditer(text, start, anchor.start() if anchor else end):
+        depth += -1 if li_match.group(1) else 1
+        if depth == 0:
+            return ""
+    if anchor is None:
+        if end < len(text):
+            # 닫히지 않은 li 안에 다음 상품 li가 중첩됨
+            raise ScanFallback("중첩된 상품 li")
+        return ""
+
+    close = _A_CLOSE.search(text, anchor.end())
+    if close is None:
+        raise ScanFallback("닫히지 않은 a 태그")
+    inner = text[anchor.end():close.start()]
+    if _A_OPEN.search(inner):
+        raise ScanFallback("중첩된 a 태그")
+    return text_content(inner)
+
+def _scan_has_next(text):
+    """.yesUI_pagen 안에 dim이 아닌 .next가 있는지"""
+    for match in _PAGER.finditer(text):
+        if not has_class(parse_attrs(match.group(2)), 'yesUI_pagen'):
+            continue
+        pager_end = element_end(text, match.group(1).lower(), match.end())
+        for _, inner_attrs in iter_start_tags(text, start=match.end(), end=pager_end):
+            if has_class(inner_attrs, 'next') and not has_class(inner_attrs, 'dim'):
+                return True
+    return False
+
+def parse_listing(content):
+    """
+    목록 페이지에서 ({제목: 상품번호}, 다음 페이지 여부) 추출
+
+    원문 훑기(scan_listing)를 먼저 쓰고, 확신할 수 없는 페이지는
+    트리 파싱으로 처리한다.
+    """
+    try:
+        return scan_listing(content)
+    except ScanFallback:
+        soup = make_soup(content, scope=LISTING_SCOPE)
+        return _parse_products_from_soup(soup), soup.select_one(NEXT_PAGE_SELECTOR) is not None
+
 def get_goods_no(url, max_products=None):
     """
     예스24에서 상품 목록 추출
@@ -44,10 +129,8 @@ def get_goods_no(url, max_products=None):
         else:
             current_url = f"{url}?pageNumber={page}"
 
-        response = requests.get(current_url, headers=HEADERS, timeout=10)
-        soup = BeautifulSoup(response.content, 'html.parser')
-
-        goods_dict = _parse_products_from_soup(soup)
+        response = http_get(current_url)
+        goods_dict, has_next = parse_listing(response.content)
 
         if not goods_dict:
             break
@@ -61,11 +144,9 @@ def get_goods_no(url, max_products=None):
                 return dict(list(all_goods.items())[:max_products])
 
         # 다음 페이지 확인
-        next_btn = soup.select_one(".yesUI_pagen .next:not(.dim)")
-        if not next_btn:
+        if not has_next:
             break
 
         page += 1
-        time.sleep(0.5)  # 0.5초 대기 (차단 방지)
 
     return all_goods
\ No newline at end of file
@@ -1,8 +1,21 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
 import re
-import time
-from .utils import HEADERS, build_review_url
+from .utils import http_get, make_soup, build_review_url, ParseScope, REVIEW_SORT_LATEST
+from common.html_stream import iter_fragments
+from common.http_utils import iter_body
+from common.page_plan import fetch_batch, plan_fixed_pages
+from common.parse_pool import run_parse
+from common.checkpoint import checkpointed_page
+from common.watermark import advance_mark, take_new
+
+# 리뷰 페이지에서 파싱할 범위 (리뷰 블록, 페이지 번호)
+REVIEW_PAGE_SCOPE = ParseScope(classes=('reviewInfoGrp', 'yesUI_pagenS'))
+
+# stream 모드에서 한 번에 읽는 본문 크기 (bytes)
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# 리뷰 레코드 필드 (parse_review_body가 돌려주는 튜플 순서)
+REVIEW_FIELDS = ('rating', 'content', 'author', 'date')
 
 ### 
 
@@ -70,62 +83,253 @@ def get_max_page(soup):
         return max_page
     return 1
 
-def get_reviews(title, goods_no, max_reviews=10, verbose=True):
+def parse_review_body(content):
     """
-    예스24 상품 리뷰 크롤링
+    리뷰 페이지 본문 파싱 (파싱 프로세스 풀에서도 실행됨)
+
+    반환값: ([(평점, 내용, 작성자, 날짜), ...], 최대 페이지 번호)
+    """
+    soup = make_soup(content, scope=REVIEW_PAGE_SCOPE)
+    rows = [tuple(review[field] for field in REVIEW_FIELDS) for review in parse_reviews_from_html(soup)]
+    return rows, get_max_page(soup)
+
+
+def get_reviews(title, goods_no, max_reviews=10, verbose=True, stream=False):
+    """
+    예스24 상품 리뷰 크롤링 (iter_reviews 결과를 리스트로 반환)
 
     title: 상품 제목
     goods_no: 상품 번호
     max_reviews: 최대 수집할 리뷰 수 (기본값: 10, None이면 전체 수집)
     verbose: 진행 상황 출력 여부 (기본값: True)
+    stream: True면 페이지를 내려받으면서 파싱하고, max_reviews가 채워지면
+            남은 본문은 받지 않음 (기본값: False)
     """
-    all_reviews = []
+    return list(iter_reviews(title, goods_no, max_reviews=max_reviews, verbose=verbose, stream=stream))
 
-    try:
-        # 첫 페이지 요청
-        url = build_review_url(goods_no, page=1)
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        soup = BeautifulSoup(response.content, 'html.parser')
 
-        # 최대 페이지 확인
-        max_page = get_max_page(soup)
-        if verbose:
-            print(f"상품명: {title}")
-            print(f"총 {max_page} 페이지의 리뷰가 있습니다.")
+def iter_reviews(title, goods_no, max_reviews=10, verbose=True, stream=False):
+    """
+    예스24 상품 리뷰를 페이지 순서대로 하나씩 내보냄
+
+    첫 페이지의 리뷰 수와 최대 페이지로 max_reviews를 채우는 데 필요한
+    페이지만 계산해 한 번에 동시에 요청하고, 페이지가 파싱되는 대로
+    내보낸다 (상품 리뷰 전체를 메모리에 모으지 않음). 순회를 중간에
+    멈추면 아직 시작하지 않은 페이지 요청은 취소된다.
 
-        # 첫 페이지 리뷰 수집
-        reviews = parse_reviews_from_html(soup)
-        all_reviews.extend(reviews)
+    인자는 get_reviews와 같다. 요청이 실패하면 그때까지 내보낸 리뷰로 끝난다.
+    """
+    count = 0
+
+    def _remaining():
+        return max_reviews - count if max_reviews else None
+
+    def _enough():
+        return bool(max_reviews) and count >= max_reviews
+
+    try:
+        # 첫 페이지 요청 (최대 페이지도 함께 확인, stream 모드에서 일찍 멈추면 None)
+        reviews, max_page = _fetch_review_page(goods_no, 1, limit=_remaining(), stream=stream)
         if verbose:
+            print(f"상품명: {title}")
+            if max_page is not None:
+                print(f"총 {max_page} 페이지의 리뷰가 있습니다.")
             print(f"페이지 1: {len(reviews)}개 리뷰 수집")
 
-        # max_reviews 제한 체크
-        if max_reviews and len(all_reviews) >= max_reviews:
-            all_reviews = all_reviews[:max_reviews]
-            if verbose:
-                print(f"\n최대 {max_reviews}개 리뷰 수집 완료.")
-        else:
-            # 2페이지부터 순회
-            for page in range(2, max_page + 1):
-                time.sleep(0.5)  # 0.5초 대기 (차단 방지)
-                url = build_review_url(goods_no, page=page)
-                response = requests.get(url, headers=HEADERS, timeout=10)
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                reviews = parse_reviews_from_html(soup)
-                all_reviews.extend(reviews)
-                if verbose:
-                    print(f"페이지 {page}: {len(reviews)}개 리뷰 수집")
+        # 첫 페이지 리뷰
+        per_page = len(reviews)
+        for review in reviews[:_remaining()]:
+            count += 1
+            yield review
 
-                # max_reviews 제한 체크
-                if max_reviews and len(all_reviews) >= max_reviews:
-                    all_reviews = all_reviews[:max_reviews]
+        next_page = 2
+        # 계획한 페이지를 다 받았는데도 부족하면 (내용 없는 리뷰 제외 등) 다시 계획
+        while not _enough() and max_page is not None and next_page <= max_page:
+            pages = plan_fixed_pages(next_page, max_page, _remaining(), per_page)
+            # 한 페이지만 요청할 때는 stream 모드에서 남은 수만큼만 읽고 멈출 수 있음
+            limit = _remaining() if len(pages) == 1 else None
+            results = fetch_batch(_fetch_review_page, [(goods_no, page, limit, stream) for page in pages])
+            try:
+                for page, (reviews, _) in zip(pages, results):
+                    next_page = page + 1
                     if verbose:
-                        print(f"\n최대 {max_reviews}개 리뷰 수집 완료.")
-                    break
+                        print(f"페이지 {page}: {len(reviews)}개 리뷰 수집")
+                    for review in reviews[:_remaining()]:
+                        count += 1
+                        yield review
+                    if _enough():
+                        break
+            finally:
+                results.close()
+
+        if verbose:
+            if _enough():
+                print(f"\n최대 {max_reviews}개 리뷰 수집 완료.")
             else:
+                print(f"\n총 {count}개의 리뷰를 수집했습니다.")
+
+    except Exception as e:
+        if verbose:
+            print(f"에러 발생: {e}")
+            import traceback
+            traceback.print_exc()
+
+
+def get_new_reviews(title, goods_no, mark=None, max_reviews=10, verbose=True):
+    """
+    예스24 상품의 새 리뷰만 수집 (증분 크롤링, common.watermark)
+
+    리뷰를 최신순으로 한 페이지씩 받다가 mark(지난 실행의 수위) 이전 리뷰에
+    닿으면 멈춘다. get_reviews와 달리 페이지 요청이 실패하면 예외를 그대로
+    던진다 (일부만 받은 채로 수위를 올리면 그 사이 리뷰를 놓치므로).
+
+    title: 상품 제목
+    goods_no: 상품 번호
+    mark: 지난 실행의 수위 (None이면 처음 수집하는 상품)
+    max_reviews: 처음 수집하는 상품의 최대 리뷰 수 (None이면 전체 수집,
+                 수위가 있으면 제한 없이 새 리뷰를 모두 수집)
+    verbose: 진행 상황 출력 여부 (기본값: True)
+
+    반환값: (새 리뷰 리스트 (최신순), 갱신한 수위)
+    """
+    limit = max_reviews if mark is None else None
+    new_reviews = []
+    page = max_page = 1
+    while page <= max_page:
+        reviews, page_max = _fetch_review_page(goods_no, page, sort=REVIEW_SORT_LATEST)
+        max_page = max(max_page, page_max or 1)
+        fresh = take_new(reviews, mark)
+        new_reviews.extend(fresh)
+        # 이미 본 리뷰에 닿았거나, 빈 페이지거나, 제한을 채웠으면 멈춤
+        if len(fresh) < len(reviews) or not reviews or (limit and len(new_reviews) >= limit):
+            break
+        page += 1
+
+    if limit:
+        new_reviews = new_reviews[:limit]
+    if verbose:
+        print(f"상품명: {title}")
+        print(f"새 리뷰 {len(new_reviews)}개 ({page} 페이지 확인)")
+    return new_reviews, advance_mark(mark, new_reviews)
+
+
+### 비동기 버전 ###
+
+def _fetch_review_page(goods_no, page, limit=None, stream=False, sort=REVIEW_SORT_LATEST):
+    """리뷰 페이지 요청 및 파싱
+
+    본문 전체를 받으면 파싱 풀(common.parse_pool, 설정된 경우)에서 파싱한다.
+    stream=True면 본문을 내려받는 대로 리뷰 블록 단위로 파싱하고, limit개가
+    모이면 남은 본문을 받지 않고 연결을 닫는다.
+
+    작업 저널(common.checkpoint)로 실행 중이면 이미 받은 페이지는 다시 요청하지 않는다.
+    저널 키는 페이지(상품, 페이지 번호, 정렬)로만 만들고 (호출자의 limit은 빼서
+    동기/비동기 파이프라인이 서로의 저널을 재사용), limit에서 멈춰 일부만 읽은
+    페이지는 기록하지 않는다.
+
+    반환값: (리뷰 리스트, 최대 페이지 번호 - 페이지 번호 영역 전에 멈췄으면 None)
+    """
+    return checkpointed_page(
+        f"review:{goods_no}:{page}:{sort}",
+        lambda: _download_review_page(goods_no, page, limit, stream, sort),
+        complete=lambda result: result[1] is not None
+    )
+
+
+def _download_review_page(goods_no, page, limit, stream, sort=REVIEW_SORT_LATEST):
+    url = build_review_url(goods_no, page=page, sort=sort)
+    if not stream:
+        response = http_get(url)
+        rows, max_page = run_parse(parse_review_body, response.content)
+        return [dict(zip(REVIEW_FIELDS, row)) for row in rows], max_page
+
+    response = http_get(url, stream=True)
+    # charset이 명시되지 않으면 requests는 ISO-8859-1로 보므로 UTF-8로 읽음
+    encoding = response.encoding if 'charset' in response.headers.get('Content-Type', '').lower() else None
+
+    reviews = []
+    max_page = 1
+    try:
+        for fragment in iter_fragments(iter_body(response, STREAM_CHUNK_SIZE), REVIEW_PAGE_SCOPE, encoding):
+            soup = make_soup(fragment)
+            reviews.extend(parse_reviews_from_html(soup))
+            if soup.select_one(".yesUI_pagenS"):
+                max_page = max(max_page, get_max_page(soup))
+            if limit and len(reviews) >= limit:
+                return reviews, None
+    finally:
+        response.close()
+    return reviews, max_page
+
+
+async def aget_reviews(title, goods_no, max_reviews=10, verbose=True, concurrency=4):
+    """
+    예스24 상품 리뷰 크롤링 (asyncio 버전)
+
+    첫 페이지로 최대 페이지를 확인한 뒤 나머지 페이지를 최대 concurrency개씩
+    동시에 요청한다. 1페이지부터 이어지는 페이지들로 max_reviews가 채워지면
+    새 요청을 멈추고, 결과는 페이지 순서대로 반환한다.
+
+    title: 상품 제목
+    goods_no: 상품 번호
+    max_reviews: 최대 수집할 리뷰 수 (기본값: 10, None이면 전체 수집)
+    verbose: 진행 상황 출력 여부 (기본값: True)
+    concurrency: 동시에 요청할 최대 페이지 수 (기본값: 4)
+    """
+    pages = {}  # {페이지 번호: 리뷰 리스트}
+
+    def _enough():
+        # 1페이지부터 연속으로 받은 페이지만 센다 (순서 보장)
+        count = 0
+        page = 1
+        while page in pages:
+            count += len(pages[page])
+            page += 1
+        return bool(max_reviews) and count >= max_reviews
+
+    try:
+        # 첫 페이지 요청
+        reviews, max_page = await asyncio.to_thread(_fetch_review_page, goods_no, 1)
+        pages[1] = reviews
+        if verbose:
+            print(f"상품명: {title}")
+            print(f"총 {max_page} 페이지의 리뷰가 있습니다.")
+            print(f"페이지 1: {len(reviews)}개 리뷰 수집")
+
+        next_page = 2
+        errors = []
+
+        def _plan_last_page():
+            # 1페이지 리뷰 수를 기준으로 max_reviews를 채우는 데 필요한 페이지까지만 요청
+            remaining = None
+            if max_reviews:
+                count = sum(len(reviews) for reviews in pages.values())
+                remaining = max(max_reviews - count, 1)
+            return plan_fixed_pages(next_page, max_page, remaining, len(pages[1])).stop - 1
+
+        async def worker(last_page):
+            nonlocal next_page
+            while next_page <= last_page and not errors and not _enough():
+                page = next_page
+                next_page += 1
+                try:
+                    page_reviews, _ = await asyncio.to_thread(_fetch_review_page, goods_no, page)
+                except Exception as e:
+                    # 한 페이지라도 실패하면 새 요청을 멈춘다
+                    errors.append(e)
+                    return
+                pages[page] = page_reviews
                 if verbose:
-                    print(f"\n총 {len(all_reviews)}개의 리뷰를 수집했습니다.")
+                    print(f"페이지 {page}: {len(page_reviews)}개 리뷰 수집")
+
+        # 계획한 페이지를 다 받았는데도 부족하면 (내용 없는 리뷰 제외 등) 다시 계획
+        while next_page <= max_page and not errors and not _enough():
+            last_page = _plan_last_page()
+            workers = [worker(last_page) for _ in range(min(concurrency, last_page - next_page + 1))]
+            await asyncio.gather(*workers)
+
+        if errors:
+            raise errors[0]
 
     except Exception as e:
         if verbose:
@@ -133,4 +337,18 @@ def get_reviews(title, goods_no, max_reviews=10, verbose=True):
             import traceback
             traceback.print_exc()
 
+    # 1페이지부터 연속된 페이지만 순서대로 합친다 (실패 페이지 이후는 버림)
+    all_reviews = []
+    page = 1
+    while page in pages:
+        all_reviews.extend(pages[page])
+        page += 1
+
+    if max_reviews and len(all_reviews) >= max_reviews:
+        all_reviews = all_reviews[:max_reviews]
+        if verbose:
+            print(f"\n최대 {max_reviews}개 리뷰 수집 완료.")
+    elif verbose:
+        print(f"\n총 {len(all_reviews)}개의 리뷰를 수집했습니다.")
+
     return all_reviews
@@ -8,29 +8,105 @@ Yes24 Crawler Main Script
 3. 카테고리 신간 → 세부정보 추출
 """
 
-import time
+import asyncio
 import sys
 from datetime import datetime
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from common.file_utils import save_to_csv
+from common.file_utils import save_to_csv, CsvSink
 from .utils import build_attention_url, build_newly_published_url, get_categories
 from .get_goods_no import get_goods_no
-from .get_reviews import get_reviews
-from .get_books_info import get_book_info
-from .search_products import search_products  # 키워드 검색용 (세션 지원)
+from .get_reviews import REVIEW_FIELDS, get_reviews, aget_reviews, get_new_reviews
+from .get_books_info import DETAIL_WORKERS, iter_book_info
+from .search_products import search_products, iter_search_products  # 키워드 검색용 (세션 지원)
+from common.retry import track_fetches
+from common.http_cache import cache_stats
+from common.http_utils import http_stats
+from common.stage_pipeline import Stage, SourceProgress, run_stages
+from common.batch import SEARCH_WORKERS, run_batch
+from common.checkpoint import JobJournal
+from common.watermark import ReviewWatermarks
+
+
+# run_search_reviews에서 리뷰를 동시에 수집할 기본 상품 수
+REVIEW_WORKERS = 4
+
+# 리뷰 CSV 열 (CLI에서 CsvSink로 받는 대로 저장)
+REVIEW_COLUMNS = REVIEW_FIELDS + ('product_title', 'goods_no')
 
 
 # =============================================================================
 # 핵심 로직 함수 (UI-agnostic) - app.py와 공유
 # =============================================================================
 
-def run_search_reviews(keyword, max_products=10, max_reviews=10, order='RELATION', progress_callback=None):
+def crawl_product_reviews(title, goods_no, max_reviews=10, marks=None):
+    """
+    상품 하나의 리뷰 수집 (run_search_reviews / run_batch_search_reviews 공용)
+
+    실패해도 예외를 던지지 않고 review_count=-1로 요약한다.
+    marks(common.watermark.ReviewWatermarks)를 주면 지난 실행 이후의 새 리뷰만
+    수집한다 (수위는 올리지 않음).
+
+    Returns:
+        tuple: (리뷰 리스트, 상품 요약 dict, 진행 메시지)
+    """
+    reviews = []
+    with track_fetches() as report:
+        try:
+            if marks is None:
+                reviews = get_reviews(
+                    title=title,
+                    goods_no=goods_no,
+                    max_reviews=max_reviews,
+                    verbose=False
+                )
+                message = f"{title[:50]}... 리뷰 수집 완료"
+            else:
+                # 수위는 리뷰를 저장한 뒤 호출자가 올림 (ReviewWatermarks.advance)
+                reviews, _ = get_new_reviews(
+                    title, goods_no, marks.get('yes24', goods_no), max_reviews=max_reviews, verbose=False
+                )
+                message = f"{title[:50]}... 새 리뷰 {len(reviews)}개"
+            review_count = len(reviews)
+
+            # 상품 정보 추가
+            for review in reviews:
+                review['product_title'] = title
+                review['goods_no'] = goods_no
+        except Exception as e:
+            # 개별 상품 실패는 무시하고 계속 진행
+            review_count = -1
+            message = f"실패: {title[:30]}... - {str(e)[:50]}"
+
+    summary = {
+        'title': title,
+        'goods_no': goods_no,
+        'review_count': review_count,
+        **report.as_dict()
+    }
+    return reviews, summary, message
+
+
+def _search_reviews_params(keyword, max_products, max_reviews, order, watermark_path):
+    """run_search_reviews / arun_search_reviews 작업 저널 설정 (두 함수가 서로의 저널로 재개 가능)"""
+    return {
+        'pipeline': 'yes24.search_reviews', 'keyword': keyword, 'max_products': max_products,
+        'max_reviews': max_reviews, 'order': order, 'watermark_path': watermark_path,
+    }
+
+
+def run_search_reviews(keyword, max_products=10, max_reviews=10, order='RELATION', progress_callback=None,
+                       workers=REVIEW_WORKERS, job_path=None, watermark_path=None, sink=None):
     """
     키워드 검색 → 리뷰 크롤링 (핵심 로직)
 
+    검색 페이지를 넘기는 동안 이미 찾은 상품의 리뷰 수집을 시작한다
+    (common.stage_pipeline: 검색 → 리뷰 → 결과 취합).
+    진행상황 콜백은 상품이 끝날 때마다 호출 스레드에서 호출된다.
+    결과를 리스트로 모으지 않고 하나씩 받으려면 iter_search_reviews를 쓴다.
+
     Args:
         keyword: 검색 키워드
         max_products: 최대 상품 수
@@ -38,60 +114,320 @@ def run_search_reviews(keyword, max_products=10, max_reviews=10, order='RELATION
         order: 정렬 방식
         progress_callback: 진행상황 콜백 함수 (optional)
                          callback(current, total, message) 형식
+        workers: 리뷰를 동시에 수집할 최대 상품 수
+        job_path: 작업 저널 경로 (optional, common.checkpoint)
+                  같은 경로로 다시 실행하면 끝난 상품/페이지는 다시 받지 않고 이어서 진행
+        watermark_path: 상품별 수위 파일 경로 (optional, common.watermark)
+                        주면 지난 실행 이후의 새 리뷰만 최신순으로 수집 (증분 크롤링)
+        sink: 리뷰를 받는 대로 기록할 common.file_utils.CsvSink (optional)
+              주면 리뷰를 data에 모으지 않고 sink에만 기록 (data는 빈 리스트)
+              watermark_path와 함께 주면 상품마다 sink를 flush한 뒤 수위를 기록
+              job_path와 함께 주면 (resume=True로 같은 파일을 열어) 중단된 뒤 이어서
+              실행할 때 저널에 확정된 행만 남기고 나머지 상품부터 이어 씀
 
     Returns:
         dict: {
             'status': 'success' | 'error',
             'message': str,
-            'data': list,  # 리뷰 리스트
-            'count': int
+            'data': list,  # 리뷰 리스트 (증분 크롤링이면 새 리뷰만)
+            'count': int,
+            'summary': list,  # 상품별 요약 (review_count, outcome, retries, requests, bytes)
+            'http': dict,  # 이번 실행의 요청 수/받은 본문 크기 (requests, bytes, ...)
+            'resumed': int,  # 작업 저널에서 복원한 상품 수
+            'watermarks': ReviewWatermarks | None  # sink 없이 실행하면 기록 전 수위:
+                                                   # data를 저장한 뒤 commit() 호출
+        }
+    """
+    http_before = http_stats.snapshot()
+    journal = None
+
+    try:
+        journal = JobJournal(job_path, params=_search_reviews_params(
+            keyword, max_products, max_reviews, order, watermark_path
+        ))
+        resumed = journal.resumed
+        marks = ReviewWatermarks(watermark_path) if watermark_path else None
+        # 이어 쓰는 sink: 저널에 확정된 행만 남기고, 그 상품은 다시 쓰지 않음
+        written = journal.resume_output(sink) if sink is not None else {}
+
+        results_summary = []
+        reviews = iter_search_reviews(
+            keyword, max_products=max_products, max_reviews=max_reviews, order=order,
+            progress_callback=progress_callback, workers=workers,
+            journal=journal, marks=marks, summary=results_summary,
+            flush=sink.flush if sink is not None else None, written=written
+        )
+        if sink is None:
+            all_reviews = list(reviews)
+            count = len(all_reviews)
+        else:
+            all_reviews = []
+            count = 0
+            for review in reviews:
+                sink.write(review)
+                count += 1
+
+        if not results_summary:
+            return {
+                'status': 'error',
+                'message': '검색 결과가 없습니다.',
+                'data': [],
+                'count': 0,
+                'summary': []
+            }
+
+        return {
+            'status': 'success',
+            'message': f'{count}개의 리뷰를 수집했습니다.',
+            'data': all_reviews,
+            'count': count,
+            'summary': results_summary,
+            'http': http_stats.since(http_before),
+            'resumed': resumed,
+            'watermarks': marks
+        }
+
+    except Exception as e:
+        return {
+            'status': 'error',
+            'message': f'오류 발생: {str(e)}',
+            'data': [],
+            'count': 0,
+            'summary': []
+        }
+    finally:
+        if journal:
+            journal.close()
+
+
+def iter_search_reviews(keyword, max_products=10, max_reviews=10, order='RELATION', progress_callback=None,
+                        workers=REVIEW_WORKERS, journal=None, marks=None, summary=None, flush=None,
+                        written=()):
+    """
+    키워드 검색 → 리뷰 크롤링 결과를 상품 순서대로 리뷰 하나씩 내보냄
+
+    run_search_reviews와 같은 방식으로 수집하지만 결과를 모으지 않는다.
+    메모리에는 동시에 처리 중인 상품(workers개 + 큐)의 리뷰만 있으므로
+    크롤링 규모가 커져도 메모리 사용량은 일정하다.
+
+    Args:
+        keyword, max_products, max_reviews, order, progress_callback, workers: run_search_reviews와 같음
+        journal: 작업 저널 (optional, common.checkpoint.JobJournal)
+        marks: 상품별 수위 (optional, common.watermark.ReviewWatermarks, 주면 새 리뷰만)
+               상품의 리뷰를 모두 내보낸 뒤 그 리뷰로 수위를 올린다 (marks.advance)
+        summary: 상품별 요약을 추가할 리스트 (optional)
+        flush: 상품의 리뷰를 모두 내보낸 뒤 호출해 저장을 확정하는 함수 (optional, 예: CsvSink.flush)
+               파일의 행 수를 돌려줘야 한다. 주면 그 뒤 수위를 바로 기록하고, 저널에
+               출력 행 수를 기록한다 (journal.record_written). 없으면 수위는 보류되어
+               호출자가 리뷰를 저장한 뒤 marks.commit()을 호출해야 한다
+        written: 이미 출력에 확정된 상품번호 (다시 내보내지 않음, journal.written)
+
+    Yields:
+        dict: 리뷰 레코드 (product_title, goods_no 열 포함)
+    """
+    journal = journal or JobJournal(None)
+    products = journal.iter_search(
+        lambda: iter_search_products(keyword, size=40, order=order, max_products=max_products)
+    )
+
+    def crawl(product):
+        title, goods_no = product
+        # 실패한 상품은 기록하지 않아 다음 실행에서 다시 시도
+        return journal.run(goods_no, crawl_product_reviews, title, goods_no, max_reviews, marks,
+                           succeeded=lambda result: result[1]['review_count'] != -1)
+
+    stages = [Stage('reviews', crawl, workers=workers)]
+    # 진행 표시의 전체 수: 검색이 끝나면 실제로 찾은 상품 수
+    progress = SourceProgress(products, max_products)
+    confirmed = True
+    for idx, (reviews, product_summary, message) in enumerate(run_stages(progress, stages), 1):
+        if summary is not None:
+            summary.append(product_summary)
+        progress.report(progress_callback, idx, message)
+        goods_no = product_summary['goods_no']
+        if goods_no in written:
+            continue
+        yield from reviews
+        if marks is not None and product_summary['review_count'] != -1:
+            marks.advance('yes24', goods_no, reviews)
+        if flush is not None:
+            rows = flush()
+            if marks is not None:
+                marks.commit()
+            # 앞의 상품이 모두 저널에 끝난 상품일 때만 출력 행 수를 확정
+            # (다음 실행에서 다시 받을 상품의 행이 확정된 범위에 섞이지 않도록)
+            confirmed = confirmed and journal.done(goods_no)
+            if confirmed:
+                journal.record_written(goods_no, rows)
+    progress.finish(progress_callback)
+
+
+def _advance_marks(marks, store, result):
+    """일괄 크롤링 결과의 상품별 새 리뷰로 수위를 올림 (기록은 호출자가 결과를 저장한 뒤)"""
+    reviews_by_goods = {}
+    for review in result['data']:
+        reviews_by_goods.setdefault(review['goods_no'], []).append(review)
+    for summary in result['summary']:
+        if summary['review_count'] != -1:
+            marks.advance(store, summary['goods_no'], reviews_by_goods.get(summary['goods_no'], []))
+
+
+def run_batch_search_reviews(keywords, max_products=10, max_reviews=10, order='RELATION', progress_callback=None,
+                             search_workers=SEARCH_WORKERS, workers=REVIEW_WORKERS, job_path=None,
+                             watermark_path=None):
+    """
+    여러 키워드 검색 → 리뷰 크롤링 (common.batch)
+
+    키워드 검색을 동시에 실행하고, 여러 키워드에 나온 상품도 리뷰는 한 번만
+    수집한 뒤 일치한 키워드를 모두 붙인다.
+
+    Args:
+        keywords: 검색 키워드 리스트
+        max_products: 키워드당 최대 상품 수
+        max_reviews: 상품당 최대 리뷰 수
+        order: 정렬 방식
+        progress_callback: 진행상황 콜백 함수 (optional)
+        search_workers: 동시에 실행할 최대 검색 수
+        workers: 리뷰를 동시에 수집할 최대 상품 수
+        job_path: 작업 저널 경로 (optional, common.checkpoint)
+        watermark_path: 상품별 수위 파일 경로 (optional, 주면 새 리뷰만 수집)
+
+    Returns:
+        dict: common.batch.run_batch 반환값
+              (run_search_reviews 결과 + 'keyword_map', 'searches', 리뷰/요약의 'keywords' 열)
+              watermark_path를 주면 'watermarks': 기록 전 수위 (data를 저장한 뒤 commit() 호출)
+    """
+    marks = ReviewWatermarks(watermark_path) if watermark_path else None
+    result = run_batch(
+        keywords,
+        search=lambda keyword: search_products(keyword, size=40, order=order, max_products=max_products),
+        crawl=lambda title, goods_no: crawl_product_reviews(title, goods_no, max_reviews, marks),
+        search_workers=search_workers,
+        crawl_workers=workers,
+        progress_callback=progress_callback,
+        job_path=job_path,
+        job_params={
+            'pipeline': 'yes24.batch_search_reviews', 'max_products': max_products,
+            'max_reviews': max_reviews, 'order': order, 'watermark_path': watermark_path,
         }
+    )
+    if marks is not None and result['status'] == 'success':
+        _advance_marks(marks, 'yes24', result)
+        result['watermarks'] = marks
+    return result
+
+
+async def arun_search_reviews(keyword, max_products=10, max_reviews=10, order='RELATION', progress_callback=None,
+                              page_concurrency=4, product_concurrency=2, job_path=None):
     """
+    키워드 검색 → 리뷰 크롤링 (asyncio 버전)
+
+    run_search_reviews와 같은 결과를 반환하지만, 상품 여러 개와 각 상품의
+    리뷰 페이지들을 동시에 요청한다. 진행상황 콜백은 상품이 끝날 때마다 호출된다.
+
+    Args:
+        keyword: 검색 키워드
+        max_products: 최대 상품 수
+        max_reviews: 상품당 최대 리뷰 수
+        order: 정렬 방식
+        progress_callback: 진행상황 콜백 함수 (optional)
+                         callback(current, total, message) 형식
+        page_concurrency: 상품당 동시에 요청할 최대 페이지 수
+        product_concurrency: 동시에 처리할 최대 상품 수
+        job_path: 작업 저널 경로 (optional, run_search_reviews와 같은 저널 형식)
+
+    Returns:
+        dict: run_search_reviews와 동일
+    """
+    http_before = http_stats.snapshot()
+    journal = None
     try:
+        journal = JobJournal(job_path, params=_search_reviews_params(
+            keyword, max_products, max_reviews, order, watermark_path=None
+        ))
+        resumed = journal.resumed
+
         # 상품 검색
-        goods_dict = search_products(keyword, size=40, order=order, max_products=max_products)
+        goods_dict = await asyncio.to_thread(lambda: dict(journal.iter_search(
+            lambda: iter_search_products(keyword, size=40, order=order, max_products=max_products)
+        )))
 
         if not goods_dict:
             return {
                 'status': 'error',
                 'message': '검색 결과가 없습니다.',
                 'data': [],
-                'count': 0
+                'count': 0,
+                'summary': []
             }
 
-        # 각 상품의 리뷰 수집
-        all_reviews = []
         total_items = len(goods_dict)
-
-        for idx, (title, goods_no) in enumerate(goods_dict.items(), 1):
-            if progress_callback:
-                progress_callback(idx, total_items, f"{title[:50]}... 리뷰 수집 중")
-
-            try:
-                reviews = get_reviews(
-                    title=title,
-                    goods_no=goods_no,
-                    max_reviews=max_reviews,
-                    verbose=False
-                )
-
-                # 상품 정보 추가
-                for review in reviews:
-                    review['product_title'] = title
-                    review['goods_no'] = goods_no
-                    all_reviews.append(review)
-            except Exception as e:
-                # 개별 상품 실패는 무시하고 계속 진행
+        semaphore = asyncio.Semaphore(product_concurrency)
+        done = 0
+
+        async def crawl_product(title, goods_no):
+            nonlocal done
+            if journal.done(goods_no):
+                # 저널에 있는 끝난 상품은 요청 없이 그대로 사용
+                reviews, summary, _ = journal.result(goods_no)
+                done += 1
                 if progress_callback:
-                    progress_callback(idx, total_items, f"실패: {title[:30]}... - {str(e)[:50]}")
-
-            time.sleep(0.3)  # 차단 방지
+                    progress_callback(done, total_items, f"{title[:50]}... 리뷰 수집 완료 (저널)")
+                return reviews, summary
+
+            async with semaphore:
+                reviews = []
+                # 태스크마다 컨텍스트가 복사되므로 상품별로 따로 집계된다
+                # (페이지 체크포인트도 상품 범위 안에서만 기록)
+                with track_fetches() as report, journal.product(goods_no) as scope:
+                    try:
+                        reviews = await aget_reviews(
+                            title=title,
+                            goods_no=goods_no,
+                            max_reviews=max_reviews,
+                            verbose=False,
+                            concurrency=page_concurrency
+                        )
+                        review_count = len(reviews)
+                        message = f"{title[:50]}... 리뷰 수집 완료"
+
+                        # 상품 정보 추가
+                        for review in reviews:
+                            review['product_title'] = title
+                            review['goods_no'] = goods_no
+                    except Exception as e:
+                        # 개별 상품 실패는 무시하고 계속 진행
+                        review_count = -1
+                        message = f"실패: {title[:30]}... - {str(e)[:50]}"
+
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total_items, message)
+                summary = {
+                    'title': title,
+                    'goods_no': goods_no,
+                    'review_count': review_count,
+                    **report.as_dict()
+                }
+                if review_count != -1 and not scope.failed:
+                    # run_search_reviews의 journal.run과 같은 (리뷰, 요약, 메시지) 형식
+                    journal.record(goods_no, [reviews, summary, message])
+                return reviews, summary
+
+        # gather는 입력 순서대로 결과를 돌려주므로 상품 순서가 유지된다
+        results = await asyncio.gather(
+            *(crawl_product(title, goods_no) for title, goods_no in goods_dict.items())
+        )
+        all_reviews = [review for reviews, _ in results for review in reviews]
 
         return {
             'status': 'success',
             'message': f'{len(all_reviews)}개의 리뷰를 수집했습니다.',
             'data': all_reviews,
-            'count': len(all_reviews)
+            'count': len(all_reviews),
+            'summary': [summary for _, summary in results],
+            'http': http_stats.since(http_before),
+            'resumed': resumed
         }
 
     except Exception as e:
@@ -99,11 +435,16 @@ def run_search_reviews(keyword, max_products=10, max_reviews=10, order='RELATION
             'status': 'error',
             'message': f'오류 발생: {str(e)}',
             'data': [],
-            'count': 0
+            'count': 0,
+            'summary': []
         }
+    finally:
+        if journal:
+            journal.close()
 
 
-def run_search_bookinfo(keyword, max_products=10, order='RELATION', progress_callback=None):
+def run_search_bookinfo(keyword, max_products=10, order='RELATION', progress_callback=None,
+                        workers=DETAIL_WORKERS, job_path=None):
     """
     키워드 검색 → 세부정보 크롤링 (핵심 로직)
 
@@ -112,49 +453,60 @@ def run_search_bookinfo(keyword, max_products=10, order='RELATION', progress_cal
         max_products: 최대 상품 수
         order: 정렬 방식
         progress_callback: 진행상황 콜백 함수 (optional)
+        workers: 세부정보를 동시에 요청할 최대 상품 수
+        job_path: 작업 저널 경로 (optional, common.checkpoint)
 
     Returns:
         dict: {
             'status': 'success' | 'error',
             'message': str,
             'data': list,  # 도서 정보 리스트
-            'count': int
+            'count': int,
+            'summary': list,  # 상품별 요약 (outcome, retries)
+            'cache': dict,  # 캐시 적중/미스 수 (hits, revalidated, misses, ...)
+            'resumed': int  # 작업 저널에서 복원한 상품 수
         }
     """
+    cache_before = cache_stats.snapshot()
+    journal = None
     try:
+        journal = JobJournal(job_path, params={
+            'pipeline': 'yes24.search_bookinfo', 'keyword': keyword, 'max_products': max_products, 'order': order,
+        })
+        resumed = journal.resumed
+
         # 상품 검색
-        goods_dict = search_products(keyword, size=40, order=order, max_products=max_products)
+        goods_dict = dict(journal.iter_search(
+            lambda: iter_search_products(keyword, size=40, order=order, max_products=max_products)
+        ))
 
         if not goods_dict:
             return {
                 'status': 'error',
                 'message': '검색 결과가 없습니다.',
                 'data': [],
-                'count': 0
+                'count': 0,
+                'summary': []
             }
 
-        # 각 상품의 세부정보 추출
+        # 각 상품의 세부정보 추출 (동시 요청, 결과는 상품 순서대로)
         all_books_info = []
-        total_items = len(goods_dict)
+        results_summary = []
 
-        for idx, (title, goods_no) in enumerate(goods_dict.items(), 1):
-            if progress_callback:
-                progress_callback(idx, total_items, f"{title[:50]}... 세부정보 추출 중")
-
-            try:
-                info = get_book_info(goods_no)
-                all_books_info.append(info)
-            except Exception as e:
-                if progress_callback:
-                    progress_callback(idx, total_items, f"실패: {title[:30]}... - {str(e)[:50]}")
-
-            time.sleep(0.3)  # 차단 방지
+        for result in iter_book_info(goods_dict, workers=workers, progress_callback=progress_callback,
+                                     journal=journal):
+            if result['info'] is not None:
+                all_books_info.append(result['info'])
+            results_summary.append({'title': result['title'], 'goods_no': result['goods_no'], **result['report']})
 
         return {
             'status': 'success',
             'message': f'{len(all_books_info)}개의 도서 정보를 추출했습니다.',
             'data': all_books_info,
-            'count': len(all_books_info)
+            'count': len(all_books_info),
+            'summary': results_summary,
+            'cache': cache_stats.since(cache_before),
+            'resumed': resumed
         }
 
     except Exception as e:
@@ -162,11 +514,16 @@ def run_search_bookinfo(keyword, max_products=10, order='RELATION', progress_cal
             'status': 'error',
             'message': f'오류 발생: {str(e)}',
             'data': [],
-            'count': 0
+            'count': 0,
+            'summary': []
         }
+    finally:
+        if journal:
+            journal.close()
 
 
-def run_category_bookinfo(category_id, category_name, max_products=10, progress_callback=None):
+def run_category_bookinfo(category_id, category_name, max_products=10, progress_callback=None,
+                          workers=DETAIL_WORKERS, job_path=None):
     """
     카테고리 신간 → 세부정보 추출 (핵심 로직)
 
@@ -175,52 +532,62 @@ def run_category_bookinfo(category_id, category_name, max_products=10, progress_
         category_name: 카테고리 이름
         max_products: 최대 상품 수
         progress_callback: 진행상황 콜백 함수 (optional)
+        workers: 세부정보를 동시에 요청할 최대 상품 수
+        job_path: 작업 저널 경로 (optional, common.checkpoint)
 
     Returns:
         dict: {
             'status': 'success' | 'error',
             'message': str,
             'data': list,  # 도서 정보 리스트
-            'count': int
+            'count': int,
+            'summary': list,  # 상품별 요약 (outcome, retries)
+            'cache': dict,  # 캐시 적중/미스 수 (hits, revalidated, misses, ...)
+            'resumed': int  # 작업 저널에서 복원한 상품 수
         }
     """
+    cache_before = cache_stats.snapshot()
+    journal = None
     try:
+        journal = JobJournal(job_path, params={
+            'pipeline': 'yes24.category_bookinfo', 'category_id': category_id, 'max_products': max_products,
+        })
+        resumed = journal.resumed
+
         # 신간도서 가져오기
         url = build_newly_published_url(category_id)
-        goods_dict = get_goods_no(url, max_products=max_products)
+        goods_dict = dict(journal.iter_search(lambda: get_goods_no(url, max_products=max_products).items()))
 
         if not goods_dict:
             return {
                 'status': 'error',
                 'message': '신간도서를 찾을 수 없습니다.',
                 'data': [],
-                'count': 0
+                'count': 0,
+                'summary': []
             }
 
-        # 각 도서의 세부정보 추출
+        # 각 도서의 세부정보 추출 (동시 요청, 결과는 상품 순서대로)
         all_books_info = []
-        total_items = len(goods_dict)
-
-        for idx, (title, goods_no) in enumerate(goods_dict.items(), 1):
-            if progress_callback:
-                progress_callback(idx, total_items, f"{title[:50]}... 세부정보 추출 중")
+        results_summary = []
 
-            try:
-                info = get_book_info(goods_no)
+        for result in iter_book_info(goods_dict, workers=workers, progress_callback=progress_callback,
+                                     journal=journal):
+            info = result['info']
+            if info is not None:
                 info['category_id'] = category_id
                 info['category_name'] = category_name
                 all_books_info.append(info)
-            except Exception as e:
-                if progress_callback:
-                    progress_callback(idx, total_items, f"실패: {title[:30]}... - {str(e)[:50]}")
-
-            time.sleep(0.3)  # 차단 방지
+            results_summary.append({'title': result['title'], 'goods_no': result['goods_no'], **result['report']})
 
         return {
             'status': 'success',
             'message': f'{len(all_books_info)}개의 도서 정보를 추출했습니다.',
             'data': all_books_info,
-            'count': len(all_books_info)
+            'count': len(all_books_info),
+            'summary': results_summary,
+            'cache': cache_stats.since(cache_before),
+            'resumed': resumed
         }
 
     except Exception as e:
@@ -228,8 +595,12 @@ def run_category_bookinfo(category_id, category_name, max_products=10, progress_
             'status': 'error',
             'message': f'오류 발생: {str(e)}',
             'data': [],
-            'count': 0
+            'count': 0,
+            'summary': []
         }
+    finally:
+        if journal:
+            journal.close()
 
 
 # =============================================================================
@@ -261,33 +632,38 @@ def pipeline_search_reviews():
     except ValueError:
         max_reviews = 10
 
+    # 작업 저널 (같은 경로로 다시 실행하면 같은 CSV에 이어서 기록)
+    job_path = input("작업 저널 경로 (선택, 엔터=사용 안 함): ").strip() or None
+
     print(f"\n🔍 '{keyword}' 검색 중...")
 
     # 진행상황 콜백
     def progress_callback(current, total, message):
         print(f"[{current}/{total}] {message}")
 
-    # 핵심 로직 실행
-    result = run_search_reviews(
-        keyword=keyword,
-        max_products=max_products,
-        max_reviews=max_reviews,
-        order='RELATION',
-        progress_callback=progress_callback
-    )
+    # 핵심 로직 실행 (리뷰는 받는 대로 CSV에 기록)
+    # 저널을 쓰면 파일 이름을 저널 이름으로 고정해 다시 실행할 때 이어 씀
+    suffix = Path(job_path).stem if job_path else datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"search_reviews_{keyword}_{suffix}.csv"
+    with CsvSink(filename, REVIEW_COLUMNS, resume=bool(job_path)) as sink:
+        result = run_search_reviews(
+            keyword=keyword,
+            max_products=max_products,
+            max_reviews=max_reviews,
+            order='RELATION',
+            progress_callback=progress_callback,
+            job_path=job_path,
+            sink=sink
+        )
 
     if result['status'] == 'error':
         print(f"❌ {result['message']}")
         return result
 
     print(f"\n📊 {result['message']}")
+    print(f"   요청 {result['http']['requests']}회, 받은 본문 {result['http']['bytes'] / 1024:.0f}KB")
 
-    # CSV 저장
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"search_reviews_{keyword}_{timestamp}.csv"
-    save_result = save_to_csv(result['data'], filename)
-
-    return save_result
+    return sink.close()
 
 
 def pipeline_search_bookinfo():
@@ -2,10 +2,14 @@
 예스24 키워드 검색 상품 목록 추출
 """
 
-import requests
-from bs4 import BeautifulSoup
+import threading
 import time
-from .utils import build_search_url
+from http.cookiejar import LoadError, LWPCookieJar
+from pathlib import Path
+
+from .utils import build_search_url, http_get, new_session
+from .get_goods_no import parse_listing
+from common.archive import get_archive
 
 
 # 정렬 옵션
@@ -19,35 +23,113 @@ ORDER_OPTIONS = {
 }
 
 
-def _get_session():
-    """세션 생성 및 초기화"""
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-    })
-    # 쿠키 획득을 위해 메인 페이지 먼저 방문
-    session.get('https://www.yes24.com', timeout=10)
-    return session
+# 쿠키 유지 설정
+WARMUP_URL = 'https://www.yes24.com'
+COOKIE_FILE = "./.cache/yes24_cookies.txt"
+COOKIE_MAX_AGE = 6 * 3600  # 만료일 없는 세션 쿠키를 재사용할 최대 시간 (초, 메인 페이지 방문 기준)
+WARMUP_SUFFIX = ".warmup"  # 쿠키 파일 옆에 메인 페이지 방문 시각을 기록하는 파일
 
+# 거절된 쿠키로 보는 응답 상태
+REJECTED_STATUS = {401, 403}
 
-def _parse_products_from_soup(soup):
-    """HTML에서 상품 목록 추출"""
-    goods_dict = {}
-    
-    # data-goods-no 속성을 가진 모든 li 요소 찾기
-    li_list = soup.find_all('li', attrs={'data-goods-no': True})
-    
-    for li in li_list:
-        title_tag = li.find('a', class_='gd_name')
-        title = title_tag.get_text(strip=True) if title_tag else ""
-        goods_no = li.get("data-goods-no")
-        
-        if title and goods_no:
-            goods_dict[title] = goods_no
-    
-    return goods_dict
+_session = None
+_session_lock = threading.RLock()
+_warmed_at = None    # 지금 쿠키를 받은 메인 페이지 방문 시각
+_saved_state = None  # 마지막으로 파일에 저장한 쿠키 (_cookie_state)
+
+
+def _cookie_state(jar):
+    """쿠키 내용 비교용 값 (바뀌었을 때만 파일에 다시 씀)"""
+    return sorted((c.domain, c.path, c.name, c.value, c.expires) for c in jar)
+
+
+def _warmup_path(jar):
+    return Path(jar.filename + WARMUP_SUFFIX)
+
+
+def _expired():
+    return _warmed_at is None or time.time() - _warmed_at > COOKIE_MAX_AGE
+
+
+def _load_cookies(jar):
+    """
+    저장된 쿠키 로드, 쓸 수 있는 쿠키가 있으면 True
+
+    쿠키 파일은 검색할 때마다 다시 쓰일 수 있으므로, 나이는 파일 수정 시각이
+    아니라 따로 기록한 메인 페이지 방문 시각으로 판단한다.
+    """
+    global _warmed_at, _saved_state
+    try:
+        _warmed_at = float(_warmup_path(jar).read_text(encoding='utf-8'))
+        if _expired():
+            return False
+        jar.load(ignore_discard=True)
+    except (OSError, ValueError, LoadError):
+        return False
+    _saved_state = _cookie_state(jar)
+    jar.clear_expired_cookies()
+    return len(jar) > 0
+
+
+def _warm_up(session):
+    """쿠키 획득을 위해 메인 페이지 방문 후 쿠키와 방문 시각 저장"""
+    global _warmed_at
+    session.cookies.clear()
+    http_get(WARMUP_URL, session=session)
+    _warmed_at = time.time()
+    _save_cookies(session)
+    if get_archive()[1] != 'replay':
+        _warmup_path(session.cookies).write_text(repr(_warmed_at), encoding='utf-8')
+
+
+def _save_cookies(session):
+    """쿠키가 마지막으로 저장한 뒤 바뀌었으면 파일에 저장"""
+    global _saved_state
+    if get_archive()[1] == 'replay':
+        return
+    with _session_lock:
+        state = _cookie_state(session.cookies)
+        if state == _saved_state:
+            return
+        Path(session.cookies.filename).parent.mkdir(parents=True, exist_ok=True)
+        session.cookies.save(ignore_discard=True)
+        _saved_state = state
+
+
+def _get_session(force_warmup=False):
+    """
+    쿠키가 준비된 공유 세션 반환
+
+    세션과 쿠키는 호출 간(프로세스 안) 재사용하고, 쿠키는 COOKIE_FILE에
+    저장해 다음 프로세스에서도 쓴다. 쿠키가 없거나 만료됐거나, 마지막 메인
+    페이지 방문 후 COOKIE_MAX_AGE가 지났거나, force_warmup=True(거절됨)일 때만
+    메인 페이지를 다시 방문한다.
+
+    아카이브 replay 중에는 요청이 네트워크로 나가지 않으므로 쿠키를
+    읽거나 메인 페이지를 방문하지 않는다 (메인 페이지는 보통 아카이브에 없음).
+    """
+    global _session
+    if get_archive()[1] == 'replay':
+        return _session or new_session()
+
+    with _session_lock:
+        if _session is None:
+            session = new_session({
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+            })
+            session.cookies = LWPCookieJar(COOKIE_FILE)
+            if not _load_cookies(session.cookies):
+                force_warmup = True
+            _session = session
+        else:
+            _session.cookies.clear_expired_cookies()
+            if len(_session.cookies) == 0 or _expired():
+                force_warmup = True
+
+        if force_warmup:
+            _warm_up(_session)
+        return _session
 
 
 def search_products(query, size=24, order='RELATION', max_products=None):
@@ -61,37 +143,54 @@ def search_products(query, size=24, order='RELATION', max_products=None):
     
     반환값: {제목: 상품번호} 딕셔너리
     """
+    return dict(iter_search_products(query, size=size, order=order, max_products=max_products))
+
+
+def iter_search_products(query, size=24, order='RELATION', max_products=None):
+    """
+    예스24 키워드 검색 결과를 페이지를 넘기면서 하나씩 내보냄
+
+    인자는 search_products와 같다. 검색 페이지를 하나 받을 때마다 그 페이지의
+    상품을 바로 내보내므로, 호출자는 검색이 끝나기 전에 다음 작업을 시작할 수 있다.
+    같은 제목은 처음 나온 상품만 내보낸다.
+
+    Yields:
+        (제목, 상품번호)
+    """
     session = _get_session()
-    all_goods = {}
+    seen = set()
     page = 1
     
     while True:
         url = build_search_url(query, page=page, size=size, order=order)
-        response = session.get(url, timeout=10)
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        goods_dict = _parse_products_from_soup(soup)
+        response = http_get(url, session=session)
+        if response.status_code in REJECTED_STATUS:
+            # 쿠키가 거절됨: 다시 발급받고 한 번만 재요청
+            session = _get_session(force_warmup=True)
+            response = http_get(url, session=session)
+        goods_dict, has_next = parse_listing(response.content)
         
         if not goods_dict:
             break
         
-        # 결과 병합
         for title, goods_no in goods_dict.items():
-            all_goods[title] = goods_no
+            if title in seen:
+                continue
+            seen.add(title)
+            yield title, goods_no
             
             # max_products 제한 체크
-            if max_products and len(all_goods) >= max_products:
-                return dict(list(all_goods.items())[:max_products])
+            if max_products and len(seen) >= max_products:
+                _save_cookies(session)
+                return
         
         # 다음 페이지 확인
-        next_btn = soup.select_one(".yesUI_pagen .next:not(.dim)")
-        if not next_btn:
+        if not has_next:
             break
 
         page += 1
-        time.sleep(0.5)  # 0.5초 대기 (차단 방지)
     
-    return all_goods
+    _save_cookies(session)
 
 
 if __name__ == "__main__":
@@ -4,7 +4,14 @@ import json
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
-from common.http_utils import HEADERS
+from common.http_utils import HEADERS, http_get, new_session
+from common.html_parser import ParseScope, make_soup
+
+# 상품 목록 페이지에서 파싱할 범위 (상품 li, 페이지 이동 버튼)
+LISTING_SCOPE = ParseScope(classes=('yesUI_pagen',), attrs=('data-goods-no',))
+
+# 리뷰 정렬 (리뷰 URL의 Sort 값)
+REVIEW_SORT_LATEST = 1  # 최신순
 
 ### URL Builders ###
 
@@ -20,7 +27,7 @@ def build_newly_published_url(category_number, page=1):
     """신간도서 URL 생성"""
     return f"https://www.yes24.com/product/category/newproduct?categoryNumber={category_number}&pageNumber={page}"
 
-def build_review_url(goods_no, page=1, sort=1):
+def build_review_url(goods_no, page=1, sort=REVIEW_SORT_LATEST):
     """리뷰 URL 생성"""
     return f"https://www.yes24.com/Product/communityModules/GoodsReviewList/{goods_no}?goodsSetYn=N&Sort={sort}&PageNumber={page}&Type=ALL"
 